@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from threading import Lock
 from typing import Iterable, Optional
 
 
@@ -29,12 +30,77 @@ class SourceRef:
     details: frozenset = field(default_factory=frozenset)
 
 
+_INTERN_LOCK = Lock()
+_SOURCE_BITS: dict[SourceRef, int] = {}
+_MASK_SETS: dict[int, frozenset[SourceRef]] = {0: frozenset()}
+_SET_MASKS: dict[frozenset[SourceRef], int] = {frozenset(): 0}
+
+
+def register_sources(sources: Iterable[SourceRef]) -> None:
+    """Assigns bits to sources up front so masks are stable across runs"""
+    with _INTERN_LOCK:
+        for source in sources:
+            _SOURCE_BITS.setdefault(source, 1 << len(_SOURCE_BITS))
+
+
+def mask_of(sources: Iterable[SourceRef]) -> int:
+    """Bitmask for a set of sources, interning the set on first sight"""
+    if not isinstance(sources, frozenset):
+        sources = frozenset(sources)
+    mask = _SET_MASKS.get(sources)
+    if mask is not None:
+        return mask
+    with _INTERN_LOCK:
+        mask = 0
+        for source in sources:
+            bit = _SOURCE_BITS.get(source)
+            if bit is None:
+                bit = _SOURCE_BITS[source] = 1 << len(_SOURCE_BITS)
+            mask |= bit
+        canonical = _MASK_SETS.setdefault(mask, sources)
+        _SET_MASKS[canonical] = mask
+    return mask
+
+
+def sources_for_mask(mask: int) -> frozenset[SourceRef]:
+    """The shared frozenset for a bitmask, materialized on first use"""
+    sources = _MASK_SETS.get(mask)
+    if sources is not None:
+        return sources
+    with _INTERN_LOCK:
+        sources = _MASK_SETS.setdefault(
+            mask, frozenset(s for s, bit in _SOURCE_BITS.items() if mask & bit)
+        )
+        _SET_MASKS.setdefault(sources, mask)
+    return sources
+
+
 @dataclass(frozen=True)
 class AmountWithProvenance:
-    """Cited amount"""
+    """Cited amount.
+
+    `sources` is interned, so equal source sets share one frozenset, and
+    `mask` is its bitmask; combining amounts ORs masks instead of building
+    frozenset unions.
+    """
 
     value: int
     sources: frozenset[SourceRef] = field(default_factory=frozenset)
+    mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = mask_of(self.sources)
+        object.__setattr__(self, "sources", _MASK_SETS[mask])
+        object.__setattr__(self, "mask", mask)
+
+    def __reduce__(self) -> tuple:
+        # Masks are per-process; rebuild them from the sources on unpickle
+        return (AmountWithProvenance, (self.value, self.sources))
+
+
+def ap_with_mask(value: int, mask: int) -> AmountWithProvenance:
+    """Amount citing the sources in a bitmask"""
+    return AmountWithProvenance(value=value, sources=sources_for_mask(mask))
 
 
 def ap_zero() -> AmountWithProvenance:
@@ -49,15 +115,16 @@ def ap_from(value: int, *sources: SourceRef) -> AmountWithProvenance:
 
 def ap_add(a: AmountWithProvenance, b: AmountWithProvenance) -> AmountWithProvenance:
     """Adds two provenance artifacts"""
-    return AmountWithProvenance(value=a.value + b.value, sources=a.sources | b.sources)
+    return ap_with_mask(a.value + b.value, a.mask | b.mask)
 
 
 def ap_sum(amounts: Iterable[AmountWithProvenance]) -> AmountWithProvenance:
     """Combines provenance artifacts"""
-    total = ap_zero()
+    value = mask = 0
     for a in amounts:
-        total = ap_add(total, a)
-    return total
+        value += a.value
+        mask |= a.mask
+    return ap_with_mask(value, mask)
 
 
 def ap_scale(
@@ -65,13 +132,9 @@ def ap_scale(
 ) -> AmountWithProvenance:
     """Scales provenance artifacts according to BEA"""
     new_value = round(a.value * factor)
-    return AmountWithProvenance(
-        value=new_value, sources=a.sources | frozenset(extra_sources.values())
-    )
+    return ap_with_mask(new_value, a.mask | mask_of(extra_sources.values()))
 
 
 def ap_source(a: AmountWithProvenance, *new_sources: SourceRef) -> AmountWithProvenance:
     """Adds new sources to an existing AmountWithProvenance without changing the value."""
-    return AmountWithProvenance(
-        value=a.value, sources=a.sources | frozenset(new_sources)
-    )
+    return ap_with_mask(a.value, a.mask | mask_of(new_sources))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from audit.provenance import SourceKind, SourceRef
+from audit.provenance import SourceKind, SourceRef, register_sources
 
 # pylint: disable = line-too-long
 # Lots of URLs here, don't need to break them up
@@ -131,6 +131,7 @@ _ALL_SOURCES: dict[str, SourceRef] = {
         HOUSE_MINORITY_APPTS_LETTER,
     ]
 }
+register_sources(_ALL_SOURCES.values())
 
 
 def get_source(source_id: str) -> SourceRef:
@@ -0,0 +1,16 @@
+"""Standalone benchmarks; run each module from the root with py -m"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Best wall time over `repeat` runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
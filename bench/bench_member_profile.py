@@ -0,0 +1,75 @@
+"""Times whole-session profile generation.
+
+Run from the root: py -m bench.bench_member_profile 2025-2026
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from bench import best_of
+from config.session_config import SESSIONS_ROOT, get_session_config
+from data.session_loader import LoadedSession, load_session
+from models.batch import compute_session
+from models.rules_9b import raw_role_stipends_for_member, select_paid_roles_for_member
+from models.rules_9c import travel_9c_for_member
+from models.total_comp import total_comp_for_member
+from tools.member_profile import generate_member_profile
+
+
+def bench_profiles(
+    loaded: LoadedSession, repeat: int = 5, data_root: Path = SESSIONS_ROOT
+) -> dict[str, float]:
+    """Compares recomputing each engine per profile with one computation;
+    `data_root` is where `loaded` was read from
+    """
+    session = loaded.session
+    config = get_session_config(session.id, data_root)
+    members = list(loaded.members.values())
+
+    def recompute() -> None:
+        for member in members:
+            total_comp_for_member(member, session, config)
+            select_paid_roles_for_member(member, session, config)
+            raw_role_stipends_for_member(member, session, config)
+            travel_9c_for_member(member, session, config)
+
+    def single() -> None:
+        for member in members:
+            total_comp_for_member(member, session, config)
+
+    def profiles() -> None:
+        comp = compute_session(loaded, config)
+        for member in members:
+            generate_member_profile(
+                member,
+                session,
+                session.id,
+                comp.result_for(member.member_id),
+                config=config,
+            )
+
+    return {
+        "engines_recomputed_per_profile": best_of(recompute, repeat),
+        "engines_computed_once": best_of(single, repeat),
+        "profiles_from_batch": best_of(profiles, repeat),
+    }
+
+
+def main() -> None:
+    """Prints timings for a session"""
+    parser = argparse.ArgumentParser(description="Benchmark profile generation")
+    parser.add_argument("session_id", help="Session ID, e.g. 2025-2026")
+    parser.add_argument("--data-root", default="data/sessions")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    data_root = Path(args.data_root)
+    loaded = load_session(data_root, args.session_id)
+    print(f"{len(loaded.members)} members, best of {args.repeat}")
+    for name, seconds in bench_profiles(loaded, args.repeat, data_root).items():
+        print(f"  {name:<32} {seconds * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compares profile output size and JSON timings with and without a shared
+source table.
+
+Run from the root: py -m bench.bench_output_size 2025-2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+import tempfile
+
+from bench import best_of
+from tools.generate_outputs import generate_all_outputs
+from tools.source_table import SOURCES_NAME
+from tools.writers import dump_json
+
+
+def _profile_files(session_dir: Path) -> list[Path]:
+    """Profiles plus the source table, if any"""
+    files = sorted((session_dir / "profiles").glob("*.json"))
+    if (session_dir / SOURCES_NAME).exists():
+        files.append(session_dir / SOURCES_NAME)
+    return files
+
+
+def bench_mode(session_id: str, shared: bool, repeat: int) -> dict[str, float]:
+    """Bytes on disk, gzip bytes, and JSON write/parse time for one mode"""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        generate_all_outputs(session_id, out, shared_sources=shared)
+        texts = [
+            p.read_text(encoding="utf-8") for p in _profile_files(out / session_id)
+        ]
+    data = [json.loads(text) for text in texts]
+    return {
+        "bytes": sum(len(t.encode("utf-8")) for t in texts),
+        "gzip_bytes": sum(len(gzip.compress(t.encode("utf-8"))) for t in texts),
+        "write_ms": best_of(lambda: [dump_json(d) for d in data], repeat) * 1000,
+        "parse_ms": best_of(lambda: [json.loads(t) for t in texts], repeat) * 1000,
+    }
+
+
+def main() -> None:
+    """Prints sizes and timings for both modes"""
+    parser = argparse.ArgumentParser(description="Benchmark profile output size")
+    parser.add_argument("session_id", help="Session ID, e.g. 2025-2026")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    results = {
+        "inline": bench_mode(args.session_id, False, args.repeat),
+        "shared": bench_mode(args.session_id, True, args.repeat),
+    }
+    print(f"{'':<10}{'bytes':>12}{'gzip':>12}{'write ms':>11}{'parse ms':>11}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<10}{r['bytes']:>12,}{r['gzip_bytes']:>12,}"
+            f"{r['write_ms']:>11.2f}{r['parse_ms']:>11.2f}"
+        )
+    ratio = results["shared"]["bytes"] / results["inline"]["bytes"]
+    print(f"shared/inline size: {ratio:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Times session loading and CLI cold start with and without a snapshot.
+
+Run from the root: py -m bench.bench_startup 2025-2026
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+from bench import best_of
+from data.session_loader import load_session
+from data.snapshot import snapshot_path, write_snapshot
+
+
+def bench_load(root: Path, session_id: str, repeat: int = 20) -> dict[str, float]:
+    """In-process `load_session` from JSON versus from a fresh snapshot"""
+    write_snapshot(load_session(root, session_id, snapshot=False), root)
+    return {
+        "load_parsed": best_of(
+            lambda: load_session(root, session_id, snapshot=False), repeat
+        ),
+        "load_snapshot": best_of(lambda: load_session(root, session_id), repeat),
+    }
+
+
+def bench_cold_start(root: Path, session_id: str, repeat: int = 5) -> dict[str, float]:
+    """Wall time of a fresh `cli.compute_session_comp` process"""
+    cmd = [
+        sys.executable,
+        "-m",
+        "cli.compute_session_comp",
+        session_id,
+        "--data-root",
+        str(root),
+    ]
+    snapshot = snapshot_path(root, session_id)
+
+    def run() -> None:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+
+    def run_without_snapshot() -> None:
+        snapshot.unlink(missing_ok=True)
+        run()
+
+    timings = {"cli_without_snapshot": best_of(run_without_snapshot, repeat)}
+    run()
+    timings["cli_with_snapshot"] = best_of(run, repeat)
+    return timings
+
+
+def main() -> None:
+    """Prints timings for a session"""
+    parser = argparse.ArgumentParser(description="Benchmark session startup")
+    parser.add_argument("session_id", help="Session ID, e.g. 2025-2026")
+    parser.add_argument("--data-root", default="data/sessions")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    root = Path(args.data_root)
+    timings = bench_load(root, args.session_id, args.repeat * 4)
+    timings.update(bench_cold_start(root, args.session_id, args.repeat))
+    print(f"best of {args.repeat}")
+    for name, seconds in timings.items():
+        print(f"  {name:<32} {seconds * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Scaled copies of a real session for benchmarking at larger sizes.
+
+Every member (with their roles and distance exception) is repeated `factor`
+times under new IDs, so the copy has the same mix of roles and distances as
+the original at `factor` times the members.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import shutil
+from typing import Any
+
+from data.session_loader import read_records
+
+_COPIED_FILES = ("adjustment.json", "base_salary.json", "district_centroids.json")
+
+
+def _copy_id(member_id: str, k: int) -> str:
+    """ID of the k-th copy of a member; the first copy keeps the original"""
+    return member_id if k == 0 else f"{member_id}_{k}"
+
+
+def _write(path: Path, session_id: str, key: str, rows: list[dict]) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        json.dump({"session_id": session_id, key: rows}, f)
+
+
+def scale_session(root: Path, session_id: str, factor: int, dest_root: Path) -> Path:
+    """Writes `session_id` from `root` with every member repeated `factor`
+    times to `dest_root`; returns the new session directory
+    """
+    src = root / session_id
+    dest = dest_root / session_id
+    dest.mkdir(parents=True, exist_ok=True)
+    members = list(read_records(src, "members", "members"))
+    roles = list(read_records(src, "roles", "roles"))
+    manual = list(read_records(src, "manual_roles", "roles"))
+
+    def repeat(rows: list[dict[str, Any]], name_key: str = "") -> list[dict]:
+        out = []
+        for k in range(factor):
+            for row in rows:
+                copy = dict(row, member_id=_copy_id(row["member_id"], k))
+                if name_key and k:
+                    copy[name_key] = f"{row[name_key]} #{k}"
+                out.append(copy)
+        return out
+
+    _write(dest / "members.json", session_id, "members", repeat(members, "name"))
+    _write(dest / "roles.json", session_id, "roles", repeat(roles))
+    _write(dest / "manual_roles.json", session_id, "roles", repeat(manual))
+    exceptions_path = src / "distance_exceptions.json"
+    exceptions: dict[str, Any] = (
+        json.loads(exceptions_path.read_text(encoding="utf-8"))
+        if exceptions_path.exists()
+        else {}
+    )
+    with (dest / "distance_exceptions.json").open("w", encoding="utf-8") as f:
+        json.dump(
+            {
+                _copy_id(mid, k): exception
+                for k in range(factor)
+                for mid, exception in exceptions.items()
+            },
+            f,
+        )
+    for name in _COPIED_FILES:
+        if (src / name).exists():
+            shutil.copyfile(src / name, dest / name)
+    return dest
@@ -0,0 +1,320 @@
+"""Benchmark suite for the compensation pipeline.
+
+Times each pipeline stage on a session and on scaled copies of it (see
+`bench.scaled`), saves the results as JSON, and compares a run against a
+saved baseline, failing if any benchmark slowed down beyond a threshold.
+
+Run from the root:
+    py -m bench.suite run --scales 1 10 100 --out bench_results.json
+    py -m bench.suite run --baseline bench_results.json --threshold 0.2
+    py -m bench.suite compare old.json new.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import io
+import json
+from pathlib import Path
+import platform
+import tempfile
+from typing import Any, Callable, Iterable, Optional
+
+from bench import best_of
+from bench.scaled import scale_session
+from config.session_config import SessionConfig, get_session_config
+from data.session_loader import LoadedSession, load_session, read_records
+from data.synthetic import generate_session
+from models.batch import SessionComp, compute_session
+from models.rules_9b import select_paid_roles_for_member
+from models.total_comp import total_comp_for_member
+from tools.html_viewer.generator import generate_html_viewer
+from tools.member_profile import generate_member_profile
+from tools.session_report import generate_session_report
+from tools.writers import dump_json, write_json, write_text
+
+SUITE_VERSION = 1
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True)
+class BenchContext:
+    """A loaded (possibly scaled) session and a scratch directory"""
+
+    root: Path
+    session_id: str
+    loaded: LoadedSession
+    config: SessionConfig
+    comp: SessionComp
+    work_dir: Path
+
+    @staticmethod
+    def build(root: Path, session_id: str, work_dir: Path) -> BenchContext:
+        """Loads and computes the session once for the benchmarks to share"""
+        loaded = load_session(root, session_id, snapshot=False)
+        config = get_session_config(session_id, root)
+        return BenchContext(
+            root=root,
+            session_id=session_id,
+            loaded=loaded,
+            config=config,
+            comp=compute_session(loaded, config),
+            work_dir=work_dir,
+        )
+
+
+def bench_load_session(ctx: BenchContext) -> Callable[[], object]:
+    """Parsing the session's JSON files"""
+    return lambda: load_session(ctx.root, ctx.session_id, snapshot=False)
+
+
+def bench_load_snapshot(ctx: BenchContext) -> Callable[[], object]:
+    """Loading the session from a fresh snapshot"""
+    load_session(ctx.root, ctx.session_id)
+    return lambda: load_session(ctx.root, ctx.session_id)
+
+
+def bench_select_paid_roles(ctx: BenchContext) -> Callable[[], object]:
+    """9B role selection for every member"""
+    session, config = ctx.loaded.session, ctx.config
+    members = list(ctx.loaded.members.values())
+    return lambda: [select_paid_roles_for_member(m, session, config) for m in members]
+
+
+def bench_total_comp(ctx: BenchContext) -> Callable[[], object]:
+    """Per-member total compensation for every member"""
+    session, config = ctx.loaded.session, ctx.config
+    members = list(ctx.loaded.members.values())
+    return lambda: [total_comp_for_member(m, session, config) for m in members]
+
+
+def bench_compute_session(ctx: BenchContext) -> Callable[[], object]:
+    """Whole-session batch computation"""
+    return lambda: compute_session(ctx.loaded, ctx.config)
+
+
+def bench_member_profiles(ctx: BenchContext) -> Callable[[], object]:
+    """Profiles for every member from precomputed results"""
+    session = ctx.loaded.session
+    members = list(ctx.loaded.members.values())
+    return lambda: [
+        generate_member_profile(
+            m,
+            session,
+            session.id,
+            ctx.comp.result_for(m.member_id),
+            config=ctx.config,
+        )
+        for m in members
+    ]
+
+
+def bench_session_report(ctx: BenchContext) -> Callable[[], object]:
+    """The session report from precomputed results"""
+    return lambda: generate_session_report(ctx.loaded, ctx.comp)
+
+
+def bench_html_viewer(ctx: BenchContext) -> Callable[[], object]:
+    """The HTML viewer, from profiles and reports written once beforehand"""
+    session = ctx.loaded.session
+    out = ctx.work_dir / "outputs"
+    session_dir = out / session.id
+    for member in ctx.loaded.members.values():
+        profile = generate_member_profile(
+            member,
+            session,
+            session.id,
+            ctx.comp.result_for(member.member_id),
+            config=ctx.config,
+        )
+        path = session_dir / "profiles" / f"{member.member_id}.json"
+        write_text(dump_json(profile.to_dict()), path, announce=False)
+    report = generate_session_report(ctx.loaded, ctx.comp)
+    reports_dir = session_dir / "reports"
+    for name, data in (
+        ("summary_stats.json", report.summary_statistics),
+        ("validation_report.json", report.validation_summary),
+    ):
+        write_json(data, reports_dir / name, announce=False)
+
+    def run() -> None:
+        with redirect_stdout(io.StringIO()):
+            generate_html_viewer(session.id, out, out / "index.html")
+
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[BenchContext], Callable[[], object]]] = {
+    "load_session": bench_load_session,
+    "load_snapshot": bench_load_snapshot,
+    "select_paid_roles": bench_select_paid_roles,
+    "total_comp": bench_total_comp,
+    "compute_session": bench_compute_session,
+    "member_profiles": bench_member_profiles,
+    "session_report": bench_session_report,
+    "html_viewer": bench_html_viewer,
+}
+
+
+def result_name(benchmark: str, scale: int) -> str:
+    """Key of one benchmark at one scale in the results"""
+    return f"{benchmark}[{scale}x]"
+
+
+def run_suite(
+    root: Path,
+    session_id: str,
+    scales: Iterable[int] = (1,),
+    repeat: int = 5,
+    only: Optional[Iterable[str]] = None,
+    synthetic: bool = False,
+) -> dict[str, Any]:
+    """Runs the benchmarks at each scale; larger scales repeat fewer times.
+    With `synthetic`, each scale is a generated session (`data.synthetic`)
+    with `scale` times the session's member count instead of a scaled copy
+    """
+    names = list(only) if only else list(BENCHMARKS)
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    results: dict[str, dict[str, Any]] = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_root = Path(tmp) / "sessions"
+            if synthetic:
+                n_members = sum(
+                    1 for _ in read_records(root / session_id, "members", "members")
+                )
+                generate_session(data_root, session_id, scale * n_members)
+            else:
+                scale_session(root, session_id, scale, data_root)
+            ctx = BenchContext.build(data_root, session_id, Path(tmp))
+            runs = max(1, repeat // scale)
+            for name in names:
+                seconds = best_of(BENCHMARKS[name](ctx), runs)
+                results[result_name(name, scale)] = {
+                    "seconds": seconds,
+                    "members": len(ctx.loaded.members),
+                    "repeat": runs,
+                }
+                print(f"  {result_name(name, scale):<28} {seconds * 1000:>11.2f} ms")
+    return {
+        "suite_version": SUITE_VERSION,
+        "session_id": session_id,
+        "synthetic": synthetic,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One benchmark in both runs"""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        """Current time over baseline time"""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        """Slower than the baseline by more than the threshold"""
+        return self.ratio > 1 + self.threshold
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Benchmarks present in both runs, in the current run's order"""
+    base = baseline["results"]
+    return [
+        Comparison(name, base[name]["seconds"], r["seconds"], threshold)
+        for name, r in current["results"].items()
+        if name in base
+    ]
+
+
+def print_comparison(comparisons: list[Comparison]) -> bool:
+    """Prints the comparison table; returns whether anything regressed"""
+    print(f"{'benchmark':<28}{'baseline ms':>13}{'current ms':>13}{'ratio':>8}")
+    for c in comparisons:
+        flag = "  REGRESSED" if c.regressed else ""
+        print(
+            f"{c.name:<28}{c.baseline * 1000:>13.2f}{c.current * 1000:>13.2f}"
+            f"{c.ratio:>8.2f}{flag}"
+        )
+    return any(c.regressed for c in comparisons)
+
+
+def _load(path: str) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main() -> None:
+    """Runs the suite or compares two saved runs"""
+    parser = argparse.ArgumentParser(description="Compensation pipeline benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Run the benchmarks")
+    run.add_argument("--session-id", default="2025-2026")
+    run.add_argument("--data-root", default="data/sessions")
+    run.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=[1, 10],
+        help="Member multipliers to run at, e.g. 1 10 100 1000 (default: 1 10)",
+    )
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--only", nargs="+", choices=list(BENCHMARKS))
+    run.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Benchmark generated sessions instead of scaled copies",
+    )
+    run.add_argument("--out", help="Write results as JSON to this path")
+    run.add_argument("--baseline", help="Compare against saved results")
+    compare = commands.add_parser("compare", help="Compare two saved runs")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    for p in (run, compare):
+        p.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help="Allowed slowdown before failing, as a fraction (default: 0.2)",
+        )
+    args = parser.parse_args()
+    if args.command == "compare":
+        baseline, current = _load(args.baseline), _load(args.current)
+    else:
+        current = run_suite(
+            Path(args.data_root),
+            args.session_id,
+            args.scales,
+            args.repeat,
+            args.only,
+            args.synthetic,
+        )
+        if args.out:
+            write_json(current, Path(args.out))
+        if not args.baseline:
+            return
+        baseline = _load(args.baseline)
+    if print_comparison(compare_results(baseline, current, args.threshold)):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,10 @@ import argparse
 from pathlib import Path
 
 from audit.issues import AuditIssue
+from config.session_config import get_session_config
 from data.session_loader import load_session
-from models.total_comp import total_comp_for_member
+from instrumentation import add_profiling_arguments, profiling
+from models.batch import compute_session
 from validators import (
     validate_role_catalog,
     validate_session_data,
@@ -36,22 +38,26 @@ def main() -> None:
         default="data/sessions",
         help="Root directory containing session data (default: data/sessions)",
     )
+    add_profiling_arguments(parser)
     args = parser.parse_args()
-    loaded = load_session(Path(args.data_root), args.session_id)
-    catalog_issues = validate_role_catalog()
-    session_issues = validate_session_data(loaded)
-    _print_issues("Catalog issues:", catalog_issues)
-    _print_issues("Session issues:", session_issues)
-    if any(str(i.level) == "ERROR" for i in catalog_issues + session_issues):
-        print("Errors detected; aborting computation.")
-        return
-    session = loaded.session
-    print(f"Session {session.id} ({session.start_year}-{session.end_year})")
-    print()
-    print(f"{'Member ID':<10}  {'Name':<25}  {'Total':>10}")
-    for member in loaded.members.values():
-        res = total_comp_for_member(member, session)
-        print(f"{member.member_id:<10}  {member.name:<25}  {res.total.value:>10}")
+    with profiling(args, "compute_session_comp"):
+        data_root = Path(args.data_root)
+        loaded = load_session(data_root, args.session_id)
+        catalog_issues = validate_role_catalog()
+        session_issues = validate_session_data(loaded)
+        _print_issues("Catalog issues:", catalog_issues)
+        _print_issues("Session issues:", session_issues)
+        if any(str(i.level) == "ERROR" for i in catalog_issues + session_issues):
+            print("Errors detected; aborting computation.")
+            return
+        session = loaded.session
+        config = get_session_config(session.id, data_root)
+        print(f"Session {session.id} ({session.start_year}-{session.end_year})")
+        print()
+        comp = compute_session(loaded, config)
+        print(f"{'Member ID':<10}  {'Name':<25}  {'Total':>10}")
+        for i, member in enumerate(loaded.members.values()):
+            print(f"{member.member_id:<10}  {member.name:<25}  {comp.total[i]:>10}")
 
 
 if __name__ == "__main__":
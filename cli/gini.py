@@ -4,25 +4,24 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
+from typing import Sequence
 
 import numpy as np
 
-from audit.provenance import ap_sum
+from config.session_config import get_session_config
 from data.session_loader import load_session
-from models.rules_9b import select_paid_roles_for_member
+from instrumentation import add_profiling_arguments, profiling
+from models.batch import compute_session
+from tools.stats import gini, theil
 from validators import (
     validate_role_catalog,
     validate_session_data,
 )
 
 
-def gini_coefficient(values: list[int]) -> float:
+def gini_coefficient(values: Sequence[int] | np.ndarray) -> float:
     """Calculates Gini coefficient for a list of values."""
-    sorted_values = np.sort(values)  # Sort the values in ascending order
-    n = len(sorted_values)
-    cumulative_sum = np.cumsum(sorted_values)
-    gini = (n + 1 - 2 * (np.sum(cumulative_sum) / cumulative_sum[-1])) / n
-    return gini
+    return gini(values)
 
 
 def main() -> None:
@@ -36,22 +35,22 @@ def main() -> None:
         default="data/sessions",
         help="Root directory containing session data (default: data/sessions)",
     )
+    add_profiling_arguments(parser)
     args = parser.parse_args()
-    loaded = load_session(Path(args.data_root), args.session_id)
-    catalog_issues = validate_role_catalog()
-    session_issues = validate_session_data(loaded)
-    if any(str(i.level) == "ERROR" for i in catalog_issues + session_issues):
-        print("Errors detected; aborting computation.")
-        return
-    session = loaded.session
-    print(f"Session {session.id} ({session.start_year}-{session.end_year})")
-    stipends = []
-    for member in loaded.members.values():
-        selection = select_paid_roles_for_member(member, session)
-        stipend = ap_sum(rs.amount for rs in selection.paid_roles)
-        stipends.append(stipend.value)
-    gini = gini_coefficient(stipends)
-    print(f"\nGini coefficient for stipends: {gini:.4f}")
+    with profiling(args, "gini"):
+        data_root = Path(args.data_root)
+        loaded = load_session(data_root, args.session_id)
+        catalog_issues = validate_role_catalog()
+        session_issues = validate_session_data(loaded)
+        if any(str(i.level) == "ERROR" for i in catalog_issues + session_issues):
+            print("Errors detected; aborting computation.")
+            return
+        session = loaded.session
+        config = get_session_config(session.id, data_root)
+        print(f"Session {session.id} ({session.start_year}-{session.end_year})")
+        comp = compute_session(loaded, config)
+        print(f"\nGini coefficient for stipends: {gini(comp.stipends_9b):.4f}")
+        print(f"Theil index for stipends: {theil(comp.stipends_9b):.4f}")
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from audit.provenance import AmountWithProvenance, ap_from
 from audit.sources_registry import (
@@ -23,30 +23,40 @@ class BaseSalaryConfig:
     base_amount: int
     factor: Optional[float]
     note: str = ""
+    # aggregate_change_factor as written in base_salary.json (1.0 if absent),
+    # which profiles report unchanged
+    reported_factor: Any = 1.0
+
+    @staticmethod
+    def from_dict(session_id: str, data: dict[str, Any]) -> BaseSalaryConfig:
+        """Builds the config from parsed base_salary.json"""
+        if data["session_id"] != session_id:
+            raise ValueError(
+                f"base_salary.json session_id mismatch: "
+                f"{data['session_id']} != {session_id}"
+            )
+        factor = data.get("aggregate_change_factor")
+        return BaseSalaryConfig(
+            session_id=session_id,
+            base_amount=int(data["base_amount"]),
+            factor=float(factor) if factor is not None else None,
+            note=data.get("note", ""),
+            reported_factor=data.get("aggregate_change_factor", 1.0),
+        )
 
 
 def load_base_salary_adjustment(session: Session) -> BaseSalaryConfig:
     """Load salary plus raises"""
     path = Path("data/sessions") / session.id / "base_salary.json"
     data: dict = json.loads(path.read_text())
-    if data["session_id"] != session.id:
-        raise ValueError(
-            f"base_salary.json session_id mismatch: "
-            f"{data['session_id']} != {session.id}"
-        )
-    base_amount = int(data["base_amount"])
-    factor = data.get("aggregate_change_factor")
-    factor_f = float(factor) if factor is not None else None
-    note = data.get("note", "")
-    return BaseSalaryConfig(
-        session_id=session.id,
-        base_amount=base_amount,
-        factor=factor_f,
-        note=note,
-    )
+    return BaseSalaryConfig.from_dict(session.id, data)
+
+
+def base_salary_from_config(cfg: BaseSalaryConfig) -> AmountWithProvenance:
+    """Base salary plus adjustments from an already-loaded config"""
+    return ap_from(cfg.base_amount, ARTICLE_CXVIII_BASE, BASE_SALARY_ADJUSTMENT)
 
 
 def base_salary_for_session(session: Session) -> AmountWithProvenance:
     """Base salary plus adjustments for a session"""
-    cfg = load_base_salary_adjustment(session)
-    return ap_from(cfg.base_amount, ARTICLE_CXVIII_BASE, BASE_SALARY_ADJUSTMENT)
+    return base_salary_from_config(load_base_salary_adjustment(session))
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import json
 from pathlib import Path
+from typing import Any
 
 from audit.sources_registry import TRAVEL_AMOUNT_ADJUSTMENT, STIPEND_AMOUNT_ADJUSTMENT
 from audit.provenance import SourceRef
@@ -19,6 +20,16 @@ class AdjustedStipend:
     source: SourceRef
     note: str
 
+    @staticmethod
+    def from_dict(session_id: str, data: dict[str, Any]) -> AdjustedStipend:
+        """Builds the stipend adjustment from parsed adjustment.json"""
+        return AdjustedStipend(
+            session_id=session_id,
+            factor=float(data["aggregate_change_factor"]),
+            source=STIPEND_AMOUNT_ADJUSTMENT,
+            note=data.get("note", ""),
+        )
+
 
 @dataclass(frozen=True)
 class AdjustedBaseSalary:
@@ -39,26 +50,26 @@ class AdjustedTravel:
     source: SourceRef
     note: str
 
+    @staticmethod
+    def from_dict(session_id: str, data: dict[str, Any]) -> AdjustedTravel:
+        """Builds the travel adjustment from parsed adjustment.json"""
+        return AdjustedTravel(
+            session_id=session_id,
+            factor=float(data["aggregate_change_factor"]),
+            source=TRAVEL_AMOUNT_ADJUSTMENT,
+            note=data.get("note", ""),
+        )
+
 
 def load_stipend_adjustment(session_id: str) -> AdjustedStipend:
     """Loads stipend multiplier from config JSON"""
     path = Path("data/sessions") / session_id / "adjustment.json"
     data: dict = json.loads(path.read_text())
-    return AdjustedStipend(
-        session_id=session_id,
-        factor=float(data["aggregate_change_factor"]),
-        source=STIPEND_AMOUNT_ADJUSTMENT,
-        note=data.get("note", ""),
-    )
+    return AdjustedStipend.from_dict(session_id, data)
 
 
 def load_travel_adjustment(session_id: str) -> AdjustedTravel:
     """Loads travel multiplier from config JSON"""
     path = Path("data/sessions") / session_id / "adjustment.json"
     data: dict = json.loads(path.read_text())
-    return AdjustedTravel(
-        session_id=session_id,
-        factor=float(data["aggregate_change_factor"]),
-        source=TRAVEL_AMOUNT_ADJUSTMENT,
-        note=data.get("note", ""),
-    )
+    return AdjustedTravel.from_dict(session_id, data)
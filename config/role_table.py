@@ -0,0 +1,80 @@
+"""Compiled per-session role table.
+
+Resolves each catalog role once: chair flag, stipend tier and the tier amount
+scaled by the session's stipend adjustment factor. Tables are cached per
+factor, so every session with the same adjustment shares one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from audit.provenance import AmountWithProvenance, ap_scale
+from audit.sources_registry import STIPEND_AMOUNT_ADJUSTMENT
+from config.role_catalog import ROLE_DEFINITIONS
+from models.core import CommitteeRoleType, StipendTierCode
+
+
+@dataclass(frozen=True)
+class CompiledRole:
+    """Everything the rules engines need to know about one role"""
+
+    role_code: str
+    title: str
+    is_chair: bool
+    tier_id: Optional[StipendTierCode]
+    base_amount: Optional[AmountWithProvenance]
+    adjusted_amount: Optional[AmountWithProvenance]
+    reason: Optional[str]
+
+
+@dataclass(frozen=True)
+class RoleTable:
+    """Role code -> compiled role, for one stipend adjustment factor"""
+
+    factor: float
+    roles: dict[str, CompiledRole]
+
+    def __contains__(self, role_code: str) -> bool:
+        return role_code in self.roles
+
+    def get(self, role_code: str) -> CompiledRole:
+        """Compiled role for a code; raises KeyError for unknown codes"""
+        return self.roles[role_code]
+
+
+def _compile_role(role_code: str, factor: float) -> CompiledRole:
+    """Resolves one catalog role at the given adjustment factor"""
+    rd = ROLE_DEFINITIONS[role_code]
+    tier_id = rd.stipend_tier_id
+    base = adjusted = None
+    reason = None
+    if tier_id is not None:
+        base = adjusted = StipendTierCode.get_base_amount(tier_id)
+        if factor != 1.0:
+            adjusted = ap_scale(base, factor, source=STIPEND_AMOUNT_ADJUSTMENT)
+        reason = f"Tier {tier_id} base ${base.value:,} adjusted by factor {factor}"
+    return CompiledRole(
+        role_code=role_code,
+        title=rd.title,
+        is_chair=rd.committee_role_type == CommitteeRoleType.CHAIR,
+        tier_id=tier_id,
+        base_amount=base,
+        adjusted_amount=adjusted,
+        reason=reason,
+    )
+
+
+@lru_cache(maxsize=None)
+def role_table_for_factor(factor: float) -> RoleTable:
+    """The role table for a stipend adjustment factor, compiled once"""
+    return RoleTable(
+        factor=factor,
+        roles={code: _compile_role(code, factor) for code in ROLE_DEFINITIONS},
+    )
+
+
+BASE_ROLE_TABLE = role_table_for_factor(1.0)
+"""Unadjusted table, for lookups that do not depend on the session factor"""
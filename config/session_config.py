@@ -0,0 +1,86 @@
+"""Per-session configuration, loaded once and cached by file mtime"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from typing import Optional
+
+from config.base_salary import BaseSalaryConfig
+from config.comp_adjustment import AdjustedStipend, AdjustedTravel
+from config.role_table import RoleTable, role_table_for_factor
+from config.travel_config import DistanceException, load_distance_exceptions
+from instrumentation import timed
+
+SESSIONS_ROOT = Path("data/sessions")
+
+_CONFIG_FILES: tuple[str, ...] = (
+    "adjustment.json",
+    "base_salary.json",
+    "distance_exceptions.json",
+)
+
+_FileStamp = Optional[tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """Everything the rules engines read from a session's config files"""
+
+    session_id: str
+    stipend_adjustment: AdjustedStipend
+    travel_adjustment: AdjustedTravel
+    base_salary: BaseSalaryConfig
+    distance_exceptions: dict[str, DistanceException]
+
+    @property
+    def role_table(self) -> RoleTable:
+        """Roles compiled at this session's stipend adjustment factor"""
+        return role_table_for_factor(self.stipend_adjustment.factor)
+
+
+_CACHE: dict[tuple[Path, str], tuple[tuple[_FileStamp, ...], SessionConfig]] = {}
+
+
+def _stamp(path: Path) -> _FileStamp:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@timed("session_config.read")
+def read_session_config(session_id: str, root: Path = SESSIONS_ROOT) -> SessionConfig:
+    """Reads a session's config files from disk, bypassing the cache"""
+    session_dir = root / session_id
+    adjustment: dict = json.loads((session_dir / "adjustment.json").read_text())
+    base_salary: dict = json.loads((session_dir / "base_salary.json").read_text())
+    return SessionConfig(
+        session_id=session_id,
+        stipend_adjustment=AdjustedStipend.from_dict(session_id, adjustment),
+        travel_adjustment=AdjustedTravel.from_dict(session_id, adjustment),
+        base_salary=BaseSalaryConfig.from_dict(session_id, base_salary),
+        distance_exceptions=load_distance_exceptions(
+            session_dir / "distance_exceptions.json"
+        ),
+    )
+
+
+def get_session_config(session_id: str, root: Path = SESSIONS_ROOT) -> SessionConfig:
+    """Returns the cached config for a session, reloading if any file changed"""
+    key = (root, session_id)
+    stamps = tuple(_stamp(root / session_id / name) for name in _CONFIG_FILES)
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+    config = read_session_config(session_id, root)
+    _CACHE[key] = (stamps, config)
+    return config
+
+
+def clear_session_config_cache() -> None:
+    """Drops every cached session config"""
+    _CACHE.clear()
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import json
+from pathlib import Path
+from typing import Optional
 
 from audit.provenance import AmountWithProvenance, ap_from
 from audit.sources_registry import MGL_3_9C
@@ -22,3 +25,33 @@ TRAVEL_RULE_9C = TravelRule(
     amount_leq_threshold=ap_from(15_000, MGL_3_9C),
     amount_gt_threshold=ap_from(20_000, MGL_3_9C),
 )
+
+
+@dataclass(frozen=True)
+class DistanceException:
+    """Encodes manual distance overrides"""
+
+    override_reason: str
+    source: str
+    distance_miles_from_state_house: Optional[float] = None
+
+    @staticmethod
+    def from_dict(
+        json_data: dict[str, dict[str, str | float]], code: str
+    ) -> DistanceException:
+        """Generates a DistanceException from a JSON"""
+        data: dict = json_data[code]
+        return DistanceException(
+            override_reason=data["override_reason"],
+            source=data["source"],
+            distance_miles_from_state_house=data.get("distance_miles_from_state_house"),
+        )
+
+
+def load_distance_exceptions(json_path: Path) -> dict[str, DistanceException]:
+    """Loads a session's distance exceptions; a missing file means none"""
+    if not json_path.exists():
+        return {}
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+        return {code: DistanceException.from_dict(data, code) for code in data}
@@ -1,11 +1,15 @@
 """Use district_centroids.json to inform members.json"""
 
+from __future__ import annotations
+
 import argparse
 import json
 import math
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Optional
+
+from data.jsonl import jsonl_session_id, read_jsonl, write_jsonl
 
 # Massachusetts State House (24 Beacon St, Boston)
 STATE_HOUSE_LAT = 42.3587
@@ -159,9 +163,11 @@ def enrich_members_with_distance(
     centroids_path: Path,
     state_house_lat: float = STATE_HOUSE_LAT,
     state_house_lon: float = STATE_HOUSE_LON,
+    out_path: Optional[Path] = None,
 ) -> None:
-    """Read members.json, attach distance_miles_from_state_house, and
-    write the file back in place.
+    """Read members.json (or members.jsonl), attach
+    distance_miles_from_state_house, and write it to `out_path`, which
+    defaults to rewriting the input in place.
 
     Expects members.json structure like:
         {
@@ -176,6 +182,9 @@ def enrich_members_with_distance(
             ...
           ]
         }
+
+    members.jsonl holds a session header line and then one member per line.
+    A `.jsonl` output is written one member at a time.
     """
     # pylint: disable = too-many-locals
     # This is a rarely used, one-purpose function
@@ -183,17 +192,25 @@ def enrich_members_with_distance(
         centroids = json.load(f)
     house_index = build_house_centroid_index(centroids)
     senate_index = build_senate_centroid_index(centroids)
-    with members_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    members = data.get("members", [])
-    missing_house = []
-    missing_senate = []
-    for m in members:
+    out_path = members_path if out_path is None else out_path
+    data: dict[str, Any]
+    if members_path.suffix == ".jsonl":
+        session_id = jsonl_session_id(members_path)
+        data = {"session_id": session_id}
+        members: Iterable[dict[str, Any]] = read_jsonl(members_path, session_id)
+    else:
+        with members_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        members = data.get("members", [])
+    missing_house: list[tuple[Any, str, str]] = []
+    missing_senate: list[tuple[Any, str]] = []
+
+    def enrich(m: dict[str, Any]) -> dict[str, Any]:
         chamber = (m.get("chamber") or "").upper()
         district_name = m.get("district") or ""
         if not district_name:
             m["distance_miles_from_state_house"] = None
-            continue
+            return m
         if chamber == "HOUSE":
             try:
                 county_label, num = parse_house_district_name(district_name)
@@ -219,9 +236,15 @@ def enrich_members_with_distance(
                 m["distance_miles_from_state_house"] = round(dist, 3)
         else:
             m["distance_miles_from_state_house"] = None
-    data["members"] = members
-    with members_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+        return m
+
+    enriched = (enrich(m) for m in members)
+    if out_path.suffix == ".jsonl":
+        write_jsonl(out_path, data["session_id"], enriched, sort_keys=True)
+    else:
+        data["members"] = list(enriched)
+        with out_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
     if missing_house:
         print("WARNING: Failed to map House districts to centroids:")
         for member_id, district_name, err in missing_house:
@@ -245,5 +268,11 @@ if __name__ == "__main__":
         default=Path("data/sessions/2025-2026/district_centroids.json"),
         help="Path to district_centroids.json",
     )
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=None,
+        help="Output path; a .jsonl suffix streams JSON Lines (default: in place)",
+    )
     args = parser.parse_args()
-    enrich_members_with_distance(args.members_json, args.centroids)
+    enrich_members_with_distance(args.members_json, args.centroids, out_path=args.out)
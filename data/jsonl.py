@@ -0,0 +1,93 @@
+"""JSON Lines session files.
+
+The first line is a `{"session_id": ...}` header; every following line is one
+record (a member or a role). Files are written and read one record at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+def write_jsonl(
+    path: Path,
+    session_id: str,
+    records: Iterable[dict[str, Any]],
+    sort_keys: bool = False,
+) -> int:
+    """Streams records to `path` after a header line; returns the record count"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".jsonl.tmp")
+    count = 0
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(json.dumps({"session_id": session_id}) + "\n")
+        for record in records:
+            f.write(json.dumps(record, sort_keys=sort_keys) + "\n")
+            count += 1
+    tmp.replace(path)
+    return count
+
+
+def jsonl_session_id(path: Path) -> str:
+    """Session ID from a JSON Lines file's header"""
+    with path.open("r", encoding="utf-8") as f:
+        return json.loads(f.readline())["session_id"]
+
+
+def read_jsonl(path: Path, session_id: str) -> Iterator[dict[str, Any]]:
+    """Yields the records of a JSON Lines session file, checking its header"""
+    with path.open("r", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("session_id") != session_id:
+            raise ValueError(
+                f"{path.name} session_id mismatch (expected {session_id}, got "
+                f"{header.get('session_id')})"
+            )
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def convert_session(sessions_root: Path, session_id: str) -> list[Path]:
+    """Writes members.jsonl / roles.jsonl next to a session's JSON documents"""
+    written = []
+    for name, key in (("members", "members"), ("roles", "roles")):
+        src = sessions_root / session_id / f"{name}.json"
+        if not src.exists():
+            continue
+        with src.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["session_id"] != session_id:
+            raise ValueError(
+                f"{src.name} session_id mismatch (expected {session_id}, got "
+                f"{data['session_id']})"
+            )
+        dest = src.with_suffix(".jsonl")
+        write_jsonl(dest, session_id, data[key])
+        written.append(dest)
+    return written
+
+
+def main() -> None:
+    """Converts sessions from JSON documents to JSON Lines"""
+    parser = argparse.ArgumentParser(
+        description="Write members.jsonl and roles.jsonl for existing sessions."
+    )
+    parser.add_argument("session_ids", nargs="+", help="Session IDs, e.g. 2025-2026")
+    parser.add_argument(
+        "--sessions-root",
+        type=Path,
+        default=Path("data/sessions"),
+        help="Root directory of session data (default: data/sessions)",
+    )
+    args = parser.parse_args()
+    for session_id in args.session_ids:
+        for path in convert_session(args.sessions_root, session_id):
+            print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,13 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Literal, Optional
 
 from config.committee_catalog import get_committee_by_external_id
 from config.role_catalog import ROLE_DEFINITIONS
+from data.jsonl import write_jsonl
+from data.session_loader import read_records
+from instrumentation import add_profiling_arguments, profiling
 from models.core import CommitteeRoleType
 
 
@@ -123,13 +126,13 @@ def normalize_committee_roles(
 ) -> list[dict]:
     """Convert committee_roles_raw.json to role entries"""
     committee_file = raw_root / session_id / "committee_roles_raw.json"
-    members_file = sessions_root / session_id / "members.json"
     with committee_file.open("r", encoding="utf-8") as f:
         committee_data = json.load(f)
-    with members_file.open("r", encoding="utf-8") as f:
-        members_data = json.load(f)
     # Create member_id -> chamber mapping
-    member_chamber = {m["member_id"]: m["chamber"] for m in members_data["members"]}
+    member_chamber = {
+        m["member_id"]: m["chamber"]
+        for m in read_records(sessions_root / session_id, "members", "members")
+    }
     role_entries = []
     for entry in committee_data:
         member_id = entry["member_id"]
@@ -190,7 +193,39 @@ def normalize_leadership_roles(
     return role_entries
 
 
-def normalize_all_roles(session_id: str, raw_root: Path, sessions_root: Path) -> None:
+SessionFormat = Literal["json", "jsonl"]
+
+
+def write_roles(
+    sessions_root: Path,
+    session_id: str,
+    roles: Iterable[dict],
+    fmt: SessionFormat = "json",
+) -> Path:
+    """Writes roles.json, or streams roles.jsonl, removing the other format's
+    file so the loader never reads a stale copy
+    """
+    session_dir = sessions_root / session_id
+    json_file = session_dir / "roles.json"
+    jsonl_file = session_dir / "roles.jsonl"
+    if fmt == "jsonl":
+        write_jsonl(jsonl_file, session_id, roles)
+        json_file.unlink(missing_ok=True)
+        return jsonl_file
+    output_data = {"session_id": session_id, "roles": list(roles)}
+    session_dir.mkdir(parents=True, exist_ok=True)
+    with json_file.open("w", encoding="utf-8") as f:
+        json.dump(output_data, f, indent=2)
+    jsonl_file.unlink(missing_ok=True)
+    return json_file
+
+
+def normalize_all_roles(
+    session_id: str,
+    raw_root: Path,
+    sessions_root: Path,
+    fmt: SessionFormat = "json",
+) -> None:
     """Convert both committee and leadership roles to roles.json"""
     print("=" * 60)
     print("NORMALIZING ALL ROLES")
@@ -200,11 +235,7 @@ def normalize_all_roles(session_id: str, raw_root: Path, sessions_root: Path) ->
     print("\n2. Processing leadership roles...")
     leadership_roles = normalize_leadership_roles(session_id, raw_root, sessions_root)
     all_role_entries = committee_roles + leadership_roles
-    output_file = sessions_root / session_id / "roles.json"
-    output_data = {"session_id": session_id, "roles": all_role_entries}
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with output_file.open("w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2)
+    output_file = write_roles(sessions_root, session_id, all_role_entries, fmt)
     print("\n" + "=" * 60)
     success_msg = (
         f"[SUCCESS] Wrote {len(all_role_entries)} total roles " f"to {output_file}"
@@ -227,29 +258,33 @@ def main() -> None:
         default="all",
         help="Type of roles to normalize (default: all)",
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        help="Write roles.json or streamed roles.jsonl (default: json)",
+    )
+    add_profiling_arguments(parser)
     args = parser.parse_args()
     raw_root = Path("data/raw")
     sessions_root = Path("data/sessions")
-    if args.type == "all":
-        normalize_all_roles(args.session_id, raw_root, sessions_root)
-    elif args.type == "leadership":
-        roles = normalize_leadership_roles(args.session_id, raw_root, sessions_root)
-        output_file = sessions_root / args.session_id / "roles.json"
-        output_data = {"session_id": args.session_id, "roles": roles}
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2)
-        msg = f"\nWrote {len(roles)} leadership roles to {output_file}"
-        print(msg)
-    elif args.type == "committee":
-        roles = normalize_committee_roles(args.session_id, raw_root, sessions_root)
-        output_file = sessions_root / args.session_id / "roles.json"
-        output_data = {"session_id": args.session_id, "roles": roles}
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2)
-        msg = f"\nWrote {len(roles)} committee roles to {output_file}"
-        print(msg)
+    with profiling(args, "normalize"):
+        if args.type == "all":
+            normalize_all_roles(args.session_id, raw_root, sessions_root, args.format)
+        elif args.type == "leadership":
+            roles = normalize_leadership_roles(args.session_id, raw_root, sessions_root)
+            output_file = write_roles(
+                sessions_root, args.session_id, roles, args.format
+            )
+            msg = f"\nWrote {len(roles)} leadership roles to {output_file}"
+            print(msg)
+        elif args.type == "committee":
+            roles = normalize_committee_roles(args.session_id, raw_root, sessions_root)
+            output_file = write_roles(
+                sessions_root, args.session_id, roles, args.format
+            )
+            msg = f"\nWrote {len(roles)} committee roles to {output_file}"
+            print(msg)
 
 
 if __name__ == "__main__":
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from audit.sources_registry import get_source
+from data.jsonl import read_jsonl
+from data.snapshot import read_snapshot, write_snapshot
+from instrumentation import count, enabled, timed
 from models.core import (
     Session,
     Member,
@@ -26,6 +32,23 @@ class LoadedSession:
     role_assignments: list[RoleAssignment]
 
 
+# Record files a session is built from, as (file stem, top-level key); each is
+# read from `<stem>.jsonl` if present, else from `<stem>.json`
+MEMBER_RECORDS = ("members", "members")
+ROLE_RECORDS = ("roles", "roles")
+MANUAL_ROLE_RECORDS = ("manual_roles", "roles")
+SESSION_RECORDS = (MEMBER_RECORDS, ROLE_RECORDS, MANUAL_ROLE_RECORDS)
+
+
+def session_record_files(session_dir: Path) -> list[Path]:
+    """Every file the loader may read for a session, in both formats"""
+    return [
+        session_dir / f"{stem}{suffix}"
+        for stem, _ in SESSION_RECORDS
+        for suffix in (".jsonl", ".json")
+    ]
+
+
 def _parse_chamber(value: str) -> Chamber:
     """Gets chamber from string"""
     match value.lower():
@@ -61,53 +84,111 @@ def _parse_session_years(session_id: str) -> tuple[int, int]:
     return int(parts[0]), int(parts[1])
 
 
-def load_session(root: Path, session_id: str) -> LoadedSession:
-    """Loads session data from JSON"""
-    session_dir = root / session_id
-    with (session_dir / "members.json").open() as f:
-        mdata: dict[str, Any] = json.load(f)
-    if mdata["session_id"] != session_id:
+def _count_read(path: Path) -> None:
+    """Counts a session file read for the profile report"""
+    if enabled():
+        count("files_read")
+        count("bytes_read", path.stat().st_size)
+
+
+def read_records(session_dir: Path, name: str, key: str) -> Iterator[dict[str, Any]]:
+    """Records from `<name>.jsonl` if present, else from `<name>.json`"""
+    session_id = session_dir.name
+    jsonl_path = session_dir / f"{name}.jsonl"
+    if jsonl_path.exists():
+        _count_read(jsonl_path)
+        yield from read_jsonl(jsonl_path, session_id)
+        return
+    json_path = session_dir / f"{name}.json"
+    _count_read(json_path)
+    with json_path.open() as f:
+        data: dict[str, Any] = json.load(f)
+    if data["session_id"] != session_id:
         raise ValueError(
-            f"members.json session_id mismatch (expected {session_id}, got "
-            f"{mdata['session_id']})"
+            f"{name}.json session_id mismatch (expected {session_id}, got "
+            f"{data['session_id']})"
         )
-    members: dict[str, Member] = {}
-    row: dict[str, str]
-    for row in mdata["members"]:
-        member = Member(
-            member_id=row["member_id"],
-            name=row["name"],
+    yield from data[key]
+
+
+def iter_members(root: Path, session_id: str) -> Iterator[Member]:
+    """Yields a session's members one at a time"""
+    row: dict[str, Any]
+    for row in read_records(root / session_id, *MEMBER_RECORDS):
+        yield Member(
+            member_id=sys.intern(row["member_id"]),
+            name=sys.intern(row["name"]),
             chamber=_parse_chamber(row["chamber"]),
             party=_parse_party(row.get("party", "UNKNOWN")),
             district=row.get("district"),
             distance_miles_from_state_house=row.get("distance_miles_from_state_house"),
         )
-        members[member.member_id] = member
-    with (session_dir / "roles.json").open() as f:
-        rdata: dict[str, Any] = json.load(f)
-    if rdata["session_id"] != session_id:
-        raise ValueError(
-            f"roles.json session_id mismatch (expected {session_id}, got "
-            f"{rdata['session_id']})"
-        )
-    role_assignments: list[RoleAssignment] = []
-    for row in rdata["roles"]:
-        ra = RoleAssignment(
-            member_id=row["member_id"],
-            role_code=row["role_code"],
+
+
+def iter_role_assignments(root: Path, session_id: str) -> Iterator[RoleAssignment]:
+    """Yields a session's scraped roles, then its manual roles"""
+    session_dir = root / session_id
+    session_id = sys.intern(session_id)
+    for row in read_records(session_dir, *ROLE_RECORDS):
+        yield RoleAssignment(
+            member_id=sys.intern(row["member_id"]),
+            role_code=sys.intern(row["role_code"]),
             session_id=session_id,
         )
-        role_assignments.append(ra)
-    with (session_dir / "manual_roles.json").open() as f:
-        mr_data: dict[str, Any] = json.load(f)
-    for row in mr_data["roles"]:
-        mra = RoleAssignment(
-            member_id=row["member_id"],
-            role_code=row["role_code"],
+    for row in read_records(session_dir, *MANUAL_ROLE_RECORDS):
+        yield RoleAssignment(
+            member_id=sys.intern(row["member_id"]),
+            role_code=sys.intern(row["role_code"]),
             session_id=session_id,
             source_id=get_source(row["source_id"]),
         )
-        role_assignments.append(mra)
+
+
+def _intern_strings(loaded: LoadedSession) -> LoadedSession:
+    """Interns member IDs, names and role codes, which unpickling a snapshot
+    does not preserve, so separately loaded sessions share them
+    """
+    interned: dict[int, RoleAssignment] = {}
+
+    def intern_role(ra: RoleAssignment) -> RoleAssignment:
+        new = interned.get(id(ra))
+        if new is None:
+            new = interned[id(ra)] = replace(
+                ra,
+                member_id=sys.intern(ra.member_id),
+                role_code=sys.intern(ra.role_code),
+                session_id=sys.intern(ra.session_id),
+            )
+        return new
+
+    members: dict[str, Member] = {}
+    for member in loaded.members.values():
+        member.member_id = sys.intern(member.member_id)
+        member.name = sys.intern(member.name)
+        member.roles = [intern_role(ra) for ra in member.roles]
+        members[member.member_id] = member
+    return LoadedSession(
+        session=loaded.session,
+        members=members,
+        role_assignments=[intern_role(ra) for ra in loaded.role_assignments],
+    )
+
+
+@timed("load_session")
+def load_session(root: Path, session_id: str, snapshot: bool = True) -> LoadedSession:
+    """Loads session data from JSON or JSON Lines.
+
+    With `snapshot` (the default), a fresh compiled snapshot is used instead
+    of parsing, and a missing or stale one is rebuilt after parsing: this
+    writes `session.snapshot` into the session directory. Pass
+    `snapshot=False` to parse without reading or writing snapshots.
+    """
+    if snapshot:
+        cached = read_snapshot(root, session_id)
+        if cached is not None:
+            return cached
+    members = {member.member_id: member for member in iter_members(root, session_id)}
+    role_assignments = list(iter_role_assignments(root, session_id))
     for ra in role_assignments:
         member = members.get(ra.member_id)
         if member is None:
@@ -120,8 +201,81 @@ def load_session(root: Path, session_id: str) -> LoadedSession:
         end_year=end_year,
         label=f"{start_year}-{end_year}",
     )
-    return LoadedSession(
+    loaded = LoadedSession(
         session=session,
         members=members,
         role_assignments=role_assignments,
     )
+    if snapshot:
+        try:
+            write_snapshot(loaded, root)
+        except OSError:
+            pass
+    return loaded
+
+
+@dataclass(frozen=True)
+class SessionRegistry:
+    """Loaded sessions keyed by session ID, oldest first"""
+
+    sessions: dict[str, LoadedSession]
+
+    def __getitem__(self, session_id: str) -> LoadedSession:
+        return self.sessions[session_id]
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self.sessions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sessions)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def sessions_for_member(self, member_id: str) -> list[str]:
+        """IDs of the sessions a member sat in"""
+        return [
+            sid for sid, loaded in self.sessions.items() if member_id in loaded.members
+        ]
+
+
+def discover_sessions(root: Path) -> list[str]:
+    """IDs of the session directories under `root` that have a roster, oldest
+    first
+    """
+    found: list[tuple[tuple[int, int], str]] = []
+    for path in root.iterdir() if root.is_dir() else ():
+        if not path.is_dir():
+            continue
+        try:
+            years = _parse_session_years(path.name)
+        except ValueError:
+            continue
+        if (path / "members.json").exists() or (path / "members.jsonl").exists():
+            found.append((years, path.name))
+    return [session_id for _, session_id in sorted(found)]
+
+
+def load_sessions(
+    root: Path,
+    session_ids: Optional[Iterable[str]] = None,
+    jobs: Optional[int] = None,
+    snapshot: bool = True,
+) -> SessionRegistry:
+    """Loads several sessions (every discovered one by default) in a thread
+    pool of `jobs` workers. Member IDs, names and role codes are interned, so
+    sessions share one copy of each.
+    """
+    ids = discover_sessions(root) if session_ids is None else list(session_ids)
+    if jobs is None:
+        jobs = min(len(ids), os.cpu_count() or 1)
+
+    def load(session_id: str) -> LoadedSession:
+        return _intern_strings(load_session(root, session_id, snapshot))
+
+    if jobs <= 1 or len(ids) <= 1:
+        loaded = list(map(load, ids))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            loaded = list(pool.map(load, ids))
+    return SessionRegistry(sessions=dict(zip(ids, loaded)))
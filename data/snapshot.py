@@ -0,0 +1,129 @@
+"""Compiled binary session snapshots for fast startup.
+
+A snapshot is a pickled `LoadedSession` (protocol 5) stored next to the
+session's files. Its header records a hash of every input the session is
+built from, including the code that defines the loaded types, so a snapshot
+is only used while it matches the files on disk. Snapshots are local build
+artifacts; never load one from an untrusted source.
+
+`load_session` reads and writes snapshots by default, so loading a session
+leaves `session.snapshot` in its directory (ignored by git); pass
+`snapshot=False` to leave the directory untouched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from instrumentation import count, enabled, timed
+from version import __version__
+
+if TYPE_CHECKING:
+    from data.session_loader import LoadedSession
+
+SNAPSHOT_NAME = "session.snapshot"
+SNAPSHOT_VERSION = 1
+PICKLE_PROTOCOL = 5
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_CODE_FILES = (
+    "audit/provenance.py",
+    "audit/sources_registry.py",
+    "data/jsonl.py",
+    "data/session_loader.py",
+    "data/snapshot.py",
+    "models/core.py",
+)
+
+
+def snapshot_path(root: Path, session_id: str) -> Path:
+    """Where a session's snapshot lives"""
+    return root / session_id / SNAPSHOT_NAME
+
+
+def sources_hash(root: Path, session_id: str) -> str:
+    """Hash of the session files and loader code a snapshot is built from"""
+    # pylint: disable = import-outside-toplevel
+    # session_loader imports this module to read snapshots
+    from data.session_loader import session_record_files
+
+    h = hashlib.sha256(f"{SNAPSHOT_VERSION}:{__version__}".encode("utf-8"))
+    paths = session_record_files(root / session_id)
+    paths += [_REPO_ROOT / name for name in _CODE_FILES]
+    for path in paths:
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes() if path.exists() else b"\0missing")
+    return h.hexdigest()
+
+
+@timed("snapshot.write")
+def write_snapshot(loaded: LoadedSession, root: Path) -> Path:
+    """Compiles a loaded session to its snapshot file"""
+    path = snapshot_path(root, loaded.session.id)
+    header = {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "session_id": loaded.session.id,
+        "sources_hash": sources_hash(root, loaded.session.id),
+    }
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(header, f, protocol=PICKLE_PROTOCOL)
+        pickle.dump(loaded, f, protocol=PICKLE_PROTOCOL)
+    if enabled():
+        count("files_written")
+        count("bytes_written", tmp.stat().st_size)
+    os.replace(tmp, path)
+    return path
+
+
+@timed("snapshot.read")
+def read_snapshot(root: Path, session_id: str) -> Optional[LoadedSession]:
+    """The session from its snapshot, or None if missing or stale"""
+    path = snapshot_path(root, session_id)
+    try:
+        with path.open("rb") as f:
+            header = pickle.load(f)
+            if (
+                header.get("snapshot_version") != SNAPSHOT_VERSION
+                or header.get("session_id") != session_id
+                or header.get("sources_hash") != sources_hash(root, session_id)
+            ):
+                return None
+            loaded = pickle.load(f)
+            if enabled():
+                count("files_read")
+                count("bytes_read", f.tell())
+            return loaded
+    except Exception:  # pylint: disable = broad-except
+        # Unpickling a corrupt or outdated file can raise almost anything;
+        # parsing the session instead is always safe
+        return None
+
+
+def main() -> None:
+    """Compiles snapshots for the given sessions"""
+    # pylint: disable = import-outside-toplevel
+    # session_loader imports this module to read snapshots
+    from data.session_loader import load_session
+
+    parser = argparse.ArgumentParser(description="Compile session snapshots.")
+    parser.add_argument("session_ids", nargs="+", help="Session IDs, e.g. 2025-2026")
+    parser.add_argument(
+        "--data-root",
+        type=Path,
+        default=Path("data/sessions"),
+        help="Root directory containing session data (default: data/sessions)",
+    )
+    args = parser.parse_args()
+    for session_id in args.session_ids:
+        loaded = load_session(args.data_root, session_id, snapshot=False)
+        print(f"wrote {write_snapshot(loaded, args.data_root)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Synthetic session generator for scale and stress testing.
+
+Writes a complete, valid session directory of any size: members, scraped and
+manual roles, adjustment and base salary configs, distance exceptions and
+district centroids. Role counts, role mix, party split and distances follow
+the 2025-2026 session; everything is drawn from a seeded RNG, so the same
+arguments always write the same files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+import random
+from typing import Any, Optional
+
+from config.role_catalog import ROLE_DEFINITIONS
+from data.enrich_distance import (
+    HOUSE_PREFIX_TO_COUNTY,
+    STATE_HOUSE_LAT,
+    STATE_HOUSE_LON,
+    haversine_miles,
+)
+from data.jsonl import write_jsonl
+from models.core import Chamber, RoleDomain
+
+# Roles per member in 2025-2026, by chamber
+ROLE_COUNT_WEIGHTS: dict[Chamber, dict[int, float]] = {
+    Chamber.HOUSE: {0: 51, 1: 106, 2: 2},
+    Chamber.SENATE: {1: 4, 2: 13, 3: 18, 4: 3, 5: 1},
+}
+SENATE_SHARE = 40 / 200
+PARTY_WEIGHTS: dict[Optional[str], float] = {"D": 167, "R": 30, None: 1}
+# Generic committee roles are most of the roles held; named leadership posts
+# are rare
+DOMAIN_WEIGHTS: dict[RoleDomain, float] = {
+    RoleDomain.COMMITTEE: 1.0,
+    RoleDomain.LEADERSHIP: 0.3,
+    RoleDomain.PARTY_LEADERSHIP: 0.3,
+    RoleDomain.OTHER: 0.3,
+}
+GENERIC_ROLE_WEIGHT = 25.0
+MANUAL_ROLE = ("HOUSE_WAYS_MEANS_ASSISTANT_RM", "HOUSE_MINORITY_APPOINTMENT_LETTER")
+MANUAL_ROLE_RATE = 0.05
+EXCEPTION_RATE = 0.02
+# Median and spread of the 2025-2026 distances, capped at the state's extent
+DISTANCE_MEDIAN_MILES = 22.0
+DISTANCE_SIGMA = 0.9
+DISTANCE_RANGE_MILES = (0.3, 125.0)
+
+_FIRST_NAMES = (
+    "Alex Jordan Taylor Morgan Casey Riley Jamie Avery Quinn Peyton Rowan Drew "
+    "Emerson Hayden Reese Sage"
+).split()
+_LAST_NAMES = (
+    "Walsh Murphy Silva Nguyen Oliveira Kelly Pereira Sullivan Tran Moreau "
+    "Brennan Costa Ferreira Doyle"
+).split()
+_HOUSE_PREFIXES = [p for p in HOUSE_PREFIX_TO_COUNTY if p != "BDN"]
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10)
+    return f"{n}{suffix or 'th'}"
+
+
+def _role_pools() -> dict[tuple[Chamber, bool], tuple[list[str], list[float]]]:
+    """(chamber, minority party) -> role codes a member could hold, weighted"""
+    pools: dict[tuple[Chamber, bool], tuple[list[str], list[float]]] = {}
+    for chamber in (Chamber.HOUSE, Chamber.SENATE):
+        for minority in (False, True):
+            codes, weights = [], []
+            for code, rd in ROLE_DEFINITIONS.items():
+                if rd.chamber is None:
+                    weight = GENERIC_ROLE_WEIGHT
+                elif rd.chamber == chamber and ("MINORITY" in code) == minority:
+                    weight = DOMAIN_WEIGHTS[rd.domain]
+                else:
+                    continue
+                codes.append(code)
+                weights.append(weight)
+            pools[(chamber, minority)] = (codes, weights)
+    return pools
+
+
+def _sample_roles(
+    rng: random.Random, codes: list[str], weights: list[float], k: int
+) -> list[str]:
+    """`k` distinct codes drawn by weight"""
+    codes, weights = list(codes), list(weights)
+    picked = []
+    for _ in range(min(k, len(codes))):
+        i = rng.choices(range(len(codes)), weights)[0]
+        picked.append(codes.pop(i))
+        weights.pop(i)
+    return picked
+
+
+def _location(rng: random.Random) -> tuple[float, float]:
+    """A centroid at a realistic distance and random bearing from the State
+    House
+    """
+    low, high = DISTANCE_RANGE_MILES
+    miles = rng.lognormvariate(math.log(DISTANCE_MEDIAN_MILES), DISTANCE_SIGMA)
+    miles = min(max(miles, low), high)
+    bearing = rng.uniform(0, 2 * math.pi)
+    lat = STATE_HOUSE_LAT + miles * math.cos(bearing) / 69.0
+    lon = STATE_HOUSE_LON + miles * math.sin(bearing) / (
+        69.0 * math.cos(math.radians(STATE_HOUSE_LAT))
+    )
+    return round(lat, 6), round(lon, 6)
+
+
+def generate_session(
+    root: Path,
+    session_id: str,
+    n_members: int,
+    seed: int = 0,
+    jsonl: bool = False,
+) -> Path:
+    """Writes a synthetic session of `n_members` to `root/session_id`;
+    returns the session directory
+    """
+    # pylint: disable = too-many-locals
+    rng = random.Random(seed)
+    pools = _role_pools()
+    width = max(6, len(str(n_members)))
+    members: list[dict[str, Any]] = []
+    roles: list[dict[str, Any]] = []
+    manual_roles: list[dict[str, Any]] = []
+    exceptions: dict[str, dict[str, Any]] = {}
+    centroids: dict[str, dict[str, list[float]]] = {"House": {}, "Senate": {}}
+    parties, party_weights = list(PARTY_WEIGHTS), list(PARTY_WEIGHTS.values())
+    for i in range(n_members):
+        member_id = f"SYN{i:0{width}d}"
+        chamber = Chamber.SENATE if rng.random() < SENATE_SHARE else Chamber.HOUSE
+        party = rng.choices(parties, party_weights)[0]
+        county = rng.choice(_HOUSE_PREFIXES)
+        number = len(centroids[chamber.value.title()]) + 1
+        county_name = HOUSE_PREFIX_TO_COUNTY[county].title()
+        district = f"{_ordinal(number)} {county_name}"
+        lat, lon = _location(rng)
+        if chamber == Chamber.HOUSE:
+            centroids["House"][f"{county}{number:02d}"] = [lat, lon]
+        else:
+            centroids["Senate"][district] = [lat, lon]
+        distance = haversine_miles(STATE_HOUSE_LAT, STATE_HOUSE_LON, lat, lon)
+        members.append(
+            {
+                "chamber": chamber.value,
+                "distance_miles_from_state_house": round(distance, 3),
+                "district": district,
+                "member_id": member_id,
+                "name": f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+                "party": party,
+            }
+        )
+        minority = party == "R"
+        counts = ROLE_COUNT_WEIGHTS[chamber]
+        k = rng.choices(list(counts), list(counts.values()))[0]
+        codes, weights = pools[(chamber, minority)]
+        for code in _sample_roles(rng, codes, weights, k):
+            roles.append(
+                {"member_id": member_id, "role_code": code, "session_id": session_id}
+            )
+        if chamber == Chamber.HOUSE and minority and rng.random() < MANUAL_ROLE_RATE:
+            code, source_id = MANUAL_ROLE
+            manual_roles.append(
+                {
+                    "member_id": member_id,
+                    "role_code": code,
+                    "session_id": session_id,
+                    "source_id": source_id,
+                }
+            )
+        if distance <= 50 and rng.random() < EXCEPTION_RATE:
+            exceptions[member_id] = {
+                "override_reason": "Synthetic residence beyond 50 miles",
+                "source": f"https://example.org/synthetic/{member_id}",
+            }
+    session_dir = root / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
+    for name, key, records in (
+        ("members", "members", members),
+        ("roles", "roles", roles),
+        ("manual_roles", "roles", manual_roles),
+    ):
+        if jsonl:
+            write_jsonl(session_dir / f"{name}.jsonl", session_id, records)
+            (session_dir / f"{name}.json").unlink(missing_ok=True)
+        else:
+            _write_json(
+                session_dir / f"{name}.json", {"session_id": session_id, key: records}
+            )
+            (session_dir / f"{name}.jsonl").unlink(missing_ok=True)
+    _write_json(
+        session_dir / "adjustment.json",
+        {
+            "session_id": session_id,
+            "aggregate_change_factor": 1.4954,
+            "note": "Synthetic session",
+        },
+    )
+    _write_json(
+        session_dir / "base_salary.json",
+        {
+            "session_id": session_id,
+            "base_amount": 82046,
+            "aggregate_change_factor": 1.3116,
+            "components": [],
+            "note": "Synthetic session",
+        },
+    )
+    _write_json(session_dir / "distance_exceptions.json", exceptions)
+    _write_json(session_dir / "district_centroids.json", centroids)
+    return session_dir
+
+
+def _write_json(path: Path, data: Any) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def main() -> None:
+    """Writes a synthetic session"""
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic session for scale and stress testing"
+    )
+    parser.add_argument("n_members", type=int, help="Number of members")
+    parser.add_argument(
+        "--session-id", default="2025-2026", help="Session ID (default: 2025-2026)"
+    )
+    parser.add_argument(
+        "--root",
+        default="data/synthetic",
+        help="Root directory to write the session under (default: data/synthetic)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    parser.add_argument(
+        "--jsonl", action="store_true", help="Write members and roles as JSON Lines"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Overwrite an existing session directory"
+    )
+    args = parser.parse_args()
+    session_dir = Path(args.root) / args.session_id
+    if session_dir.exists() and not args.force:
+        raise SystemExit(f"{session_dir} exists; pass --force to overwrite")
+    generate_session(
+        Path(args.root), args.session_id, args.n_members, args.seed, args.jsonl
+    )
+    print(f"[OK] Wrote {args.n_members} synthetic members to {session_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,25 @@ Run this file from the root to scrape once.
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import json
-from time import sleep
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional
 
 from bs4 import BeautifulSoup
 
-from ingest.common import get_soup
+from ingest.common import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE_PER_SECOND,
+    AsyncFetcher,
+    TokenBucket,
+    add_cache_arguments,
+    apply_cache_arguments,
+    get_soup,
+)
+from instrumentation import add_profile_report_argument, profile_report
 
 
 @dataclass
@@ -65,14 +75,10 @@ def _extract_committee_name_and_id(li: BeautifulSoup) -> tuple[str, str]:
     return name, cid
 
 
-def scrape_committees_for_member(
-    member_id: str, session_id: str
+def parse_committee_roles(
+    soup: BeautifulSoup, member_id: str, session_id: str
 ) -> list[RawCommitteeRole]:
-    """Scrape `/Legislators/Profile/<ID>/Committees` for a single member,
-    assuming the default view is the current session (e.g. 194th).
-    """
-    path = f"/Legislators/Profile/{member_id}/Committees"
-    soup = get_soup(path)
+    """Extract committee roles from a member's committees page"""
     roles: list[RawCommitteeRole] = []
     for li in soup.find_all("li"):
         committee_name, committee_id = _extract_committee_name_and_id(li)
@@ -91,32 +97,181 @@ def scrape_committees_for_member(
     return roles
 
 
+def _committees_path(member_id: str) -> str:
+    return f"/Legislators/Profile/{member_id}/Committees"
+
+
+def scrape_committees_for_member(
+    member_id: str, session_id: str
+) -> list[RawCommitteeRole]:
+    """Scrape `/Legislators/Profile/<ID>/Committees` for a single member,
+    assuming the default view is the current session (e.g. 194th).
+    """
+    soup = get_soup(_committees_path(member_id))
+    return parse_committee_roles(soup, member_id, session_id)
+
+
+async def scrape_committees_for_member_async(
+    fetcher: AsyncFetcher, member_id: str, session_id: str
+) -> list[RawCommitteeRole]:
+    """Async variant of `scrape_committees_for_member`"""
+    html = await fetcher.fetch_html(_committees_path(member_id))
+    soup = BeautifulSoup(html, "html.parser")
+    return parse_committee_roles(soup, member_id, session_id)
+
+
+CHECKPOINT_NAME = "committee_roles_raw.checkpoint.jsonl"
+
+
+def read_checkpoint(path: Path) -> dict[str, int]:
+    """Byte offset of each completed member's line in a checkpoint.
+
+    A torn final line from an interrupted write is ignored, and truncated so
+    the next append starts on a clean line.
+    """
+    offsets: dict[str, int] = {}
+    if not path.exists():
+        return offsets
+    with path.open("rb+") as f:
+        offset = 0
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                f.truncate(offset)
+                break
+            offsets[record["member_id"]] = offset
+            offset += len(line)
+    return offsets
+
+
+async def scrape_all_committees(
+    fetcher: AsyncFetcher,
+    session_id: str,
+    member_ids: list[str],
+    checkpoint: Optional[Path] = None,
+) -> list[RawCommitteeRole]:
+    """Scrape every member concurrently; results keep `member_ids` order.
+
+    With a `checkpoint`, each member's roles are appended to it as one JSON
+    line as soon as they arrive; members already in it are skipped and not
+    returned.
+    """
+    completed = read_checkpoint(checkpoint) if checkpoint is not None else {}
+    pending = [mid for mid in member_ids if mid not in completed]
+    done = len(member_ids) - len(pending)
+    sink = checkpoint.open("a", encoding="utf-8") if checkpoint is not None else None
+
+    async def one(mid: str) -> list[RawCommitteeRole]:
+        nonlocal done
+        roles = await scrape_committees_for_member_async(fetcher, mid, session_id)
+        if sink is not None:
+            record = {"member_id": mid, "roles": [asdict(r) for r in roles]}
+            sink.write(json.dumps(record) + "\n")
+            sink.flush()
+        done += 1
+        print(f"{round(done / len(member_ids) * 100, 2)}% done")
+        return roles
+
+    try:
+        per_member = await asyncio.gather(*(one(mid) for mid in pending))
+    finally:
+        if sink is not None:
+            sink.close()
+    return [r for roles in per_member for r in roles]
+
+
+def _write_roles_from_checkpoint(
+    checkpoint: Path, member_ids: list[str], out_path: Path
+) -> None:
+    """Streams checkpointed roles into a JSON array, in `member_ids` order"""
+    offsets = read_checkpoint(checkpoint)
+    first = True
+    tmp = out_path.with_suffix(".json.tmp")
+    with checkpoint.open("rb") as src, tmp.open("w", encoding="utf-8") as out:
+        out.write("[")
+        for mid in member_ids:
+            src.seek(offsets[mid])
+            for role in json.loads(src.readline())["roles"]:
+                item = json.dumps(role, indent=2).replace("\n", "\n  ")
+                out.write(("\n  " if first else ",\n  ") + item)
+                first = False
+        out.write("]" if first else "\n]")
+    tmp.replace(out_path)
+
+
 def dump_committees_raw(
     session_id: str,
     member_ids: list[str],
     out_root: Path = Path("data/raw"),
+    fetcher: Optional[AsyncFetcher] = None,
+    resume: bool = True,
 ) -> Path:
-    """Scrape committees for ALL members and write JSON file."""
+    """Scrape committees for ALL members and write JSON file.
+
+    Progress is checkpointed per member, so a rerun after a failure only
+    scrapes the members that are missing; pass `resume=False` to start over.
+    The checkpoint is removed once the JSON file is written.
+    """
     out_dir = out_root / session_id
     out_dir.mkdir(parents=True, exist_ok=True)
-    all_roles: list[dict] = []
-    for idx, mid in enumerate(member_ids):
-        print(f"{round((idx + 1) / len(member_ids) * 100, 2)}% done")
-        roles = scrape_committees_for_member(mid, session_id)
-        all_roles.extend(asdict(r) for r in roles)
-        sleep(0.25)
+    checkpoint = out_dir / CHECKPOINT_NAME
+    if not resume:
+        checkpoint.unlink(missing_ok=True)
+
+    async def run() -> None:
+        if fetcher is not None:
+            await scrape_all_committees(fetcher, session_id, member_ids, checkpoint)
+            return
+        async with AsyncFetcher() as owned:
+            await scrape_all_committees(owned, session_id, member_ids, checkpoint)
+
+    asyncio.run(run())
     out_path = out_dir / "committee_roles_raw.json"
-    out_path.write_text(json.dumps(all_roles, indent=2), encoding="utf-8")
+    _write_roles_from_checkpoint(checkpoint, member_ids, out_path)
+    checkpoint.unlink()
     return out_path
 
 
 def main() -> None:
     """Generates the raw committee JSON"""
-    members_raw = json.loads(
-        Path("data/raw/2025-2026/members_raw.json").read_text("utf-8")
+    parser = argparse.ArgumentParser(description="Scrape raw committee roles.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Requests in flight at once (default: {DEFAULT_CONCURRENCY})",
     )
-    member_ids = [m["member_id"] for m in members_raw]
-    dump_committees_raw("2025-2026", member_ids)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE_PER_SECOND,
+        help=f"Max requests per second (default: {DEFAULT_RATE_PER_SECOND})",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard any checkpoint from an interrupted run and scrape everyone",
+    )
+    add_cache_arguments(parser)
+    add_profile_report_argument(parser)
+    args = parser.parse_args()
+    with profile_report(args.profile_report):
+        apply_cache_arguments(args)
+        members_raw = json.loads(
+            Path("data/raw/2025-2026/members_raw.json").read_text("utf-8")
+        )
+        member_ids = [m["member_id"] for m in members_raw]
+        fetcher = AsyncFetcher(
+            concurrency=args.concurrency,
+            limiter=TokenBucket(args.rate, burst=args.concurrency),
+        )
+        try:
+            dump_committees_raw(
+                "2025-2026", member_ids, fetcher=fetcher, resume=not args.restart
+            )
+        finally:
+            fetcher.close()
 
 
 if __name__ == "__main__":
@@ -2,25 +2,202 @@
 
 from __future__ import annotations
 
-from time import sleep
-from typing import Final
+import argparse
+import asyncio
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep
+from typing import Final, Iterable, Literal, Optional, Union
 from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from ingest.http_cache import (
+    CACHE_ROOT,
+    CachedResponse,
+    OfflineCacheMiss,
+    ResponseCache,
+)
+from instrumentation import count, timed
 
 BASE_URL: Final = "https://malegislature.gov"
+DEFAULT_RATE_PER_SECOND: Final = 2.0
+DEFAULT_CONCURRENCY: Final = 4
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Holds at most `burst` tokens and refills at `rate` tokens per second;
+    `acquire` blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token, returning how long the caller must wait for it"""
+        with self._lock:
+            now = monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
 
+    def acquire(self) -> None:
+        """Blocks until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            sleep(wait)
 
-def fetch_html(path_or_url: str, *, delay_seconds: float = 0.5) -> str:
-    """Fetch a page relative to the URL"""
+
+RATE_LIMITER = TokenBucket(DEFAULT_RATE_PER_SECOND, burst=2)
+"""Shared by every scraper so malegislature.gov sees one polite client"""
+
+
+def resolve_url(path_or_url: str, base_url: str = BASE_URL) -> str:
+    """Absolute URL for a path on the legislature site"""
     if path_or_url.startswith("http"):
-        url = path_or_url
-    else:
-        url = urljoin(BASE_URL, path_or_url)
-    resp = requests.get(url, timeout=30)
+        return path_or_url
+    return urljoin(base_url, path_or_url)
+
+
+def make_http_session(pool_size: int = DEFAULT_CONCURRENCY) -> requests.Session:
+    """A keep-alive session whose connection pool fits `pool_size` workers"""
+    http = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    return http
+
+
+_HTTP_SESSION: Optional[requests.Session] = None
+
+HTTP_CACHE: Optional[ResponseCache] = ResponseCache(CACHE_ROOT)
+"""Default response cache; None disables caching"""
+
+OFFLINE: bool = False
+"""When True, pages are only replayed from the cache"""
+
+
+class _Default(Enum):
+    CACHE = "default cache"
+
+
+DEFAULT_CACHE: Final = _Default.CACHE
+"""Stands for `HTTP_CACHE` as it is when a page is fetched; pass None instead
+to bypass the cache for one call
+"""
+
+CacheArg = Union[ResponseCache, None, Literal[_Default.CACHE]]
+
+
+def _resolve_cache(cache: CacheArg) -> Optional[ResponseCache]:
+    return HTTP_CACHE if cache is DEFAULT_CACHE else cache
+
+
+def configure_http_cache(
+    cache: Optional[ResponseCache] = HTTP_CACHE, offline: bool = False
+) -> None:
+    """Sets the default cache and offline mode for every scraper"""
+    global HTTP_CACHE, OFFLINE  # pylint: disable = global-statement
+    HTTP_CACHE = cache
+    OFFLINE = offline
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the response-cache flags shared by the scraper CLIs"""
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Replay pages from the response cache without touching the network",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the response cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(CACHE_ROOT),
+        help=f"Response cache directory (default: {CACHE_ROOT})",
+    )
+
+
+def apply_cache_arguments(args: argparse.Namespace) -> None:
+    """Configures the default cache from parsed `add_cache_arguments` flags"""
+    if args.offline and args.no_cache:
+        raise SystemExit("--offline needs the cache; drop --no-cache")
+    cache = None if args.no_cache else ResponseCache(Path(args.cache_dir))
+    configure_http_cache(cache, offline=args.offline)
+
+
+def _shared_http_session() -> requests.Session:
+    global _HTTP_SESSION  # pylint: disable = global-statement
+    if _HTTP_SESSION is None:
+        _HTTP_SESSION = make_http_session()
+    return _HTTP_SESSION
+
+
+@timed("fetch_html")
+def fetch_html(
+    path_or_url: str,
+    *,
+    base_url: str = BASE_URL,
+    http: Optional[requests.Session] = None,
+    limiter: Optional[TokenBucket] = None,
+    cache: CacheArg = DEFAULT_CACHE,
+    offline: Optional[bool] = None,
+) -> str:
+    """Fetch a page relative to the URL.
+
+    Cached pages are revalidated with a conditional request; a 304 replays the
+    cached body. Offline, only the cache is consulted. `cache=None` neither
+    reads nor writes the cache.
+    """
+    url = resolve_url(path_or_url, base_url)
+    cache = _resolve_cache(cache)
+    offline = OFFLINE if offline is None else offline
+    cached = cache.get(url) if cache is not None else None
+    if offline:
+        if cached is None:
+            raise OfflineCacheMiss(f"{url} is not in the response cache")
+        count("http_cache_replays")
+        return cached.text
+    headers = cached.conditional_headers() if cached is not None else {}
+    (limiter or RATE_LIMITER).acquire()
+    resp = (http or _shared_http_session()).get(url, headers=headers, timeout=30)
+    count("http_requests")
+    if resp.status_code == 304:
+        if cached is None:
+            raise requests.HTTPError(
+                f"{url} answered 304 Not Modified but is not cached", response=resp
+            )
+        count("http_not_modified")
+        return cached.text
     resp.raise_for_status()
-    sleep(delay_seconds)
+    count("http_bytes", len(resp.content))
+    if cache is not None:
+        cache.put(
+            CachedResponse(
+                url=url,
+                text=resp.text,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+        )
     return resp.text
 
 
@@ -28,3 +205,57 @@ def get_soup(path_or_url: str) -> BeautifulSoup:
     """Gets the structured content of a page"""
     html = fetch_html(path_or_url)
     return BeautifulSoup(html, "html.parser")
+
+
+class AsyncFetcher:
+    """Fetches pages concurrently over one pooled HTTP session.
+
+    At most `concurrency` requests are in flight, and every request waits on
+    the shared rate limiter. Blocking `requests` calls run in worker threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = BASE_URL,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limiter: Optional[TokenBucket] = None,
+        cache: CacheArg = DEFAULT_CACHE,
+        offline: Optional[bool] = None,
+    ) -> None:
+        self.base_url = base_url
+        self.concurrency = max(concurrency, 1)
+        self.limiter = limiter or RATE_LIMITER
+        self.cache = _resolve_cache(cache)
+        self.offline = OFFLINE if offline is None else offline
+        self._http = make_http_session(self.concurrency)
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> AsyncFetcher:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes pooled connections"""
+        self._http.close()
+
+    async def fetch_html(self, path_or_url: str) -> str:
+        """Fetch one page"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        async with self._slots:
+            return await asyncio.to_thread(
+                fetch_html,
+                path_or_url,
+                base_url=self.base_url,
+                http=self._http,
+                limiter=self.limiter,
+                cache=self.cache,
+                offline=self.offline,
+            )
+
+    async def fetch_all(self, paths: Iterable[str]) -> list[str]:
+        """Fetch many pages, returned in the order requested"""
+        return await asyncio.gather(*(self.fetch_html(p) for p in paths))
@@ -0,0 +1,69 @@
+"""On-disk HTTP response cache for the scrapers.
+
+Responses are stored per URL with their ETag/Last-Modified validators so
+reruns can send conditional requests, and so pages can be replayed offline.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import get_ident
+from typing import Optional
+
+CACHE_ROOT = Path("data/raw/.cache")
+
+
+class OfflineCacheMiss(LookupError):
+    """Raised in offline mode when a URL has never been cached"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached page body plus its validators"""
+
+    url: str
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer 304 Not Modified"""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """One JSON file per URL under `root`, named by the URL's hash"""
+
+    def __init__(self, root: Path = CACHE_ROOT) -> None:
+        self.root = root
+
+    def path_for(self, url: str) -> Path:
+        """Where the entry for `url` lives"""
+        return self.root / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Cached response for `url`, if any"""
+        path = self.path_for(url)
+        if not path.exists():
+            return None
+        data: dict = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("url") != url:
+            return None
+        return CachedResponse(**data)
+
+    def put(self, entry: CachedResponse) -> None:
+        """Stores an entry, replacing the old one atomically"""
+        path = self.path_for(entry.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        tmp.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        os.replace(tmp, path)
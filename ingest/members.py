@@ -10,8 +10,9 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
-from ingest.common import get_soup
+from ingest.common import add_cache_arguments, apply_cache_arguments, get_soup
 from ingest.types import RawMember, RawLeadershipRole, to_dict_list
+from instrumentation import add_profile_report_argument, profile_report
 
 
 BASE_URL: Final = "https://malegislature.gov"
@@ -236,12 +237,16 @@ def main() -> None:
         default="data/raw",
         help="Root directory for raw JSON outputs (default: data/raw)",
     )
+    add_cache_arguments(parser)
+    add_profile_report_argument(parser)
     args = parser.parse_args()
-    out_root = Path(args.out_root)
-    m_path = dump_members_raw(args.session_id, out_root=out_root)
-    print(f"wrote members_raw.json to {m_path}")
-    l_path = dump_leadership_raw(args.session_id, out_root=out_root)
-    print(f"wrote leadership_raw.json to {l_path}")
+    with profile_report(args.profile_report):
+        apply_cache_arguments(args)
+        out_root = Path(args.out_root)
+        m_path = dump_members_raw(args.session_id, out_root=out_root)
+        print(f"wrote members_raw.json to {m_path}")
+        l_path = dump_leadership_raw(args.session_id, out_root=out_root)
+        print(f"wrote leadership_raw.json to {l_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,356 @@
+"""Lightweight timers and counters for the pipeline's hot paths.
+
+Recording is off by default: a `timed` function then costs one flag check
+per call, `stage` hands back a shared no-op context and `count` returns
+immediately. `enable()`, or `--profile-report` on the CLIs, turns recording
+on; the report gives each stage's wall time and call count (nested stages
+are inclusive) and counters such as files read and bytes written. Work done
+in worker processes (`--jobs`) is not recorded.
+
+`--profile` and `--trace-memory` wrap a whole CLI run in cProfile and
+tracemalloc instead, writing pstats, flamegraph stacks and allocation
+snapshots to `--profile-dir`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+import cProfile
+import functools
+import json
+from pathlib import Path
+import pstats
+import sys
+import threading
+from time import perf_counter
+from types import CodeType
+import tracemalloc
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_enabled = False
+_lock = threading.Lock()
+_calls: defaultdict[str, int] = defaultdict(int)
+_seconds: defaultdict[str, float] = defaultdict(float)
+_counters: defaultdict[str, int] = defaultdict(int)
+
+DEFAULT_PROFILE_DIR = "profiling"
+MEMORY_TRACE_FRAMES = 25
+MEMORY_TOP = 25
+SAMPLE_INTERVAL = 0.001
+
+
+def enabled() -> bool:
+    """Whether timings and counters are being recorded"""
+    return _enabled
+
+
+def enable() -> None:
+    """Starts recording"""
+    global _enabled  # pylint: disable = global-statement
+    _enabled = True
+
+
+def disable() -> None:
+    """Stops recording; what was recorded is kept until `reset`"""
+    global _enabled  # pylint: disable = global-statement
+    _enabled = False
+
+
+def reset() -> None:
+    """Drops everything recorded so far"""
+    with _lock:
+        _calls.clear()
+        _seconds.clear()
+        _counters.clear()
+
+
+def _record(name: str, seconds: float) -> None:
+    with _lock:
+        _calls[name] += 1
+        _seconds[name] += seconds
+
+
+def count(name: str, n: int = 1) -> None:
+    """Adds `n` to a counter"""
+    if _enabled:
+        with _lock:
+            _counters[name] += n
+
+
+class _Stage:
+    """Times one pass through a `with` block"""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> _Stage:
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        _record(self.name, perf_counter() - self.start)
+
+
+class _NoStage:
+    """Stand-in for `_Stage` while recording is off"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoStage:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name: str) -> _Stage | _NoStage:
+    """Context manager timing a block as stage `name`"""
+    return _Stage(name) if _enabled else _NO_STAGE
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of a function as stage `name`"""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def report() -> dict[str, Any]:
+    """Stages (slowest first) and counters recorded so far"""
+    with _lock:
+        stages = {
+            name: {"calls": _calls[name], "seconds": _seconds[name]}
+            for name in sorted(_seconds, key=_seconds.__getitem__, reverse=True)
+        }
+        return {"stages": stages, "counters": dict(sorted(_counters.items()))}
+
+
+def format_report(data: Optional[dict[str, Any]] = None) -> str:
+    """The report as a table"""
+    data = report() if data is None else data
+    lines = [f"{'Stage':<36}{'Calls':>10}{'Total ms':>12}{'Per call ms':>14}"]
+    for name, s in data["stages"].items():
+        per_call = s["seconds"] / s["calls"] * 1000 if s["calls"] else 0.0
+        lines.append(
+            f"{name:<36}{s['calls']:>10,}{s['seconds'] * 1000:>12.2f}{per_call:>14.4f}"
+        )
+    if data["counters"]:
+        lines.append("")
+        lines.append(f"{'Counter':<36}{'Value':>10}")
+        lines.extend(f"{k:<36}{v:>10,}" for k, v in data["counters"].items())
+    return "\n".join(lines)
+
+
+def add_profile_report_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds `--profile-report [PATH]` to a CLI"""
+    parser.add_argument(
+        "--profile-report",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="Print per-stage timings and counters, or write them as JSON to PATH",
+    )
+
+
+@contextmanager
+def profile_report(destination: Optional[str]) -> Iterator[None]:
+    """Records the block and then prints the report to stderr (`destination`
+    "-") or writes it as JSON; does nothing if `destination` is None
+    """
+    if destination is None:
+        yield
+        return
+    reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+        if destination == "-":
+            print(format_report(), file=sys.stderr)
+        else:
+            path = Path(destination)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report(), indent=2), encoding="utf-8")
+            print(f"[OK] Wrote {path}", file=sys.stderr)
+
+
+def _frame_label(code: CodeType) -> str:
+    label = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+    return label.replace(";", ",")
+
+
+class StackSampler(threading.Thread):
+    """Samples another thread's call stack at a fixed interval, counting each
+    distinct stack; cProfile only records caller/callee pairs, so this is
+    what the collapsed stacks come from
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        super().__init__(name="stack-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        # pylint: disable = protected-access
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        """Stops sampling and waits for the thread to finish"""
+        self._done.set()
+        self.join()
+
+
+def collapsed_stacks(samples: Counter[str]) -> str:
+    """Sampled stacks as "outer;...;inner count" lines, the input format of
+    flamegraph.pl, speedscope and similar tools
+    """
+    return "".join(f"{stack} {n}\n" for stack, n in sorted(samples.items()))
+
+
+@contextmanager
+def cprofile(directory: Path, name: str) -> Iterator[None]:
+    """Profiles the block with cProfile, writing `name.pstats`, and samples
+    its stacks every `SAMPLE_INTERVAL` seconds, writing `name.collapsed`, to
+    `directory`
+    """
+    switch_interval = sys.getswitchinterval()
+    # The sampler needs the GIL at least as often as it samples
+    sys.setswitchinterval(min(switch_interval, SAMPLE_INTERVAL))
+    sampler = StackSampler(threading.get_ident())
+    profiler = cProfile.Profile()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+        directory.mkdir(parents=True, exist_ok=True)
+        pstats.Stats(profiler).dump_stats(directory / f"{name}.pstats")
+        (directory / f"{name}.collapsed").write_text(
+            collapsed_stacks(sampler.samples), encoding="utf-8"
+        )
+        print(
+            f"[OK] Wrote {directory / name}.pstats and {name}.collapsed",
+            file=sys.stderr,
+        )
+
+
+def format_memory_report(
+    snapshot: tracemalloc.Snapshot, current: int, peak: int, top: int = MEMORY_TOP
+) -> str:
+    """Traced totals and the largest live allocations by line and by
+    traceback
+    """
+    lines = [
+        f"Traced memory at exit: {current / 1024:,.1f} KiB; "
+        f"peak: {peak / 1024:,.1f} KiB",
+        "",
+        f"Top {top} allocations by line:",
+    ]
+    by_line = snapshot.statistics("lineno")
+    lines.extend(f"  {stat}" for stat in by_line[:top])
+    lines.append("")
+    lines.append("Largest allocations by traceback:")
+    for stat in snapshot.statistics("traceback")[:3]:
+        lines.append(f"  {stat.count:,} blocks, {stat.size / 1024:,.1f} KiB")
+        lines.extend(f"    {line}" for line in stat.traceback.format())
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def trace_memory(directory: Path, name: str) -> Iterator[None]:
+    """Traces allocations in the block with tracemalloc; writes the final
+    snapshot to `name.tracemalloc` and its top allocations to
+    `name.memory.txt` in `directory`
+    """
+    tracemalloc.start(MEMORY_TRACE_FRAMES)
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot = snapshot.filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        snapshot.dump(str(directory / f"{name}.tracemalloc"))
+        (directory / f"{name}.memory.txt").write_text(
+            format_memory_report(snapshot, current, peak), encoding="utf-8"
+        )
+        print(
+            f"[OK] Wrote {directory / name}.tracemalloc and {name}.memory.txt",
+            file=sys.stderr,
+        )
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds `--profile-report`, `--profile`, `--trace-memory` and
+    `--profile-dir` to a CLI
+    """
+    add_profile_report_argument(parser)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under cProfile; writes pstats and collapsed stacks to --profile-dir",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Trace allocations; writes a tracemalloc snapshot and its top "
+        "allocations to --profile-dir",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help=f"Directory for profiling output (default: {DEFAULT_PROFILE_DIR})",
+    )
+
+
+@contextmanager
+def profiling(args: argparse.Namespace, name: str) -> Iterator[None]:
+    """Applies the options from `add_profiling_arguments` to the block; files
+    are named after `name`
+    """
+    directory = Path(args.profile_dir)
+    with ExitStack() as stack:
+        stack.enter_context(profile_report(args.profile_report))
+        if args.trace_memory:
+            stack.enter_context(trace_memory(directory, name))
+        if args.profile:
+            stack.enter_context(cprofile(directory, name))
+        yield
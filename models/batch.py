@@ -0,0 +1,79 @@
+"""Computes compensation for every member of a session in one pass"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from config.session_config import SessionConfig, get_session_config
+from data.session_loader import LoadedSession
+from instrumentation import timed
+from models.core import Session
+from models.total_comp import TotalCompResult, session_rules, total_comp_for_member
+
+
+@dataclass(frozen=True)
+class SessionComp:
+    """Columnar compensation results for a session, indexed by member.
+
+    Row `i` of every array belongs to `member_ids[i]`; `results[i]` keeps the
+    full provenance-carrying result for tools that need more than the totals.
+    """
+
+    session: Session
+    member_ids: tuple[str, ...]
+    index: dict[str, int]
+    base_salary: np.ndarray
+    stipends_9b: np.ndarray
+    travel_9c: np.ndarray
+    total: np.ndarray
+    results: tuple[TotalCompResult, ...]
+
+    def __len__(self) -> int:
+        return len(self.member_ids)
+
+    def result_for(self, member_id: str) -> TotalCompResult:
+        """Full result for a single member"""
+        return self.results[self.index[member_id]]
+
+
+@timed("compute_session")
+def compute_session(
+    loaded: LoadedSession,
+    config: Optional[SessionConfig] = None,
+    member_ids: Optional[Iterable[str]] = None,
+) -> SessionComp:
+    """Computes base, 9B, 9C and total comp for every member in a session,
+    or only for `member_ids` if given
+    """
+    session = loaded.session
+    if config is None:
+        config = get_session_config(session.id)
+    member_ids = tuple(loaded.members if member_ids is None else member_ids)
+    n = len(member_ids)
+    base_salary = np.zeros(n, dtype=np.int64)
+    stipends_9b = np.zeros(n, dtype=np.int64)
+    travel_9c = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n, dtype=np.int64)
+    results: list[TotalCompResult] = []
+    rules = session_rules(config)
+    for i, member_id in enumerate(member_ids):
+        member = loaded.members[member_id]
+        res = total_comp_for_member(member, session, config, rules=rules)
+        base_salary[i] = res.components[0].amount.value
+        stipends_9b[i] = res.components[1].amount.value
+        travel_9c[i] = res.components[2].amount.value
+        total[i] = res.total.value
+        results.append(res)
+    return SessionComp(
+        session=session,
+        member_ids=member_ids,
+        index={mid: i for i, mid in enumerate(member_ids)},
+        base_salary=base_salary,
+        stipends_9b=stipends_9b,
+        travel_9c=travel_9c,
+        total=total,
+        results=tuple(results),
+    )
@@ -47,6 +47,10 @@ class CommitteeRoleType(Enum):
     MEMBER = auto()
 
 
+FIRST_BIENNIAL_COURT = 142
+FIRST_BIENNIAL_YEAR = 1921
+
+
 @dataclass(frozen=True)
 class Session:
     """A legislative session"""
@@ -58,17 +62,20 @@ class Session:
 
     @staticmethod
     def from_id_number(session: int) -> Session:
-        """Generates session ID from General Court #"""
-        sessions: dict[int, str] = {
-            0: "0-1",  # demo
-            194: "2025-2026",
-        }
-        if session not in sessions:
+        """Generates session ID from General Court #.
+
+        General Courts have been biennial since the 142nd (1921-1922); court 0
+        is the demo session.
+        """
+        if session == 0:
+            return Session(id="0-1", start_year=0, end_year=1)
+        if session < FIRST_BIENNIAL_COURT:
             raise IndexError(f"Session #{session} not recognized.")
+        start_year = FIRST_BIENNIAL_YEAR + 2 * (session - FIRST_BIENNIAL_COURT)
         return Session(
-            id=sessions[session],
-            start_year=sessions[session].split("-")[0],
-            end_year=sessions[session].split("-")[1],
+            id=f"{start_year}-{start_year + 1}",
+            start_year=start_year,
+            end_year=start_year + 1,
         )
 
 
@@ -167,30 +174,16 @@ class StipendTierCode(str, Enum):
     @staticmethod
     def get_base_amount(tier_id: StipendTierCode) -> AmountWithProvenance:
         """Get the base amount for the stipend tier"""
-        tier_amounts: dict[StipendTierCode, AmountWithProvenance] = {
-            StipendTierCode.TIER_80K: AmountWithProvenance(
-                80_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_65K: AmountWithProvenance(
-                65_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_60K: AmountWithProvenance(
-                60_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_50K: AmountWithProvenance(
-                50_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_35K: AmountWithProvenance(
-                35_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_30K: AmountWithProvenance(
-                30_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_15K: AmountWithProvenance(
-                15_000, frozenset([MGL_3_9B])
-            ),
-            StipendTierCode.TIER_5200: AmountWithProvenance(
-                5_200, frozenset([MGL_3_9B])
-            ),
-        }
-        return tier_amounts[tier_id]
+        return _BASE_TIER_AMOUNTS[tier_id]
+
+
+_BASE_TIER_AMOUNTS: dict[StipendTierCode, AmountWithProvenance] = {
+    StipendTierCode.TIER_80K: AmountWithProvenance(80_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_65K: AmountWithProvenance(65_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_60K: AmountWithProvenance(60_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_50K: AmountWithProvenance(50_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_35K: AmountWithProvenance(35_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_30K: AmountWithProvenance(30_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_15K: AmountWithProvenance(15_000, frozenset([MGL_3_9B])),
+    StipendTierCode.TIER_5200: AmountWithProvenance(5_200, frozenset([MGL_3_9B])),
+}
@@ -4,13 +4,19 @@ stipends.
 
 from __future__ import annotations
 
-from itertools import combinations
+from heapq import nlargest
+from itertools import accumulate
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
-from audit.provenance import AmountWithProvenance, ap_scale, SourceRef, ap_source
+from audit.provenance import (
+    AmountWithProvenance,
+    SourceRef,
+    ap_source,
+    mask_of,
+    sources_for_mask,
+)
 from audit.sources_registry import (
-    STIPEND_AMOUNT_ADJUSTMENT,
     SENATE_RULES_11E,
     HOUSE_RULES_18,
 )
@@ -18,15 +24,11 @@ from models.core import (
     RoleAssignment,
     Session,
     Member,
-    StipendTierCode,
-    RoleCode,
-    CommitteeRoleType,
     Chamber,
 )
-from config.role_catalog import (
-    get_role_definition,
-)
-from config.comp_adjustment import load_stipend_adjustment
+from config.role_table import RoleTable
+from config.session_config import SessionConfig, get_session_config
+from instrumentation import timed
 
 
 @dataclass(frozen=True)
@@ -95,71 +97,156 @@ def get_chamber_rules(chamber: Chamber) -> ChamberRules:
     )
 
 
-def _session_adjustment_factor(session: Session) -> float:
-    """Add adjustments to stipend tiers"""
-    adj = load_stipend_adjustment(session.id)
-    return adj.factor
-
-
-def _is_committee_chair(role_code: RoleCode) -> bool:
-    rd = get_role_definition(role_code)
-    return rd.committee_role_type == CommitteeRoleType.CHAIR
+def _role_table(session: Session, config: Optional[SessionConfig] = None) -> RoleTable:
+    """Compiled roles at the session's stipend adjustment factor"""
+    if config is None:
+        config = get_session_config(session.id)
+    return config.role_table
 
 
 def stipend_for_role_assignment(
-    assignment: RoleAssignment, session: Session
+    assignment: RoleAssignment,
+    session: Session,
+    config: Optional[SessionConfig] = None,
+    table: Optional[RoleTable] = None,
 ) -> Optional[RoleStipend]:
     """Compute the stipend based on role, session, and adjustment factor"""
-    role_def = get_role_definition(assignment.role_code)
-    tier_id = role_def.stipend_tier_id
-    if tier_id is None:
+    if table is None:
+        table = _role_table(session, config)
+    role = table.get(assignment.role_code)
+    adjusted = role.adjusted_amount
+    if adjusted is None:
         return None
-    tier = StipendTierCode.get_base_amount(tier_id)
-    factor = _session_adjustment_factor(session)
-    adjusted = tier
-    if factor != 1.0:
-        adjusted = ap_scale(tier, factor, source=STIPEND_AMOUNT_ADJUSTMENT)
     if assignment.source_id:
         adjusted = ap_source(adjusted, assignment.source_id)
     return RoleStipend(
         role_code=assignment.role_code,
         session_id=assignment.session_id,
         amount=adjusted,
-        reason=f"Tier {tier_id} base ${tier.value:,} adjusted by factor {factor}",
+        reason=role.reason,
     )
 
 
-def raw_role_stipends_for_member(member: Member, session: Session) -> list[RoleStipend]:
-    """Get stipends for role"""
+@timed("rules_9b.raw_role_stipends")
+def raw_role_stipends_for_member(
+    member: Member,
+    session: Session,
+    config: Optional[SessionConfig] = None,
+    table: Optional[RoleTable] = None,
+) -> list[RoleStipend]:
+    """Get stipends for role; pass `table` if the session's roles are resolved"""
+    if table is None:
+        table = _role_table(session, config)
     stipends: list[RoleStipend] = []
     for ra in member.roles:
         if ra.session_id != session.id:
             continue
-        rs = stipend_for_role_assignment(ra, session)
+        rs = stipend_for_role_assignment(ra, session, table=table)
         if rs is None:
             continue
         stipends.append(rs)
     return stipends
 
 
-def _subset_total_value(subset: tuple[RoleStipend, ...]) -> int:
-    """Provenance-enabled summation helper"""
-    return sum(r.amount.value for r in subset)
-
+def _max_total(
+    chair_amounts: list[int],
+    other_amounts: list[int],
+    max_positions: int,
+    max_chairs: int,
+    min_positions: int = 0,
+) -> Optional[int]:
+    """Largest total of at most `max_positions` roles with at most
+    `max_chairs` chairs, or None if fewer than `min_positions` fit
+    """
+    chair_top = nlargest(min(max_chairs, max_positions), chair_amounts)
+    other_top = nlargest(max_positions, other_amounts)
+    chair_prefix = [0, *accumulate(chair_top)]
+    other_prefix = [0, *accumulate(other_top)]
+    best: Optional[int] = None
+    for c, chair_total in enumerate(chair_prefix):
+        for n in range(min(max_positions - c, len(other_top)) + 1):
+            if c + n < min_positions:
+                continue
+            total = chair_total + other_prefix[n]
+            if best is None or total > best:
+                best = total
+    return best
+
+
+def _best_subset(
+    candidates: list[tuple[RoleStipend, bool]], max_positions: int, max_chairs: int
+) -> tuple[RoleStipend, ...]:
+    """Highest-value lawful set of roles, in candidate order.
+
+    Ties go to the set whose sorted role codes compare lowest, then to the
+    set with the lowest candidate indices. The set is built one role at a
+    time in role-code order, keeping a role only if the best total is still
+    reachable with it. Returns an empty tuple if no set pays anything.
+    """
+    amounts = [rs.amount.value for rs, _ in candidates]
+    is_chair = [chair for _, chair in candidates]
+
+    def reachable(indices: list[int], positions: int, chairs: int) -> Optional[int]:
+        return _max_total(
+            [amounts[i] for i in indices if is_chair[i]],
+            [amounts[i] for i in indices if not is_chair[i]],
+            positions,
+            chairs,
+        )
 
-def _subset_key(subset: tuple[RoleStipend, ...]) -> tuple[int, tuple[str, ...]]:
-    """Generate sorted tuple of stipends and codes"""
-    total = _subset_total_value(subset)
-    codes = tuple(sorted(r.role_code for r in subset))
-    return (total, codes)
+    target = _max_total(
+        [a for a, chair in zip(amounts, is_chair) if chair],
+        [a for a, chair in zip(amounts, is_chair) if not chair],
+        max_positions,
+        max_chairs,
+        min_positions=1,
+    )
+    if target is None or target <= 0:
+        return ()
+    order = sorted(
+        range(len(candidates)), key=lambda i: (candidates[i][0].role_code, i)
+    )
+    chosen: list[int] = []
+    total = chairs_used = 0
+    start = 0
+    while not chosen or total != target:
+        positions_left = max_positions - len(chosen) - 1
+        for pos in range(start, len(order)):
+            i = order[pos]
+            chairs_after = chairs_used + is_chair[i]
+            if positions_left < 0 or chairs_after > max_chairs:
+                continue
+            rest = reachable(
+                order[pos + 1 :], positions_left, max_chairs - chairs_after
+            )
+            if total + amounts[i] + (rest or 0) == target:
+                chosen.append(i)
+                total += amounts[i]
+                chairs_used = chairs_after
+                start = pos + 1
+                break
+        else:
+            raise AssertionError("best 9B total is unreachable")
+    return tuple(candidates[i][0] for i in sorted(chosen))
 
 
+@timed("rules_9b.select_paid_roles")
 def select_paid_roles_for_member(
     member: Member,
     session: Session,
+    config: Optional[SessionConfig] = None,
+    raw_stipends: Optional[list[RoleStipend]] = None,
+    chamber_rules: Optional[ChamberRules] = None,
+    table: Optional[RoleTable] = None,
 ) -> PaidRoleSelection:
-    """Apply 9B constraints"""
-    raw = raw_role_stipends_for_member(member, session)
+    """Apply 9B constraints; pass `raw_stipends` if they were already computed,
+    or `chamber_rules` to override the member's chamber caps
+    """
+    if table is None:
+        table = _role_table(session, config)
+    raw = raw_stipends
+    if raw is None:
+        raw = raw_role_stipends_for_member(member, session, table=table)
     if not raw:
         return PaidRoleSelection(
             session_id=session.id,
@@ -168,7 +255,7 @@ def select_paid_roles_for_member(
             total_amount=0,
         )
     candidates: list[tuple[RoleStipend, bool]] = [
-        (rs, _is_committee_chair(rs.role_code)) for rs in raw
+        (rs, table.get(rs.role_code).is_chair) for rs in raw
     ]
     if len(candidates) == 1:
         rs, _is_chair = candidates[0]
@@ -178,31 +265,19 @@ def select_paid_roles_for_member(
             paid_roles=[rs],
             total_amount=rs.amount.value,
         )
-    best_subset: tuple[RoleStipend, ...] = tuple()
-    best_amount = 0
-    all_rs_only = [rs for (rs, _is_chair) in candidates]
-    chamber_rules = get_chamber_rules(member.chamber)
+    if chamber_rules is None:
+        chamber_rules = get_chamber_rules(member.chamber)
     max_chairs = chamber_rules.max_chairs
     max_positions = chamber_rules.max_positions
-    for k in range(1, max_positions + 1):
-        for combo in combinations(all_rs_only, k):
-            chair_count = sum(1 for rs in combo if _is_committee_chair(rs.role_code))
-            if chair_count > max_chairs:
-                continue
-            total = _subset_total_value(combo)
-            if total > best_amount:
-                best_amount = total
-                best_subset = combo
-            elif total == best_amount and best_subset:
-                if _subset_key(combo) < _subset_key(best_subset):
-                    best_subset = combo
-    if not best_subset and raw:
+    best_subset = _best_subset(candidates, max_positions, max_chairs)
+    if not best_subset:
         best_subset = (max(raw, key=lambda r: r.amount.value),)
-        best_amount = _subset_total_value(best_subset)
     paid_roles_sorted = sorted(
         best_subset, key=lambda r: (-r.amount.value, r.role_code)
     )
-    sources_for_decision = [chamber_rules.source_ref] if len(candidates) > 1 else []
+    sources_for_decision = sources_for_mask(
+        mask_of([chamber_rules.source_ref]) if len(candidates) > 1 else 0
+    )
     paid_set = {r.role_code for r in paid_roles_sorted}
     provenance: list[RoleSelectionProvenance] = []
     chair_cap_applied = len([rs for (rs, is_chair) in candidates if is_chair]) > 1
@@ -232,7 +307,7 @@ def select_paid_roles_for_member(
                 selected=rs.role_code in paid_set,
                 reason=reason,
                 notes=notes,
-                sources=frozenset(sources_for_decision),
+                sources=sources_for_decision,
             )
         )
     return PaidRoleSelection(
@@ -244,7 +319,9 @@ def select_paid_roles_for_member(
     )
 
 
-def stipend_9b_for_member(member: Member, session: Session) -> int:
+def stipend_9b_for_member(
+    member: Member, session: Session, config: Optional[SessionConfig] = None
+) -> int:
     """Public helper to return total 9B stipend for a member"""
-    selection = select_paid_roles_for_member(member, session)
+    selection = select_paid_roles_for_member(member, session, config)
     return selection.total_amount
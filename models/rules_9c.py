@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
-from pathlib import Path
 from typing import Optional
 
 from audit.provenance import AmountWithProvenance, ap_scale, ap_source
 from audit.sources_registry import create_distance_override_source
 from models.core import Member, Session
-from config.travel_config import TRAVEL_RULE_9C
-from config.comp_adjustment import load_travel_adjustment
+from config.travel_config import TRAVEL_RULE_9C, DistanceException
+from config.session_config import SessionConfig, get_session_config
+from instrumentation import timed
 
 
 @dataclass(frozen=True)
@@ -26,46 +25,46 @@ class TravelAllowance:
 
 
 @dataclass(frozen=True)
-class DistanceException:
-    """Encodes manual distance overrides"""
+class TravelRates:
+    """9C amounts paid on each side of the threshold, after the session's
+    travel adjustment
+    """
 
-    override_reason: str
-    source: str
-    distance_miles_from_state_house: Optional[float] = None
-
-    @staticmethod
-    def from_dict(
-        json_data: dict[str, dict[str, str | float]], code: str
-    ) -> DistanceException:
-        """Generates a DistanceException from a JSON"""
-        data: dict = json_data[code]
-        return DistanceException(
-            override_reason=data["override_reason"],
-            source=data["source"],
-            distance_miles_from_state_house=data.get("distance_miles_from_state_house"),
-        )
-
-
-def load_district_exceptions() -> dict[str, DistanceException]:
-    """Loads the district exception files"""
-    json_path = Path("data/sessions/2025-2026/distance_exceptions.json")
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return {code: DistanceException.from_dict(data, code) for code in data}
-
-
-DISTRICT_EXCEPTIONS = load_district_exceptions()
-"""Dictionary of `member_codes: DistanceException`"""
+    amount_leq_threshold: AmountWithProvenance
+    amount_gt_threshold: AmountWithProvenance
 
 
-def travel_9c_for_member(member: Member, session: Session) -> TravelAllowance:
-    """Calculates the travel stipend for a member"""
+def travel_rates(config: SessionConfig) -> TravelRates:
+    """Resolves the 9C amounts for a session once"""
+    rule = TRAVEL_RULE_9C
+    leq, gt = rule.amount_leq_threshold, rule.amount_gt_threshold
+    factor = config.travel_adjustment.factor
+    if factor > 1.0:
+        leq, gt = ap_scale(leq, factor), ap_scale(gt, factor)
+    return TravelRates(amount_leq_threshold=leq, amount_gt_threshold=gt)
+
+
+@timed("rules_9c.travel")
+def travel_9c_for_member(
+    member: Member,
+    session: Session,
+    config: Optional[SessionConfig] = None,
+    rates: Optional[TravelRates] = None,
+) -> TravelAllowance:
+    """Calculates the travel stipend for a member; pass `rates` if the
+    session's amounts are already resolved
+    """
+    if config is None:
+        config = get_session_config(session.id)
+    if rates is None:
+        rates = travel_rates(config)
+    district_exceptions: dict[str, DistanceException] = config.distance_exceptions
     exceptions: bool = False
-    if member.member_id not in DISTRICT_EXCEPTIONS:
+    if member.member_id not in district_exceptions:
         d = member.distance_miles_from_state_house
     else:
-        if DISTRICT_EXCEPTIONS[member.member_id].distance_miles_from_state_house:
-            d = DISTRICT_EXCEPTIONS[member.member_id].distance_miles_from_state_house
+        if district_exceptions[member.member_id].distance_miles_from_state_house:
+            d = district_exceptions[member.member_id].distance_miles_from_state_house
         else:
             d = member.distance_miles_from_state_house
             exceptions = True
@@ -74,35 +73,31 @@ def travel_9c_for_member(member: Member, session: Session) -> TravelAllowance:
             f"Missing distance_miles_from_state_house " f"for member {member.member_id}"
         )
     rule = TRAVEL_RULE_9C
-    if d <= rule.distance_threshold_miles:
-        amount = rule.amount_leq_threshold
+    within = d <= rule.distance_threshold_miles
+    if within:
         rule_applied = (
             f"distance {d:.1f} <= {rule.distance_threshold_miles} miles "
             f"-> ${rule.amount_leq_threshold.value}"
         )
     else:
-        amount = rule.amount_gt_threshold
         rule_applied = (
             f"distance {d:.1f} > {rule.distance_threshold_miles} miles "
             f"-> ${rule.amount_gt_threshold.value}"
         )
     if exceptions:
-        if amount == rule.amount_gt_threshold:
-            amount = rule.amount_leq_threshold
-        else:
-            amount = rule.amount_gt_threshold
+        within = not within
+        unadjusted = rule.amount_leq_threshold if within else rule.amount_gt_threshold
+        rule_applied = (
+            district_exceptions[member.member_id].override_reason
+        ) + f" -> ${unadjusted.value}"
+    amount = rates.amount_leq_threshold if within else rates.amount_gt_threshold
+    if exceptions:
         amount = ap_source(
             amount,
             create_distance_override_source(
-                DISTRICT_EXCEPTIONS[member.member_id].source
+                district_exceptions[member.member_id].source
             ),
         )
-        rule_applied = (
-            DISTRICT_EXCEPTIONS[member.member_id].override_reason
-        ) + f" -> ${amount.value}"
-    adjustment = load_travel_adjustment(session.id)
-    if adjustment.factor > 1.0:
-        amount = ap_scale(amount, adjustment.factor)
     return TravelAllowance(
         member_id=member.member_id,
         session_id=session.id,
@@ -0,0 +1,297 @@
+"""What-if sweeps over statutory parameters.
+
+A `ScenarioModel` reads a parsed session once into per-member arrays (travel
+distance, exception flags, sorted chair and non-chair tier amounts) and then
+evaluates any number of `Scenario`s against them with NumPy, without
+re-running the per-member rules engines. Results match `total_comp_for_member`
+run with the same overrides.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields, replace
+from itertools import product
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from config.role_table import BASE_ROLE_TABLE
+from config.session_config import SessionConfig, get_session_config
+from config.travel_config import TRAVEL_RULE_9C
+from data.session_loader import LoadedSession
+from instrumentation import timed
+from models.core import Chamber, Session
+from models.rules_9b import get_chamber_rules
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Parameter overrides; a None field keeps the session's own value"""
+
+    travel_threshold_miles: Optional[float] = None
+    travel_amount_leq: Optional[int] = None
+    travel_amount_gt: Optional[int] = None
+    travel_factor: Optional[float] = None
+    stipend_factor: Optional[float] = None
+    house_max_positions: Optional[int] = None
+    house_max_chairs: Optional[int] = None
+    senate_max_positions: Optional[int] = None
+    senate_max_chairs: Optional[int] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Field name -> override"""
+        return asdict(self)
+
+
+SCENARIO_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Scenario))
+
+
+def scenario_grid(**axes: Iterable[Any]) -> list[Scenario]:
+    """Every combination of the given values, e.g.
+    `scenario_grid(travel_threshold_miles=[40, 50], stipend_factor=[1.0, 1.1])`
+    """
+    unknown = set(axes) - set(SCENARIO_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown scenario parameters: {sorted(unknown)}")
+    names = list(axes)
+    return [
+        Scenario(**dict(zip(names, values)))
+        for values in product(*(list(axes[name]) for name in names))
+    ]
+
+
+@dataclass(frozen=True)
+class ScenarioSweep:
+    """Per-member results for a list of scenarios.
+
+    Row `s` of each matrix belongs to `scenarios[s]` (with every override
+    resolved against the session in `resolved[s]`); column `i` belongs to
+    `member_ids[i]`.
+    """
+
+    session: Session
+    member_ids: tuple[str, ...]
+    chambers: np.ndarray
+    scenarios: tuple[Scenario, ...]
+    resolved: tuple[Scenario, ...]
+    base_salary: np.ndarray
+    stipends_9b: np.ndarray
+    travel_9c: np.ndarray
+    total: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.scenarios)
+
+
+def _padded(rows: list[list[int]]) -> np.ndarray:
+    """Rows sorted descending and zero-padded into one matrix"""
+    width = max((len(r) for r in rows), default=0)
+    out = np.zeros((len(rows), width), dtype=np.int64)
+    for i, row in enumerate(rows):
+        out[i, : len(row)] = sorted(row, reverse=True)
+    return out
+
+
+class ScenarioModel:
+    """A session's rule inputs as arrays, ready for repeated evaluation"""
+
+    def __init__(
+        self,
+        loaded: LoadedSession,
+        config: Optional[SessionConfig] = None,
+        member_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        session = loaded.session
+        if config is None:
+            config = get_session_config(session.id)
+        self.session = session
+        self.config = config
+        self.member_ids = tuple(loaded.members if member_ids is None else member_ids)
+        n = len(self.member_ids)
+        self.distance = np.zeros(n, dtype=np.float64)
+        self.flipped = np.zeros(n, dtype=bool)
+        self.is_house = np.zeros(n, dtype=bool)
+        self.chambers = np.empty(n, dtype=object)
+        chairs: list[list[int]] = []
+        others: list[list[int]] = []
+        exceptions = config.distance_exceptions
+        for i, member_id in enumerate(self.member_ids):
+            member = loaded.members[member_id]
+            d = member.distance_miles_from_state_house
+            if member_id in exceptions:
+                override = exceptions[member_id].distance_miles_from_state_house
+                if override:
+                    d = override
+                else:
+                    self.flipped[i] = True
+            if d is None:
+                raise ValueError(
+                    f"Missing distance_miles_from_state_house for member {member_id}"
+                )
+            self.distance[i] = d
+            self.is_house[i] = member.chamber == Chamber.HOUSE
+            self.chambers[i] = member.chamber.value
+            member_chairs: list[int] = []
+            member_others: list[int] = []
+            for ra in member.roles:
+                if ra.session_id != session.id:
+                    continue
+                role = BASE_ROLE_TABLE.get(ra.role_code)
+                if role.base_amount is None:
+                    continue
+                target = member_chairs if role.is_chair else member_others
+                target.append(role.base_amount.value)
+            chairs.append(member_chairs)
+            others.append(member_others)
+        self.chair_amounts = _padded(chairs)
+        self.other_amounts = _padded(others)
+        self._prefix_cache: dict[float, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.member_ids)
+
+    def defaults(self) -> Scenario:
+        """The session's own parameters"""
+        house = get_chamber_rules(Chamber.HOUSE)
+        senate = get_chamber_rules(Chamber.SENATE)
+        return Scenario(
+            travel_threshold_miles=TRAVEL_RULE_9C.distance_threshold_miles,
+            travel_amount_leq=TRAVEL_RULE_9C.amount_leq_threshold.value,
+            travel_amount_gt=TRAVEL_RULE_9C.amount_gt_threshold.value,
+            travel_factor=self.config.travel_adjustment.factor,
+            stipend_factor=self.config.stipend_adjustment.factor,
+            house_max_positions=house.max_positions,
+            house_max_chairs=house.max_chairs,
+            senate_max_positions=senate.max_positions,
+            senate_max_chairs=senate.max_chairs,
+        )
+
+    def resolve(
+        self, scenario: Scenario, defaults: Optional[Scenario] = None
+    ) -> Scenario:
+        """The scenario with every None filled in from the session"""
+        if defaults is None:
+            defaults = self.defaults()
+        overrides = {
+            name: value
+            for name in SCENARIO_FIELDS
+            if (value := getattr(scenario, name)) is not None
+        }
+        return replace(defaults, **overrides)
+
+    def _prefixes(self, factor: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Chair and non-chair prefix sums of the scaled amounts, and each
+        member's largest single amount, cached per factor
+        """
+        cached = self._prefix_cache.get(factor)
+        if cached is not None:
+            return cached
+        scaled = []
+        for amounts in (self.chair_amounts, self.other_amounts):
+            if factor != 1.0:
+                amounts = np.rint(amounts * factor).astype(np.int64)
+            scaled.append(amounts)
+        chairs, others = scaled
+        n = len(self.member_ids)
+        zero = np.zeros((n, 1), dtype=np.int64)
+        largest = np.zeros(n, dtype=np.int64)
+        for amounts in (chairs, others):
+            if amounts.shape[1]:
+                largest = np.maximum(largest, amounts[:, 0])
+        cached = (
+            np.hstack([zero, np.cumsum(chairs, axis=1)]),
+            np.hstack([zero, np.cumsum(others, axis=1)]),
+            largest,
+        )
+        self._prefix_cache[factor] = cached
+        return cached
+
+    def _stipends(
+        self, factor: float, positions: np.ndarray, max_chairs: np.ndarray
+    ) -> np.ndarray:
+        """9B totals for a block of scenarios sharing one stipend factor: the
+        best lawful set under each scenario's caps, or the single largest role
+        when no set pays anything, as the engine does
+        """
+        chair_prefix, other_prefix, largest = self._prefixes(factor)
+        members = np.arange(len(self.member_ids))
+        widest = other_prefix.shape[1] - 1
+        best = np.zeros(positions.shape, dtype=np.int64)
+        for c in range(chair_prefix.shape[1]):
+            lawful = (c <= max_chairs) & (c <= positions)
+            n = np.clip(positions - c, 0, widest)
+            total = chair_prefix[:, c] + other_prefix[members, n]
+            best = np.where(lawful, np.maximum(best, total), best)
+        return np.where(best > 0, best, largest)
+
+    def _travel(
+        self,
+        thresholds: np.ndarray,
+        leq: np.ndarray,
+        gt: np.ndarray,
+        factors: np.ndarray,
+    ) -> np.ndarray:
+        """9C amounts, with exception flips and each factor (if above 1.0)"""
+        near = (self.distance <= thresholds) ^ self.flipped
+        amount = np.where(near, leq, gt)
+        scaled = np.rint(amount * factors).astype(np.int64)
+        return np.where(factors > 1.0, scaled, amount)
+
+    def run(self, scenarios: Iterable[Scenario]) -> ScenarioSweep:
+        """Evaluates every scenario against the session, a block of scenarios
+        per distinct stipend factor
+        """
+        scenarios = tuple(scenarios)
+        defaults = self.defaults()
+        resolved = tuple(self.resolve(s, defaults) for s in scenarios)
+
+        def column(name: str, dtype: type) -> np.ndarray:
+            values = [getattr(r, name) for r in resolved]
+            return np.array(values, dtype=dtype).reshape(-1, 1)
+
+        positions = np.where(
+            self.is_house,
+            column("house_max_positions", np.int64),
+            column("senate_max_positions", np.int64),
+        )
+        max_chairs = np.where(
+            self.is_house,
+            column("house_max_chairs", np.int64),
+            column("senate_max_chairs", np.int64),
+        )
+        shape = (len(scenarios), len(self.member_ids))
+        stipends = np.zeros(shape, dtype=np.int64)
+        stipend_factors = column("stipend_factor", np.float64).ravel()
+        for factor in np.unique(stipend_factors):
+            block = np.flatnonzero(stipend_factors == factor)
+            stipends[block] = self._stipends(
+                float(factor), positions[block], max_chairs[block]
+            )
+        travel = self._travel(
+            column("travel_threshold_miles", np.float64),
+            column("travel_amount_leq", np.int64),
+            column("travel_amount_gt", np.int64),
+            column("travel_factor", np.float64),
+        )
+        base = np.full(shape, self.config.base_salary.base_amount, dtype=np.int64)
+        return ScenarioSweep(
+            session=self.session,
+            member_ids=self.member_ids,
+            chambers=self.chambers,
+            scenarios=scenarios,
+            resolved=resolved,
+            base_salary=base,
+            stipends_9b=stipends,
+            travel_9c=travel,
+            total=base + stipends + travel,
+        )
+
+
+@timed("scenarios.run")
+def run_scenarios(
+    loaded: LoadedSession,
+    scenarios: Iterable[Scenario],
+    config: Optional[SessionConfig] = None,
+) -> ScenarioSweep:
+    """Evaluates scenarios against a session in one pass"""
+    return ScenarioModel(loaded, config).run(scenarios)
@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
-from audit.provenance import AmountWithProvenance, SourceRef, ap_sum
-from models.core import Member, Session
-from models.rules_9b import select_paid_roles_for_member
-from models.rules_9c import travel_9c_for_member
-from config.base_salary import base_salary_for_session
+from audit.provenance import AmountWithProvenance, ap_sum, ap_with_mask, mask_of
+from models.core import Chamber, Member, Session
+from models.rules_9b import (
+    ChamberRules,
+    PaidRoleSelection,
+    RoleStipend,
+    get_chamber_rules,
+    raw_role_stipends_for_member,
+    select_paid_roles_for_member,
+)
+from models.rules_9c import (
+    TravelAllowance,
+    TravelRates,
+    travel_9c_for_member,
+    travel_rates,
+)
+from config.base_salary import base_salary_from_config
+from config.role_table import RoleTable
+from config.session_config import SessionConfig, get_session_config
+from instrumentation import timed
 
 
 @dataclass(frozen=True)
@@ -30,27 +46,70 @@ class Component:
 
 @dataclass(frozen=True)
 class TotalCompResult:
-    """Total compensation after stipends"""
+    """Total compensation after stipends.
+
+    `selection`, `raw_stipends` and `travel` carry the intermediate results so
+    consumers like the profile generator don't recompute them.
+    """
 
     member_id: str
     session_id: str
     components: list[Component]
     total: AmountWithProvenance
+    selection: Optional[PaidRoleSelection] = None
+    raw_stipends: Optional[list[RoleStipend]] = None
+    travel: Optional[TravelAllowance] = None
+
+
+@dataclass(frozen=True)
+class SessionRules:
+    """Rule inputs that are the same for every member of a session"""
+
+    base_salary: AmountWithProvenance
+    role_table: RoleTable
+    chamber_rules: dict[Chamber, ChamberRules]
+    travel_rates: TravelRates
 
 
-def total_comp_for_member(member: Member, session: Session) -> TotalCompResult:
-    """Generates total compensation for a member in a session"""
-    base = base_salary_for_session(session)
-    selection = select_paid_roles_for_member(member, session)
+def session_rules(config: SessionConfig) -> SessionRules:
+    """Resolves a session's base salary, roles, chamber caps and 9C amounts"""
+    return SessionRules(
+        base_salary=base_salary_from_config(config.base_salary),
+        role_table=config.role_table,
+        chamber_rules={c: get_chamber_rules(c) for c in Chamber},
+        travel_rates=travel_rates(config),
+    )
+
+
+@timed("total_comp")
+def total_comp_for_member(
+    member: Member,
+    session: Session,
+    config: Optional[SessionConfig] = None,
+    rules: Optional[SessionRules] = None,
+) -> TotalCompResult:
+    """Generates total compensation for a member in a session; pass `rules`
+    from `session_rules(config)` when computing many members
+    """
+    if config is None:
+        config = get_session_config(session.id)
+    if rules is None:
+        rules = session_rules(config)
+    base = rules.base_salary
+    raw_stipends = raw_role_stipends_for_member(member, session, table=rules.role_table)
+    selection = select_paid_roles_for_member(
+        member,
+        session,
+        raw_stipends=raw_stipends,
+        chamber_rules=rules.chamber_rules[member.chamber],
+        table=rules.role_table,
+    )
     stipends_9b = ap_sum(rs.amount for rs in selection.paid_roles)
-    selection_sources: set[SourceRef] = set()
+    mask = stipends_9b.mask
     for prov in selection.provenance:
-        selection_sources.update(prov.sources)
-    stipends_9b = AmountWithProvenance(
-        value=stipends_9b.value,
-        sources=stipends_9b.sources | frozenset(selection_sources),
-    )
-    travel_9c = travel_9c_for_member(member, session)
+        mask |= mask_of(prov.sources)
+    stipends_9b = ap_with_mask(stipends_9b.value, mask)
+    travel_9c = travel_9c_for_member(member, session, config, rates=rules.travel_rates)
     comps = [
         Component(label=CompLabels.base_salary, amount=base),
         Component(label=CompLabels.stipends_9b, amount=stipends_9b),
@@ -62,4 +121,7 @@ def total_comp_for_member(member: Member, session: Session) -> TotalCompResult:
         session_id=session.id,
         components=comps,
         total=total_amount,
+        selection=selection,
+        raw_stipends=raw_stipends,
+        travel=travel_9c,
     )
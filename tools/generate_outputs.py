@@ -3,54 +3,259 @@
 from __future__ import annotations
 
 import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
+from config.session_config import get_session_config
 from data.session_loader import load_session
+from instrumentation import add_profiling_arguments, profiling, timed
+from models.batch import SessionComp, compute_session
+from models.core import Member, Session
+from models.total_comp import TotalCompResult
+from tools.manifest import (
+    MANIFEST_NAME,
+    BuildManifest,
+    MemberEntry,
+    digest_text,
+    member_inputs_hash,
+    session_inputs_hash,
+)
 from tools.member_profile import generate_member_profile
+from tools.profile_pack import (
+    PACK_NAME,
+    ProfilePack,
+    remove_profile_pack,
+    write_profile_pack,
+)
 from tools.session_report import generate_session_report
-from tools.writers import write_json
+from tools.source_table import SOURCES_NAME, build_source_table, session_sources
+from tools.timeline import TIMELINE_NAME, MemberTimeline
+from tools.writers import dump_json, dump_json_min, write_json, write_text
 
+_ProfileTask = tuple[Member, Session, TotalCompResult, bool, bool]
 
+
+def _render_profile(task: _ProfileTask) -> tuple[str, str]:
+    """Builds and serializes one profile; runs in a worker process"""
+    member, session, comp_result, shared_sources, minify = task
+    profile = generate_member_profile(
+        member, session, session.id, comp_result, shared_sources
+    )
+    data = profile.to_dict()
+    return member.member_id, dump_json_min(data) if minify else dump_json(data)
+
+
+def _render_profiles(
+    members: Iterable[Member],
+    session: Session,
+    comp: SessionComp,
+    jobs: int,
+    shared_sources: bool = False,
+    minify: bool = False,
+) -> Iterator[tuple[str, str]]:
+    """Renders profiles in member order, in a process pool if `jobs` > 1"""
+    tasks = (
+        (m, session, comp.result_for(m.member_id), shared_sources, minify)
+        for m in members
+    )
+    if jobs <= 1:
+        yield from map(_render_profile, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_render_profile, tasks, chunksize=16)
+
+
+def _open_pack(path: Path) -> Optional[ProfilePack]:
+    """The existing profile pack, if there is a readable one that matches its
+    index; its bytes are copied into the next pack, so its hash is checked
+    """
+    if not path.exists():
+        return None
+    try:
+        return ProfilePack(path, verify=True)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _merge_pack(
+    member_ids: Iterable[str], texts: dict[str, str], old_pack: Optional[ProfilePack]
+) -> list[tuple[str, str | bytes]]:
+    """New profiles plus unchanged ones copied out of the old pack, in member
+    order; the old pack is closed so it can be replaced
+    """
+    old: dict[str, bytes] = {}
+    if old_pack is not None:
+        old = {mid: old_pack.raw(mid) for mid in member_ids if mid not in texts}
+        old_pack.close()
+    return [(mid, texts[mid] if mid in texts else old[mid]) for mid in member_ids]
+
+
+@timed("generate_outputs")
 def generate_all_outputs(
-    session_id: str, output_dir: Path, verbose: bool = False
+    session_id: str,
+    output_dir: Path,
+    verbose: bool = False,
+    jobs: int = 1,
+    force: bool = False,
+    shared_sources: bool = False,
+    packed: bool = False,
 ) -> None:
-    """Generate all outputs for a session"""
+    """Generate all outputs for a session.
+
+    Only profiles whose inputs changed since the last build (per the build
+    manifest) are recomputed, and only those whose content changed are
+    rewritten; reports are rebuilt only if some profile changed. Recomputed
+    members are also recorded in the cross-session timeline index in
+    `output_dir`. `force` ignores the manifest. With `jobs` > 1, profiles are
+    computed in a process pool and written by a thread pool; the files are
+    identical to a serial run. With `shared_sources`, profiles cite sources by
+    key and the sources are written once to `sources.json`. With `packed`,
+    profiles go to a single `profiles.jsonl` pack instead of one file each.
+    """
+    # pylint: disable = too-many-locals, too-many-statements
     print(f"Loading session {session_id}...")
     loaded = load_session(Path("data/sessions"), session_id)
     session = loaded.session
+    config = get_session_config(session_id)
     session_output = output_dir / session_id
     profiles_dir = session_output / "profiles"
     reports_dir = session_output / "reports"
+    pack_path = session_output / PACK_NAME
+    manifest_path = session_output / MANIFEST_NAME
+    previous = (
+        BuildManifest(session_id=session_id)
+        if force
+        else BuildManifest.load(manifest_path, session_id)
+    )
+    if previous.shared_sources != shared_sources or previous.packed != packed:
+        previous = BuildManifest(session_id=session_id)
+    manifest = BuildManifest(
+        session_id=session_id,
+        session_hash=session_inputs_hash(config),
+        shared_sources=shared_sources,
+        packed=packed,
+    )
+    old_pack = _open_pack(pack_path) if packed else None
+
+    def has_output(member_id: str) -> bool:
+        if packed:
+            return old_pack is not None and member_id in old_pack
+        return (profiles_dir / f"{member_id}.json").exists()
+
+    stale: list[Member] = []
+    for member in loaded.members.values():
+        inputs = member_inputs_hash(member, config, manifest.session_hash)
+        prev = previous.entry_for(member.member_id)
+        if prev is not None and prev.inputs == inputs and has_output(member.member_id):
+            manifest.members[member.member_id] = prev
+        else:
+            stale.append(member)
+            manifest.members[member.member_id] = MemberEntry(inputs=inputs, output="")
     print(f"\nGenerating outputs for {len(loaded.members)} members...")
+    print(f"   {len(stale)} with changed inputs")
+    comp = compute_session(loaded, config, [m.member_id for m in stale])
     print("\n1. Generating member profiles...")
-    for i, member in enumerate(loaded.members.values(), 1):
-        profile = generate_member_profile(member, session, session_id)
-        output_path = profiles_dir / f"{member.member_id}.json"
-        write_json(profile.to_dict(), output_path)
-        if verbose or i % 20 == 0:
-            print(f"   Generated {i}/{len(loaded.members)} profiles...")
-    print(f"   [OK] Completed {len(loaded.members)} member profiles")
-    print("\n2. Generating session report...")
-    report = generate_session_report(loaded)
-    write_json(report.to_dict(), reports_dir / "full_session.json")
-    write_json(report.summary_statistics, reports_dir / "summary_stats.json")
-    write_json(report.validation_summary, reports_dir / "validation_report.json")
-    print("   [OK] Completed session report")
+    sources_path = session_output / SOURCES_NAME
+    if shared_sources:
+        table = build_source_table(session_sources(config))
+        write_json(table, sources_path, announce=verbose)
+    else:
+        sources_path.unlink(missing_ok=True)
+    rendered = _render_profiles(stale, session, comp, jobs, shared_sources, packed)
+    rewritten = 0
+    changed = 0
+    texts: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as writers:
+        pending = []
+        for i, (member_id, text) in enumerate(rendered, 1):
+            if verbose or i % 20 == 0:
+                print(f"   Generated {i}/{len(stale)} profiles...")
+            entry = manifest.members[member_id]
+            entry.output = digest_text(text)
+            prev = previous.entry_for(member_id)
+            if prev is None or prev.output != entry.output:
+                changed += 1
+            elif has_output(member_id):
+                continue
+            rewritten += 1
+            if packed:
+                texts[member_id] = text
+                continue
+            output_path = profiles_dir / f"{member_id}.json"
+            pending.append(writers.submit(write_text, text, output_path, verbose))
+        for future in pending:
+            future.result()
+    removed = sorted(set(previous.members) - set(manifest.members))
+    if packed:
+        if texts or removed or old_pack is None:
+            write_profile_pack(
+                _merge_pack(manifest.members, texts, old_pack), pack_path
+            )
+        elif old_pack is not None:
+            old_pack.close()
+        for stray in profiles_dir.glob("*.json"):
+            stray.unlink()
+    else:
+        remove_profile_pack(pack_path)
+        for member_id in removed:
+            (profiles_dir / f"{member_id}.json").unlink(missing_ok=True)
+    print(f"   [OK] Rewrote {rewritten} member profiles, removed {len(removed)}")
+    report_files = [
+        reports_dir / "full_session.json",
+        reports_dir / "summary_stats.json",
+        reports_dir / "validation_report.json",
+    ]
+    rebuild_reports = (
+        changed > 0
+        or bool(removed)
+        or previous.session_hash != manifest.session_hash
+        or not all(f.exists() for f in report_files)
+    )
+    if rebuild_reports:
+        print("\n2. Generating session report...")
+        if len(stale) != len(loaded.members):
+            comp = compute_session(loaded, config)
+        report = generate_session_report(loaded, comp)
+        write_json(report.to_dict(), report_files[0])
+        write_json(report.summary_statistics, report_files[1])
+        write_json(report.validation_summary, report_files[2])
+        validation_summary = report.validation_summary
+        print("   [OK] Completed session report")
+    else:
+        print("\n2. Session report unchanged; skipping")
+        validation_summary = json.loads(report_files[2].read_text(encoding="utf-8"))
+    timeline_path = output_dir / TIMELINE_NAME
+    timeline = MemberTimeline.load(timeline_path)
+    if timeline.inputs_hash(session_id) == previous.inputs_digest():
+        timeline.update_session(loaded, comp, manifest.inputs_digest())
+        timeline.remove(session_id, removed)
+    else:
+        if len(comp) != len(loaded.members):
+            comp = compute_session(loaded, config)
+        timeline.update_session(loaded, comp, manifest.inputs_digest(), complete=True)
+    timeline.save(timeline_path, announce=verbose)
+    write_json(manifest.to_dict(), manifest_path, announce=verbose)
     print(f"\n{'='*60}")
     print("[SUCCESS] All outputs generated successfully!")
     print(f"\nOutput location: {session_output.absolute()}")
     print("\nGenerated:")
-    prof_rel = profiles_dir.relative_to(output_dir)
-    print(f"  - {len(loaded.members)} member profiles in {prof_rel}/")
+    prof_rel = (pack_path if packed else profiles_dir).relative_to(output_dir)
+    prof_rel_text = f"{prof_rel}" if packed else f"{prof_rel}/"
+    print(
+        f"  - {rewritten} of {len(loaded.members)} member profiles in {prof_rel_text}"
+    )
     rep_rel = reports_dir.relative_to(output_dir)
-    print(f"  - Session report in {rep_rel}/")
+    if rebuild_reports:
+        print(f"  - Session report in {rep_rel}/")
     print("\nValidation:")
-    cat_err = report.validation_summary["catalog_errors"]
-    sess_err = report.validation_summary["session_errors"]
-    dist_err = report.validation_summary["distance_errors"]
-    cat_warn = report.validation_summary["catalog_warnings"]
-    sess_warn = report.validation_summary["session_warnings"]
-    dist_warn = report.validation_summary["distance_warnings"]
+    cat_err = validation_summary["catalog_errors"]
+    sess_err = validation_summary["session_errors"]
+    dist_err = validation_summary["distance_errors"]
+    cat_warn = validation_summary["catalog_warnings"]
+    sess_warn = validation_summary["session_warnings"]
+    dist_warn = validation_summary["distance_warnings"]
     print(f"  - Errors: {cat_err + sess_err + dist_err}")
     print(f"  - Warnings: {cat_warn + sess_warn + dist_warn}")
     if cat_err + sess_err + dist_err > 0:
@@ -64,16 +269,48 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate JSON analysis outputs for legislative session"
     )
-    parser.add_argument("session_id", help="Session ID, e.g. 2025-2026")
+    parser.add_argument("session_ids", nargs="+", help="Session ID(s), e.g. 2025-2026")
     parser.add_argument(
         "--output-dir",
         default="docs/",
         help="Output directory (default: docs/)",
     )
     parser.add_argument("--verbose", action="store_true", help="Show detailed progress")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for profile generation (default: 1)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the build manifest and regenerate everything",
+    )
+    parser.add_argument(
+        "--shared-sources",
+        action="store_true",
+        help="Write sources once to sources.json and cite them by key in profiles",
+    )
+    parser.add_argument(
+        "--packed",
+        action="store_true",
+        help="Write all profiles to one profiles.jsonl pack with an offset index",
+    )
+    add_profiling_arguments(parser)
     args = parser.parse_args()
-    output_dir = Path(args.output_dir)
-    generate_all_outputs(args.session_id, output_dir, args.verbose)
+    with profiling(args, "generate_outputs"):
+        output_dir = Path(args.output_dir)
+        for session_id in args.session_ids:
+            generate_all_outputs(
+                session_id,
+                output_dir,
+                args.verbose,
+                args.jobs,
+                args.force,
+                args.shared_sources,
+                args.packed,
+            )
 
 
 if __name__ == "__main__":
@@ -4,26 +4,77 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from jinja2 import Template
 import markdown  # type: ignore
 
+from instrumentation import (
+    add_profiling_arguments,
+    count,
+    enabled,
+    profiling,
+    stage,
+    timed,
+)
 from version import __version__
 from tools.html_viewer.sections import sections
+from tools.profile_pack import PACK_NAME, ProfilePack
+from tools.source_table import SOURCES_NAME
+from tools.writers import dump_json_min, write_precompressed
 
+SUMMARY_NAME = "summary.json"
 
+
+@timed("html_viewer.load_profiles")
 def load_all_profiles(session_dir: Path) -> list[dict]:
-    """Load all member profile JSONs"""
+    """Load all member profile JSONs, from the session's pack if it has one"""
+    pack_path = session_dir / PACK_NAME
+    if pack_path.exists():
+        with ProfilePack(pack_path) as pack:
+            return [pack.get(member_id) for member_id in sorted(pack)]
     profiles_dir = session_dir / "profiles"
     profiles = []
     for profile_file in sorted(profiles_dir.glob("*.json")):
         with profile_file.open("r", encoding="utf-8") as f:
             profiles.append(json.load(f))
+            if enabled():
+                count("files_read")
+                count("bytes_read", f.tell())
     return profiles
 
 
+def summarize_profile(profile: dict) -> dict[str, Any]:
+    """The fields the viewer shows before a member's full profile is fetched"""
+    comp = profile["compensation"]
+    return {
+        "id": profile["member_id"],
+        "name": profile["name"],
+        "chamber": profile["chamber"],
+        "party": profile["party"],
+        "distance": profile.get("distance_from_state_house"),
+        "total": comp["total"],
+        "amounts": [c["amount"] for c in comp["components"]],
+    }
+
+
+def build_summary_index(session_id: str, profiles: list[dict]) -> dict[str, Any]:
+    """Compact per-member index; component labels are shared, not repeated"""
+    labels = (
+        [c["label"] for c in profiles[0]["compensation"]["components"]]
+        if profiles
+        else []
+    )
+    return {
+        "session_id": session_id,
+        "labels": labels,
+        "members": [summarize_profile(p) for p in profiles],
+    }
+
+
 def load_summary_stats(session_dir: Path) -> dict:
     """Load summary statistics"""
     stats_file = session_dir / "reports" / "summary_stats.json"
@@ -59,37 +110,70 @@ def convert_sections_to_html() -> list[dict[str, str]]:
     return html_sections
 
 
+@timed("html_viewer")
 def generate_html_viewer(
-    session_id: str, output_dir: Path = Path("tools/output")
+    session_id: str,
+    output_dir: Path = Path("docs"),
+    output_file: Path = Path("docs/index.html"),
 ) -> Path:
-    """Generate HTML viewer for a session"""
+    """Generate HTML viewer for a session.
+
+    The page inlines only a compact summary of each member (also written,
+    minified and precompressed, to `<session>/summary.json`); full profiles
+    are fetched from `<session>/profiles/` (or by byte range from a packed
+    `<session>/profiles.jsonl`) when a member's card is expanded, along with
+    `<session>/sources.json` if profiles cite sources by key. The session's
+    outputs must be under `output_file`'s directory so the page can reach them.
+    """
     session_dir = output_dir / session_id
     if not session_dir.exists():
         raise ValueError(f"Session directory not found: {session_dir}")
+    if not session_dir.resolve().is_relative_to(output_file.parent.resolve()):
+        raise ValueError(
+            f"{session_dir} is not under {output_file.parent}; "
+            "the viewer could not load its profiles"
+        )
     print(f"Loading data for session {session_id}...")
     profiles = load_all_profiles(session_dir)
     stats = load_summary_stats(session_dir)
     validation = load_validation_report(session_dir)
     print(f"Loaded {len(profiles)} member profiles")
+    summary_json = dump_json_min(build_summary_index(session_id, profiles))
+    write_precompressed(summary_json, session_dir / SUMMARY_NAME)
+    profiles_url = os.path.relpath(session_dir / "profiles", output_file.parent)
+    pack_path = session_dir / PACK_NAME
+    pack_url, pack_index = "", {}
+    if pack_path.exists():
+        with ProfilePack(pack_path) as pack:
+            pack_index = pack.index
+        pack_url = Path(os.path.relpath(pack_path, output_file.parent)).as_posix()
+    sources_path = session_dir / SOURCES_NAME
+    sources_url = (
+        Path(os.path.relpath(sources_path, output_file.parent)).as_posix()
+        if sources_path.exists()
+        else ""
+    )
     template_path = Path(__file__).parent / "template.html"
     with template_path.open("r", encoding="utf-8") as f:
         template = Template(f.read())
     print("Rendering HTML...")
     html_sections = convert_sections_to_html()
     generated_on = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    html = template.render(
-        session_id=session_id,
-        profiles=profiles,
-        stats=stats,
-        validation=validation,
-        profiles_json=json.dumps(profiles, separators=(",", ":")),
-        stats_json=json.dumps(stats, separators=(",", ":")),
-        version=__version__,
-        html_sections=html_sections,
-        github_url="https://github.com/arbowl/ma-legislature-stipends/",
-        generated_on=generated_on,
-    )
-    output_file = Path("docs/") / "index.html"
+    with stage("html_viewer.render"):
+        html = template.render(
+            session_id=session_id,
+            stats=stats,
+            validation=validation,
+            summary_json=summary_json.replace("</", "<\\/"),
+            profiles_url=Path(profiles_url).as_posix(),
+            sources_url=sources_url,
+            pack_url=pack_url,
+            pack_index_json=dump_json_min(pack_index),
+            version=__version__,
+            html_sections=html_sections,
+            github_url="https://github.com/arbowl/ma-legislature-stipends/",
+            generated_on=generated_on,
+        )
     with output_file.open("w", encoding="utf-8") as f:
         f.write(html)
     print(f"\n[SUCCESS] HTML viewer generated: {output_file.absolute()}")
@@ -104,12 +188,14 @@ def main() -> None:
     parser.add_argument("session_id", help="Session ID, e.g. 2025-2026")
     parser.add_argument(
         "--output-dir",
-        default="tools/output",
-        help="Output directory (default: tools/output)",
+        default="docs",
+        help="Output directory, next to index.html (default: docs)",
     )
+    add_profiling_arguments(parser)
     args = parser.parse_args()
-    output_dir = Path(args.output_dir)
-    generate_html_viewer(args.session_id, output_dir)
+    with profiling(args, "html_viewer"):
+        output_dir = Path(args.output_dir)
+        generate_html_viewer(args.session_id, output_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""Build manifest for incremental output regeneration.
+
+Each member's profile is keyed on a hash of everything it is computed from:
+the member row, their role assignments, their distance exception, the
+session config, the role/source catalogs and the output format version.
+Unchanged members are skipped on rerun; reports are only rebuilt when some
+profile actually changed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from audit.sources_registry import _ALL_SOURCES
+from config.role_catalog import ROLE_DEFINITIONS
+from config.session_config import SessionConfig
+from config.travel_config import TRAVEL_RULE_9C
+from models.core import Member
+from version import __version__
+
+MANIFEST_NAME = "build_manifest.json"
+MANIFEST_VERSION = 1
+# Version of the profile and report layout. Bump it with every change to what
+# the profile or report generators emit, so the next incremental build
+# regenerates every output instead of keeping ones in the old format.
+#   2: provenance lists sorted by source ID
+#   3: base salary adjustment_factor read from the session config
+#   4: provenance as source keys (--shared-sources)
+#   5: base salary adjustment_factor as written in base_salary.json again
+#   6: summary_stats.json by_party keys in sorted party order
+OUTPUT_FORMAT_VERSION = 6
+
+
+def digest(payload: Any) -> str:
+    """Stable content hash of a JSON-able payload"""
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def digest_text(text: str) -> str:
+    """Content hash of already-serialized output"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def catalog_fingerprint() -> str:
+    """Hash of the role catalog, source registry, 9C rule, model version and
+    output format version
+    """
+    return digest(
+        {
+            "version": __version__,
+            "output_format": OUTPUT_FORMAT_VERSION,
+            "roles": {code: repr(rd) for code, rd in ROLE_DEFINITIONS.items()},
+            "sources": {
+                sid: [s.label, s.kind.name, s.url, sorted(s.details)]
+                for sid, s in _ALL_SOURCES.items()
+            },
+            "travel_rule": [
+                TRAVEL_RULE_9C.distance_threshold_miles,
+                TRAVEL_RULE_9C.amount_leq_threshold.value,
+                TRAVEL_RULE_9C.amount_gt_threshold.value,
+            ],
+        }
+    )
+
+
+def session_inputs_hash(config: SessionConfig) -> str:
+    """Hash of session-wide inputs shared by every member"""
+    return digest(
+        {
+            "catalog": catalog_fingerprint(),
+            "session_id": config.session_id,
+            "stipend_factor": config.stipend_adjustment.factor,
+            "travel_factor": config.travel_adjustment.factor,
+            "base_salary": asdict(config.base_salary),
+        }
+    )
+
+
+def member_inputs_hash(member: Member, config: SessionConfig, session_hash: str) -> str:
+    """Hash of everything a member's profile is computed from"""
+    exception = config.distance_exceptions.get(member.member_id)
+    return digest(
+        {
+            "session": session_hash,
+            "member": [
+                member.member_id,
+                member.name,
+                member.chamber.value,
+                member.party.value,
+                member.district,
+                member.distance_miles_from_state_house,
+            ],
+            "roles": sorted(
+                [
+                    ra.role_code,
+                    ra.session_id,
+                    getattr(ra.source_id, "id", ra.source_id) or "",
+                ]
+                for ra in member.roles
+            ),
+            "distance_exception": asdict(exception) if exception else None,
+        }
+    )
+
+
+@dataclass
+class MemberEntry:
+    """Manifest record for one member's profile"""
+
+    inputs: str
+    output: str
+
+
+@dataclass
+class BuildManifest:
+    """Input and output hashes from the last build of a session"""
+
+    session_id: str
+    session_hash: str = ""
+    members: dict[str, MemberEntry] = field(default_factory=dict)
+    shared_sources: bool = False
+    packed: bool = False
+
+    @staticmethod
+    def load(path: Path, session_id: str) -> BuildManifest:
+        """Reads a manifest, or returns an empty one if missing or outdated"""
+        if not path.exists():
+            return BuildManifest(session_id=session_id)
+        data: dict = json.loads(path.read_text(encoding="utf-8"))
+        if (
+            data.get("manifest_version") != MANIFEST_VERSION
+            or data.get("session_id") != session_id
+        ):
+            return BuildManifest(session_id=session_id)
+        return BuildManifest(
+            session_id=session_id,
+            session_hash=data["session_hash"],
+            members={
+                mid: MemberEntry(**entry) for mid, entry in data["members"].items()
+            },
+            shared_sources=data.get("shared_sources", False),
+            packed=data.get("packed", False),
+        )
+
+    def inputs_digest(self) -> str:
+        """Hash of the whole session's inputs: session and every member"""
+        return digest(
+            {
+                "session": self.session_hash,
+                "members": {mid: e.inputs for mid, e in self.members.items()},
+            }
+        )
+
+    def entry_for(self, member_id: str) -> Optional[MemberEntry]:
+        """Previous record for a member, if any"""
+        return self.members.get(member_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the manifest to a dict"""
+        return {
+            "manifest_version": MANIFEST_VERSION,
+            "session_id": self.session_id,
+            "session_hash": self.session_hash,
+            "shared_sources": self.shared_sources,
+            "packed": self.packed,
+            "members": {mid: asdict(e) for mid, e in sorted(self.members.items())},
+        }
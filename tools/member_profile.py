@@ -2,34 +2,28 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
 import re
+from typing import Optional
 
 from audit.provenance import SourceRef
-from config.comp_adjustment import (
-    load_stipend_adjustment,
-    load_travel_adjustment,
-)
-from config.role_catalog import get_role_definition
+from config.session_config import SessionConfig, get_session_config
+from instrumentation import timed
 from models.core import Member, Session
-from models.rules_9b import (
-    select_paid_roles_for_member,
-    raw_role_stipends_for_member,
-)
-from models.rules_9c import travel_9c_for_member
-from models.total_comp import CompLabels, total_comp_for_member
+from models.total_comp import CompLabels, TotalCompResult, total_comp_for_member
 from tools.models import (
     CompensationComponent,
     MemberProfile,
     ProvenanceInfo,
     RoleStipendInfo,
 )
+from tools.source_table import source_key
 from validators import _validate_member_raw_roles
 
 
-def _extract_provenance(sources: frozenset) -> list[dict]:
-    """Extract provenance from a frozenset of sources"""
+def _extract_provenance(sources: frozenset, shared: bool = False) -> list[dict | str]:
+    """Extract provenance from a frozenset of sources; with `shared`, as keys
+    into the session's source table
+    """
     all_sources = []
 
     def extract_recursive(item: SourceRef | frozenset) -> None:
@@ -43,25 +37,46 @@ def _extract_provenance(sources: frozenset) -> list[dict]:
     extract_recursive(sources)
     seen = set()
     unique_sources = []
-    for source in all_sources:
-        if hasattr(source, "id") and source.id not in seen:
+    for source in sorted(all_sources, key=lambda s: (s.id, s.url or "")):
+        if source.id not in seen:
             seen.add(source.id)
-            unique_sources.append(ProvenanceInfo.from_source_ref(source).to_dict())
+            if shared:
+                unique_sources.append(source_key(source))
+            else:
+                unique_sources.append(ProvenanceInfo.from_source_ref(source).to_dict())
     return unique_sources
 
 
+@timed("member_profile")
 def generate_member_profile(
-    member: Member, session: Session, session_id: str
+    member: Member,
+    session: Session,
+    session_id: str,
+    comp_result: Optional[TotalCompResult] = None,
+    shared_sources: bool = False,
+    config: Optional[SessionConfig] = None,
 ) -> MemberProfile:
-    """Generate a complete member profile with full provenance"""
-    comp_result = total_comp_for_member(member, session)
-    selection = select_paid_roles_for_member(member, session)
-    raw_stipends = raw_role_stipends_for_member(member, session)
+    """Generate a complete member profile with full provenance, or with
+    source keys into the session's source table if `shared_sources`. `config`
+    defaults to the session's config under `data/sessions`
+    """
+    if config is None:
+        config = get_session_config(session.id)
+    if (
+        comp_result is None
+        or comp_result.selection is None
+        or comp_result.raw_stipends is None
+        or comp_result.travel is None
+    ):
+        comp_result = total_comp_for_member(member, session, config)
+    selection = comp_result.selection
+    raw_stipends = comp_result.raw_stipends
     stipends_breakdown = []
     paid_roles_list = list(selection.paid_roles)
-    adjustment_factor = load_stipend_adjustment(session.id).factor
+    adjustment_factor = config.stipend_adjustment.factor
+    table = config.role_table
     for rs in raw_stipends:
-        role_def = get_role_definition(rs.role_code)
+        role = table.get(rs.role_code)
         base_amt = rs.amount.value
         if adjustment_factor != 1.0:
             base_amt = round(rs.amount.value / adjustment_factor)
@@ -77,33 +92,28 @@ def generate_member_profile(
         stipends_breakdown.append(
             RoleStipendInfo(
                 role_code=rs.role_code,
-                role_title=role_def.title,
-                tier_id=role_def.stipend_tier_id,
+                role_title=role.title,
+                tier_id=role.tier_id,
                 base_amount=base_amt,
                 adjusted_amount=rs.amount.value,
                 adjustment_factor=adjustment_factor,
                 paid=is_paid,
                 reason=rs.reason,
-                provenance=_extract_provenance(rs.amount.sources),
+                provenance=_extract_provenance(rs.amount.sources, shared_sources),
             ).to_dict()
         )
     stipends_breakdown.sort(key=lambda x: (not x["paid"], -x["adjusted_amount"]))
     components = []
     for comp in comp_result.components:
-        prov = _extract_provenance(comp.amount.sources)
+        prov = _extract_provenance(comp.amount.sources, shared_sources)
         comp_dict = CompensationComponent(
             label=comp.label, amount=comp.amount.value, provenance=prov
         ).to_dict()
         if comp.label == CompLabels.base_salary:
-            base_salary_data = json.loads(
-                (Path("data/sessions") / session.id / "base_salary.json").read_text()
-            )
             original_base = 62548
             comp_dict["details"] = {
                 "base_amount": original_base,
-                "adjustment_factor": base_salary_data.get(
-                    "aggregate_change_factor", 1.0
-                ),
+                "adjustment_factor": config.base_salary.reported_factor,
             }
         if comp.label == CompLabels.stipends_9b:
             discarded = len(raw_stipends) - len(selection.paid_roles)
@@ -114,8 +124,8 @@ def generate_member_profile(
                 "discarded_roles": discarded,
             }
         if comp.label == CompLabels.travel_9c:
-            travel_result = travel_9c_for_member(member, session)
-            travel_adj = load_travel_adjustment(session.id)
+            travel_result = comp_result.travel
+            travel_adj = config.travel_adjustment
             match = re.search(r"\$([0-9,]+)", travel_result.rule_applied)
             base_amount = (
                 int(match.group(1).replace(",", "")) if match else comp.amount.value
@@ -127,7 +137,7 @@ def generate_member_profile(
                 "adjustment_factor": travel_adj.factor,
             }
         components.append(comp_dict)
-    issues = _validate_member_raw_roles(member, session_id)
+    issues = _validate_member_raw_roles(member, session_id, table)
     validation_issues = [
         {
             "level": str(issue.level),
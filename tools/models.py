@@ -21,7 +21,7 @@ class ProvenanceInfo:
     @staticmethod
     def from_source_ref(source: SourceRef) -> ProvenanceInfo:
         """Convert SourceRef to JSON-serializable format"""
-        details_list = list(source.details) if source.details else []
+        details_list = sorted(source.details) if source.details else []
         return ProvenanceInfo(
             source_id=source.id,
             label=source.label,
@@ -48,7 +48,7 @@ class RoleStipendInfo:
     adjustment_factor: float
     paid: bool
     reason: str
-    provenance: list[dict[str, Any]]
+    provenance: list[dict[str, Any] | str]
 
     def to_dict(self) -> dict[str, Any]:
         """Converts the dataclass to a dict"""
@@ -61,7 +61,7 @@ class CompensationComponent:
 
     label: str
     amount: int
-    provenance: list[dict[str, Any]]
+    provenance: list[dict[str, Any] | str]
     details: Optional[dict[str, Any]] = None
 
     def to_dict(self) -> dict[str, Any]:
@@ -0,0 +1,158 @@
+"""Packed per-session profile file.
+
+An alternative to one JSON file per member: every profile is written, one
+minified JSON document per line, to `<session>/profiles.jsonl` in a single
+sequential write, with `profiles.index.json` mapping each member ID to the
+byte offset and length of their line. Readers map the file once and parse only
+the members they ask for.
+
+Both files are written to temporary names and swapped in, the index last.
+The index records the pack's size and SHA-256, and a pack that does not match
+its index is rejected, so an interrupted write is never read with another
+pack's offsets.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+from instrumentation import count, stage
+
+PACK_NAME = "profiles.jsonl"
+PACK_INDEX_NAME = "profiles.index.json"
+PACK_VERSION = 2
+
+
+def index_path(pack_path: Path) -> Path:
+    """The offset index stored next to a pack"""
+    return pack_path.with_name(PACK_INDEX_NAME)
+
+
+def write_profile_pack(
+    profiles: Iterable[tuple[str, Union[str, bytes]]], path: Path
+) -> dict[str, tuple[int, int]]:
+    """Writes (member ID, minified profile) pairs in order, then their index;
+    returns the index
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index: dict[str, tuple[int, int]] = {}
+    offset = 0
+    sha256 = hashlib.sha256()
+    tmp = path.with_name(path.name + ".tmp")
+    with stage("profile_pack.write"), tmp.open("wb") as f:
+        for member_id, text in profiles:
+            data = text.encode("utf-8") if isinstance(text, str) else text
+            f.write(data)
+            f.write(b"\n")
+            sha256.update(data)
+            sha256.update(b"\n")
+            index[member_id] = (offset, len(data))
+            offset += len(data) + 1
+    count("files_written")
+    count("bytes_written", offset)
+    index_tmp = tmp.with_name(PACK_INDEX_NAME + ".tmp")
+    index_tmp.write_text(
+        json.dumps(
+            {
+                "pack_version": PACK_VERSION,
+                "size": offset,
+                "sha256": sha256.hexdigest(),
+                "members": {mid: list(span) for mid, span in index.items()},
+            },
+            separators=(",", ":"),
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+    os.replace(index_tmp, index_path(path))
+    return index
+
+
+@dataclass(frozen=True)
+class PackIndex:
+    """A pack's index: member spans plus the size and hash of the pack it
+    was written with
+    """
+
+    members: dict[str, tuple[int, int]]
+    size: int
+    sha256: str
+
+
+def load_pack_index(pack_path: Path) -> PackIndex:
+    """A pack's index file"""
+    data: dict = json.loads(index_path(pack_path).read_text(encoding="utf-8"))
+    if data.get("pack_version") != PACK_VERSION:
+        raise ValueError(f"Unsupported profile pack version in {pack_path}")
+    return PackIndex(
+        members={mid: (span[0], span[1]) for mid, span in data["members"].items()},
+        size=data["size"],
+        sha256=data["sha256"],
+    )
+
+
+def remove_profile_pack(pack_path: Path) -> None:
+    """Deletes a pack and its index, if present"""
+    pack_path.unlink(missing_ok=True)
+    index_path(pack_path).unlink(missing_ok=True)
+
+
+class ProfilePack:
+    """Read-only, memory-mapped view of a profile pack. Raises ValueError if
+    the pack's size, or with `verify` its SHA-256, does not match its index
+    """
+
+    def __init__(self, path: Path, verify: bool = False):
+        self.path = path
+        pack_index = load_pack_index(path)
+        self.index = pack_index.members
+        self._file = path.open("rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size:
+            self._data: Union[mmap.mmap, bytes] = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        else:
+            self._data = b""
+        if size != pack_index.size or (
+            verify and hashlib.sha256(self._data).hexdigest() != pack_index.sha256
+        ):
+            self.close()
+            raise ValueError(f"{path} does not match its index")
+
+    def raw(self, member_id: str) -> bytes:
+        """A member's serialized profile; raises KeyError if absent"""
+        offset, length = self.index[member_id]
+        count("profile_pack.reads")
+        return self._data[offset : offset + length]
+
+    def get(self, member_id: str) -> dict:
+        """A member's parsed profile; raises KeyError if absent"""
+        return json.loads(self.raw(member_id))
+
+    def __contains__(self, member_id: object) -> bool:
+        return member_id in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def close(self) -> None:
+        """Unmaps and closes the pack"""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> ProfilePack:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
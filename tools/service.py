@@ -0,0 +1,409 @@
+"""Local HTTP/JSON query service with warm caches.
+
+Loads every session under the data root once, computes it, and answers
+queries from memory instead of paying interpreter start, catalog import and
+session load per request. Summaries and inequality measures are computed when
+a session loads; profiles and what-if results are computed on first request
+and kept. A background thread polls the session files and reloads any session
+whose files changed.
+
+Endpoints (GET, JSON):
+    /sessions
+    /sessions/<session_id>/summary
+    /sessions/<session_id>/gini
+    /sessions/<session_id>/members/<member_id>
+    /sessions/<session_id>/what-if?stipend_factor=1.0,1.1&by_chamber=1
+
+What-if parameters are the `Scenario` fields; comma-separated values are
+swept as a grid, as `tools.what_if` does.
+
+Run from the root:
+    py -m tools.service --port 8765
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import sys
+import threading
+import traceback
+from typing import Any, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from config.session_config import SessionConfig, get_session_config
+from data.session_loader import LoadedSession, discover_sessions, load_session
+from models.batch import SessionComp, compute_session
+from models.scenarios import SCENARIO_FIELDS, ScenarioModel, scenario_grid
+from tools.member_profile import generate_member_profile
+from tools.session_report import generate_session_report
+from tools.stats import gini, theil
+from tools.what_if import parameter_type, scenario_table
+from tools.writers import dump_json_min
+
+DEFAULT_PORT = 8765
+DEFAULT_RELOAD_INTERVAL = 1.0
+MAX_SCENARIOS = 10_000
+WHAT_IF_CACHE_SIZE = 256
+
+_FileStamp = tuple[str, int, int]
+
+
+class NotFound(KeyError):
+    """An unknown session, member or endpoint (404)"""
+
+
+class BadRequest(ValueError):
+    """Invalid query parameters (400)"""
+
+
+def session_stamp(session_dir: Path) -> tuple[_FileStamp, ...]:
+    """(name, mtime_ns, size) of a session's JSON and JSON Lines files; the
+    snapshot the loader writes is not included
+    """
+    stamps = []
+    for path in session_dir.iterdir() if session_dir.is_dir() else ():
+        if path.suffix in (".json", ".jsonl"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            stamps.append((path.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(stamps))
+
+
+def _encode(data: Any) -> bytes:
+    return dump_json_min(data).encode("utf-8")
+
+
+def _inequality(loaded: LoadedSession, comp: SessionComp) -> dict[str, Any]:
+    """Gini and Theil indexes of stipends and totals, overall and by chamber"""
+    chambers = np.array([m.chamber.value for m in loaded.members.values()])
+    by_chamber = {}
+    for chamber in sorted(set(chambers.tolist())):
+        cols = chambers == chamber
+        by_chamber[chamber] = {
+            "members": int(cols.sum()),
+            "stipend_gini": gini(comp.stipends_9b[cols]),
+            "total_gini": gini(comp.total[cols]),
+        }
+    return {
+        "session_id": loaded.session.id,
+        "members": len(comp),
+        "stipends_9b": {
+            "gini": gini(comp.stipends_9b),
+            "theil": theil(comp.stipends_9b),
+        },
+        "total": {"gini": gini(comp.total), "theil": theil(comp.total)},
+        "by_chamber": by_chamber,
+    }
+
+
+@dataclass(frozen=True)
+class SessionState:
+    """A loaded, computed session and the responses served from it"""
+
+    stamp: tuple[_FileStamp, ...]
+    loaded: LoadedSession
+    config: SessionConfig
+    comp: SessionComp
+    model: ScenarioModel
+    summary: bytes
+    inequality: bytes
+    profiles: dict[str, bytes] = field(default_factory=dict)
+    what_if: dict[str, bytes] = field(default_factory=dict)
+
+    @staticmethod
+    def load(root: Path, session_id: str) -> SessionState:
+        """Loads and computes a session, with its summary and inequality
+        responses serialized up front
+        """
+        stamp = session_stamp(root / session_id)
+        loaded = load_session(root, session_id)
+        config = get_session_config(session_id, root)
+        comp = compute_session(loaded, config)
+        report = generate_session_report(loaded, comp)
+        validation = {
+            k: v for k, v in report.validation_summary.items() if k != "all_issues"
+        }
+        summary = {
+            "session_id": session_id,
+            "session_label": loaded.session.label,
+            "summary_statistics": report.summary_statistics,
+            "validation": validation,
+        }
+        return SessionState(
+            stamp=stamp,
+            loaded=loaded,
+            config=config,
+            comp=comp,
+            model=ScenarioModel(loaded, config, comp.member_ids),
+            summary=_encode(summary),
+            inequality=_encode(_inequality(loaded, comp)),
+        )
+
+    def profile(self, member_id: str) -> bytes:
+        """A member's profile; raises NotFound if they are not in the session"""
+        cached = self.profiles.get(member_id)
+        if cached is None:
+            member = self.loaded.members.get(member_id)
+            if member is None:
+                raise NotFound(
+                    f"No member {member_id} in session {self.comp.session.id}"
+                )
+            session = self.loaded.session
+            profile = generate_member_profile(
+                member,
+                session,
+                session.id,
+                self.comp.result_for(member_id),
+                config=self.config,
+            )
+            cached = self.profiles[member_id] = _encode(profile.to_dict())
+        return cached
+
+    def evaluate(self, query: dict[str, list[str]]) -> bytes:
+        """What-if results for query parameters; raises BadRequest for unknown
+        parameters, bad values or too many scenarios
+        """
+        axes: dict[str, list[Any]] = {}
+        by_chamber = False
+        for key, values in query.items():
+            name = key.replace("-", "_")
+            if name == "by_chamber":
+                by_chamber = values[-1].lower() in ("1", "true", "yes")
+                continue
+            if name not in SCENARIO_FIELDS:
+                raise BadRequest(f"Unknown scenario parameter {key}")
+            kind = parameter_type(name)
+            try:
+                axes[name] = [kind(v) for raw in values for v in raw.split(",") if v]
+            except ValueError as e:
+                raise BadRequest(f"Bad value for {key}: {e}") from e
+        cache_key = json.dumps([sorted(axes.items()), by_chamber])
+        cached = self.what_if.get(cache_key)
+        if cached is not None:
+            return cached
+        n_scenarios = int(np.prod([len(v) for v in axes.values()]))
+        if n_scenarios > MAX_SCENARIOS:
+            raise BadRequest(
+                f"{n_scenarios} scenarios requested; the limit is {MAX_SCENARIOS}"
+            )
+        sweep = self.model.run(scenario_grid(**axes))
+        cached = _encode(
+            {
+                "session_id": self.loaded.session.id,
+                "members": len(sweep.member_ids),
+                "scenarios": scenario_table(sweep, by_chamber),
+            }
+        )
+        if len(self.what_if) >= WHAT_IF_CACHE_SIZE:
+            self.what_if.pop(next(iter(self.what_if)), None)
+        self.what_if[cache_key] = cached
+        return cached
+
+
+class CompService:
+    """Sessions under a data root, kept loaded and computed"""
+
+    def __init__(self, root: Path, session_ids: Optional[list[str]] = None):
+        self.root = root
+        self.session_ids = session_ids
+        self._states: dict[str, SessionState] = {}
+        self._refresh_lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> list[str]:
+        """Reloads sessions whose files changed, loads new ones and drops
+        removed ones; returns the IDs (re)loaded. A session that fails to load
+        for any reason (e.g. a file caught mid-write or malformed) keeps
+        serving its previous state and is retried on the next refresh
+        """
+        with self._refresh_lock:
+            ids = (
+                discover_sessions(self.root)
+                if self.session_ids is None
+                else self.session_ids
+            )
+            states: dict[str, SessionState] = {}
+            reloaded = []
+            for session_id in ids:
+                old = self._states.get(session_id)
+                if old is not None and old.stamp == session_stamp(
+                    self.root / session_id
+                ):
+                    states[session_id] = old
+                    continue
+                try:
+                    states[session_id] = SessionState.load(self.root, session_id)
+                except Exception as e:  # pylint: disable = broad-except
+                    print(
+                        f"[WARN] Could not load {session_id}: "
+                        f"{type(e).__name__}: {e}",
+                        file=sys.stderr,
+                    )
+                    if old is not None:
+                        states[session_id] = old
+                    continue
+                reloaded.append(session_id)
+            self._states = states
+        return reloaded
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def state(self, session_id: str) -> SessionState:
+        """A session's current state; raises NotFound if it is not loaded"""
+        state = self._states.get(session_id)
+        if state is None:
+            raise NotFound(f"No session {session_id}")
+        return state
+
+    def sessions(self) -> bytes:
+        """The loaded sessions and their member counts"""
+        return _encode(
+            {
+                "sessions": [
+                    {"session_id": sid, "members": len(state.comp)}
+                    for sid, state in self._states.items()
+                ]
+            }
+        )
+
+    def handle(self, target: str) -> tuple[int, bytes]:
+        """Status and JSON body for a request target (path and query); any
+        unexpected error is logged and answered with a 500
+        """
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.split("/") if p]
+        try:
+            if parts == ["sessions"]:
+                return 200, self.sessions()
+            if len(parts) >= 3 and parts[0] == "sessions":
+                state = self.state(parts[1])
+                route = parts[2:]
+                if route == ["summary"]:
+                    return 200, state.summary
+                if route == ["gini"]:
+                    return 200, state.inequality
+                if route == ["what-if"]:
+                    return 200, state.evaluate(parse_qs(url.query))
+                if len(route) == 2 and route[0] == "members":
+                    return 200, state.profile(route[1])
+            return 404, _encode({"error": f"Unknown endpoint {url.path}"})
+        except NotFound as e:
+            return 404, _encode({"error": e.args[0]})
+        except BadRequest as e:
+            return 400, _encode({"error": str(e)})
+        except Exception as e:  # pylint: disable = broad-except
+            traceback.print_exc()
+            return 500, _encode({"error": f"{type(e).__name__}: {e}"})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: ServiceServer
+
+    def do_GET(self) -> None:  # pylint: disable = invalid-name
+        """Answers a query"""
+        status, body = self.server.service.handle(self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(
+        self, format: str, *args: Any
+    ) -> None:  # pylint: disable = redefined-builtin
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ServiceServer(ThreadingHTTPServer):
+    """HTTP server answering from a `CompService`, reloading it in the
+    background every `reload_interval` seconds (never if 0)
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        service: CompService,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        verbose: bool = False,
+    ):
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
+        self._stop_reloading = threading.Event()
+        if reload_interval > 0:
+            threading.Thread(
+                target=self._reload, args=(reload_interval,), daemon=True
+            ).start()
+
+    def _reload(self, interval: float) -> None:
+        while not self._stop_reloading.wait(interval):
+            try:
+                reloaded = self.service.refresh()
+            except Exception:  # pylint: disable = broad-except
+                # e.g. the data root itself vanished; keep polling
+                traceback.print_exc()
+                continue
+            for session_id in reloaded:
+                print(f"[OK] Reloaded session {session_id}", file=sys.stderr)
+
+    def server_close(self) -> None:
+        self._stop_reloading.set()
+        super().server_close()
+
+
+def main() -> None:
+    """Serves compensation queries until interrupted"""
+    parser = argparse.ArgumentParser(
+        description="Serve compensation queries over HTTP from warm caches"
+    )
+    parser.add_argument(
+        "--data-root",
+        default="data/sessions",
+        help="Root directory containing session data (default: data/sessions)",
+    )
+    parser.add_argument(
+        "--sessions",
+        nargs="+",
+        metavar="SESSION_ID",
+        help="Sessions to serve (default: every session under --data-root)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="(default: 127.0.0.1)")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"(default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--reload-interval",
+        type=float,
+        default=DEFAULT_RELOAD_INTERVAL,
+        help="Seconds between checks for changed session files; 0 disables "
+        f"reloading (default: {DEFAULT_RELOAD_INTERVAL})",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+    service = CompService(Path(args.data_root), args.sessions)
+    with ServiceServer(
+        (args.host, args.port), service, args.reload_interval, args.verbose
+    ) as server:
+        host, port = server.server_address[:2]
+        print(f"[OK] Serving {len(service)} session(s) on http://{host}:{port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
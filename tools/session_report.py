@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
-from statistics import median
-from typing import Any
+from typing import Optional
+
+import numpy as np
 
 from data.session_loader import LoadedSession
-from models.total_comp import total_comp_for_member
+from instrumentation import timed
+from models.batch import SessionComp, compute_session
 from tools.models import SessionReport, SessionSummaryStats
+from tools.stats import grouped_stats, summarize, top_k
 from validators import (
     validate_role_catalog,
     validate_session_data,
@@ -16,26 +19,30 @@ from validators import (
 )
 
 
-def generate_session_report(loaded: LoadedSession) -> SessionReport:
+@timed("session_report")
+def generate_session_report(
+    loaded: LoadedSession, comp: Optional[SessionComp] = None
+) -> SessionReport:
     """Generate a comprehensive session report"""
     session = loaded.session
+    if comp is None:
+        comp = compute_session(loaded)
     all_results = []
-    for member in loaded.members.values():
-        comp_result = total_comp_for_member(member, session)
+    for i, member in enumerate(loaded.members.values()):
         all_results.append(
             {
                 "member_id": member.member_id,
                 "name": member.name,
                 "chamber": member.chamber.value,
                 "party": member.party.value,
-                "base_salary": comp_result.components[0].amount.value,
-                "stipends_9b": comp_result.components[1].amount.value,
-                "travel_9c": comp_result.components[2].amount.value,
-                "total": comp_result.total.value,
+                "base_salary": int(comp.base_salary[i]),
+                "stipends_9b": int(comp.stipends_9b[i]),
+                "travel_9c": int(comp.travel_9c[i]),
+                "total": int(comp.total[i]),
                 "distance_miles": member.distance_miles_from_state_house,
             }
         )
-    summary = _generate_summary_stats(session.id, all_results)
+    summary = _generate_summary_stats(session.id, comp, all_results)
     catalog_issues = validate_role_catalog()
     session_issues = validate_session_data(loaded)
     distance_issues = validate_distance_margins(loaded)
@@ -76,53 +83,54 @@ def generate_session_report(loaded: LoadedSession) -> SessionReport:
 
 
 def _generate_summary_stats(
-    session_id: str, results: list[dict[str, Any]]
+    session_id: str, comp: SessionComp, results: list[dict]
 ) -> SessionSummaryStats:
-    """Generate summary statistics from results"""
-    total_comp = sum(r["total"] for r in results)
-    totals = [r["total"] for r in results]
-    by_chamber = {}
-    for chamber in ["house", "senate"]:
-        chamber_results = [r for r in results if r["chamber"] == chamber]
-        if chamber_results:
-            chamber_total = sum(r["total"] for r in chamber_results)
-            by_chamber[chamber] = {
-                "count": len(chamber_results),
-                "total_compensation": chamber_total,
-                "average_compensation": chamber_total / len(chamber_results),
-                "median_compensation": median([r["total"] for r in chamber_results]),
-            }
-    by_party = {}
-    for party in set(r["party"] for r in results):
-        party_results = [r for r in results if r["party"] == party]
-        if party_results:
-            party_total = sum(r["total"] for r in party_results)
-            by_party[party] = {
-                "count": len(party_results),
-                "total_compensation": party_total,
-                "average_compensation": party_total / len(party_results),
-            }
+    """Generate summary statistics from the comp arrays; `results` holds the
+    per-member rows in the same order
+    """
+    chambers = np.array([r["chamber"] for r in results])
+    parties = np.array([r["party"] for r in results])
+    overall = summarize(comp.total)
+    chamber_stats = grouped_stats(chambers, comp.total)
+    by_chamber = {
+        chamber: {
+            "count": chamber_stats[chamber]["count"],
+            "total_compensation": chamber_stats[chamber]["total"],
+            "average_compensation": chamber_stats[chamber]["mean"],
+            "median_compensation": chamber_stats[chamber]["median"],
+        }
+        for chamber in ["house", "senate"]
+        if chamber in chamber_stats
+    }
+    by_party = {
+        party: {
+            "count": stats["count"],
+            "total_compensation": stats["total"],
+            "average_compensation": stats["mean"],
+        }
+        for party, stats in grouped_stats(parties, comp.total).items()
+    }
+    with_stipends = int(np.count_nonzero(comp.stipends_9b > 0))
     stipend_distribution = {
-        "0_stipends": len([r for r in results if r["stipends_9b"] == 0]),
-        "1_or_more_stipends": len([r for r in results if r["stipends_9b"] > 0]),
+        "0_stipends": int(np.count_nonzero(comp.stipends_9b == 0)),
+        "1_or_more_stipends": with_stipends,
     }
-    top_10 = sorted(results, key=lambda x: x["total"], reverse=True)[:10]
     top_earners = [
         {
-            "rank": i + 1,
-            "member_id": r["member_id"],
-            "name": r["name"],
-            "chamber": r["chamber"],
-            "total": r["total"],
+            "rank": rank + 1,
+            "member_id": results[i]["member_id"],
+            "name": results[i]["name"],
+            "chamber": results[i]["chamber"],
+            "total": results[i]["total"],
         }
-        for i, r in enumerate(top_10)
+        for rank, i in enumerate(top_k(comp.total, 10))
     ]
     return SessionSummaryStats(
         session_id=session_id,
         total_members=len(results),
-        total_compensation=total_comp,
-        average_compensation=total_comp / len(results) if results else 0,
-        median_compensation=median(totals) if totals else 0,
+        total_compensation=overall["total"],
+        average_compensation=overall["mean"],
+        median_compensation=overall["median"],
         by_chamber=by_chamber,
         by_party=by_party,
         stipend_distribution=stipend_distribution,
@@ -0,0 +1,47 @@
+"""Session-level source table for profiles that reference sources by key.
+
+In shared-sources output, each profile lists source keys instead of repeating
+every source's label, URL and details; the sources themselves are written
+once per session to `sources.json`. Registry sources are keyed by their ID.
+Sources built per use (distance overrides, which share an ID but differ by
+URL) get the ID plus a short content hash, so keys are stable across builds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterable
+
+from audit.provenance import SourceRef
+from audit.sources_registry import _ALL_SOURCES, create_distance_override_source
+from config.session_config import SessionConfig
+from tools.models import ProvenanceInfo
+
+SOURCES_NAME = "sources.json"
+
+
+def source_key(source: SourceRef) -> str:
+    """Stable key for a source within a source table"""
+    if _ALL_SOURCES.get(source.id) == source:
+        return source.id
+    content = "\0".join([source.url or "", *sorted(source.details)])
+    return f"{source.id}:{hashlib.sha256(content.encode('utf-8')).hexdigest()[:8]}"
+
+
+def session_sources(config: SessionConfig) -> list[SourceRef]:
+    """Every source a session's profiles can cite: the registry plus one
+    override source per distance exception
+    """
+    overrides = {
+        create_distance_override_source(exception.source)
+        for exception in config.distance_exceptions.values()
+    }
+    return [*_ALL_SOURCES.values(), *overrides]
+
+
+def build_source_table(sources: Iterable[SourceRef]) -> dict[str, dict[str, Any]]:
+    """Key -> exported source, sorted by key"""
+    table = {
+        source_key(s): ProvenanceInfo.from_source_ref(s).to_dict() for s in sources
+    }
+    return dict(sorted(table.items()))
@@ -0,0 +1,167 @@
+"""Vectorized statistics over columnar compensation arrays.
+
+Every function takes NumPy arrays (such as the columns of a `SessionComp`)
+and returns plain Python numbers, so results can go straight into JSON.
+Grouped statistics sort once by (group, value) and slice, instead of making a
+Python pass per group.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+ArrayLike = Sequence[int] | Sequence[float] | np.ndarray
+
+
+def _scalar(x: Any) -> int | float:
+    """Python int or float for a NumPy scalar"""
+    return x.item() if isinstance(x, np.generic) else x
+
+
+def _sorted_median(sorted_values: np.ndarray) -> int | float:
+    """Median of sorted values, typed like `statistics.median`: the middle
+    element for odd counts, the float mean of the middle two for even counts
+    """
+    n = len(sorted_values)
+    mid = n // 2
+    if n % 2:
+        return _scalar(sorted_values[mid])
+    return (_scalar(sorted_values[mid - 1]) + _scalar(sorted_values[mid])) / 2
+
+
+def median(values: ArrayLike) -> int | float:
+    """Median without a full sort; 0 for no values"""
+    arr = np.asarray(values)
+    n = len(arr)
+    if n == 0:
+        return 0
+    mid = n // 2
+    part = np.partition(arr, [mid - 1, mid] if n % 2 == 0 else [mid])
+    return _sorted_median(
+        part[mid - 1 : mid + 1] if n % 2 == 0 else part[mid : mid + 1]
+    )
+
+
+def summarize(values: ArrayLike, percentiles: Iterable[float] = ()) -> dict[str, Any]:
+    """Count, total, mean, median and any requested percentiles"""
+    arr = np.asarray(values)
+    n = len(arr)
+    total = _scalar(arr.sum()) if n else 0
+    stats: dict[str, Any] = {
+        "count": n,
+        "total": total,
+        "mean": total / n if n else 0,
+        "median": median(arr),
+    }
+    for q in percentiles:
+        stats[f"p{q:g}"] = float(np.percentile(arr, q)) if n else 0.0
+    return stats
+
+
+def grouped_stats(
+    labels: ArrayLike, values: ArrayLike, percentiles: Iterable[float] = ()
+) -> dict[str, dict[str, Any]]:
+    """`summarize` for each distinct label, keyed in sorted label order"""
+    labels = np.asarray(labels)
+    arr = np.asarray(values)
+    if len(arr) == 0:
+        return {}
+    keys, inverse = np.unique(labels, return_inverse=True)
+    order = np.lexsort((arr, inverse))
+    sorted_values = arr[order]
+    counts = np.bincount(inverse, minlength=len(keys))
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    totals = np.add.reduceat(sorted_values, bounds[:-1])
+    qs = list(percentiles)
+    result: dict[str, dict[str, Any]] = {}
+    for g, key in enumerate(keys):
+        group = sorted_values[bounds[g] : bounds[g + 1]]
+        n = int(counts[g])
+        total = _scalar(totals[g])
+        stats: dict[str, Any] = {
+            "count": n,
+            "total": total,
+            "mean": total / n,
+            "median": _sorted_median(group),
+        }
+        for q in qs:
+            stats[f"p{q:g}"] = float(np.percentile(group, q))
+        result[_scalar(key)] = stats
+    return result
+
+
+def histogram(values: ArrayLike, edges: ArrayLike) -> list[int]:
+    """Counts per bin; bins are [edges[i], edges[i + 1]) and the last is closed"""
+    counts, _ = np.histogram(np.asarray(values), bins=np.asarray(edges))
+    return counts.tolist()
+
+
+def top_k(values: ArrayLike, k: int) -> np.ndarray:
+    """Indices of the `k` largest values, largest first, ties in index order.
+
+    Partially sorts around the k-th largest value and fully sorts only the
+    entries at or above it.
+    """
+    arr = np.asarray(values)
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(arr, n - k)[n - k]
+    candidates = np.flatnonzero(arr >= kth)
+    ranked = candidates[np.argsort(-arr[candidates], kind="stable")]
+    return ranked[:k]
+
+
+def gini(values: ArrayLike) -> float:
+    """Gini coefficient; 0 when every value is 0"""
+    arr = np.sort(np.asarray(values))
+    n = len(arr)
+    cumulative = np.cumsum(arr)
+    if n == 0 or cumulative[-1] == 0:
+        return 0.0
+    return float((n + 1 - 2 * (np.sum(cumulative) / cumulative[-1])) / n)
+
+
+def row_medians(matrix: np.ndarray) -> list[int | float]:
+    """`median` of each row of a 2-D array"""
+    arr = np.sort(np.asarray(matrix), axis=1)
+    if arr.shape[1] == 0:
+        return [0] * len(arr)
+    return [_sorted_median(row) for row in arr]
+
+
+def row_gini(matrix: np.ndarray) -> np.ndarray:
+    """`gini` of each row of a 2-D array"""
+    arr = np.sort(np.asarray(matrix), axis=1)
+    n = arr.shape[1]
+    cumulative = np.cumsum(arr, axis=1)
+    if n == 0:
+        return np.zeros(len(arr))
+    last = cumulative[:, -1]
+    safe = np.where(last == 0, 1, last)
+    result = (n + 1 - 2 * (np.sum(cumulative, axis=1) / safe)) / n
+    return np.where(last == 0, 0.0, result)
+
+
+def theil(values: ArrayLike) -> float:
+    """Theil T index; zero values contribute nothing"""
+    arr = np.asarray(values, dtype=np.float64)
+    if len(arr) == 0 or arr.sum() == 0:
+        return 0.0
+    shares = arr / arr.mean()
+    positive = shares[shares > 0]
+    return float(np.sum(positive * np.log(positive)) / len(arr))
+
+
+def lorenz_points(values: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """Cumulative population share and value share, starting at (0, 0)"""
+    arr = np.sort(np.asarray(values, dtype=np.float64))
+    n = len(arr)
+    population = np.arange(n + 1) / max(n, 1)
+    cumulative = np.concatenate(([0.0], np.cumsum(arr)))
+    if cumulative[-1] == 0:
+        return population, population.copy()
+    return population, cumulative / cumulative[-1]
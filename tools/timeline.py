@@ -0,0 +1,260 @@
+"""Cross-session member timeline index.
+
+Stores each member's computed totals for every session built so far, keyed by
+member ID, so a member's compensation history is a single lookup instead of
+loading and computing every session. The index is updated incrementally by
+`tools.generate_outputs` (only members whose inputs changed are rewritten)
+and can also be built directly from session data.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from config.session_config import get_session_config
+from data.session_loader import LoadedSession, load_sessions
+from instrumentation import timed
+from models.batch import SessionComp, compute_session
+from tools.manifest import (
+    BuildManifest,
+    MemberEntry,
+    member_inputs_hash,
+    session_inputs_hash,
+)
+from tools.writers import write_json
+
+TIMELINE_NAME = "member_timeline.json"
+TIMELINE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    """One member's computed compensation in one session"""
+
+    session_id: str
+    name: str
+    chamber: str
+    party: str
+    base_salary: int
+    stipends_9b: int
+    travel_9c: int
+    total: int
+    paid_roles: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class SessionStamp:
+    """When and from what inputs a session's entries were computed"""
+
+    start_year: int
+    inputs_hash: str
+
+
+@dataclass
+class MemberTimeline:
+    """Member ID -> per-session entries, oldest session first"""
+
+    sessions: dict[str, SessionStamp] = field(default_factory=dict)
+    members: dict[str, list[TimelineEntry]] = field(default_factory=dict)
+
+    @staticmethod
+    def load(path: Path) -> MemberTimeline:
+        """Reads an index, or returns an empty one if missing or outdated"""
+        if not path.exists():
+            return MemberTimeline()
+        data: dict = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("timeline_version") != TIMELINE_VERSION:
+            return MemberTimeline()
+        return MemberTimeline(
+            sessions={
+                sid: SessionStamp(**stamp) for sid, stamp in data["sessions"].items()
+            },
+            members={
+                mid: [TimelineEntry(**entry) for entry in entries]
+                for mid, entries in data["members"].items()
+            },
+        )
+
+    def inputs_hash(self, session_id: str) -> Optional[str]:
+        """Hash of the inputs the session's entries were computed from (see
+        `BuildManifest.inputs_digest`), if the session is indexed
+        """
+        stamp = self.sessions.get(session_id)
+        return stamp.inputs_hash if stamp else None
+
+    def timeline(self, member_id: str) -> list[TimelineEntry]:
+        """A member's entries, oldest session first; empty if unknown"""
+        return self.members.get(member_id, [])
+
+    def _order(self, entry: TimelineEntry) -> tuple[int, str]:
+        return self.sessions[entry.session_id].start_year, entry.session_id
+
+    def _put(self, member_id: str, entry: TimelineEntry) -> None:
+        """Adds or replaces a member's entry for one session"""
+        entries = [
+            e for e in self.timeline(member_id) if e.session_id != entry.session_id
+        ]
+        entries.append(entry)
+        entries.sort(key=self._order)
+        self.members[member_id] = entries
+
+    def remove(self, session_id: str, member_ids: Iterable[str]) -> None:
+        """Drops the session's entries for the given members"""
+        for member_id in member_ids:
+            entries = [
+                e for e in self.timeline(member_id) if e.session_id != session_id
+            ]
+            if entries:
+                self.members[member_id] = entries
+            else:
+                self.members.pop(member_id, None)
+
+    @timed("timeline.update")
+    def update_session(
+        self,
+        loaded: LoadedSession,
+        comp: SessionComp,
+        inputs_hash: str,
+        complete: bool = False,
+    ) -> None:
+        """Records the members in `comp`. With `complete`, `comp` covers the
+        whole session and members missing from it are dropped from the session
+        """
+        session = loaded.session
+        self.sessions[session.id] = SessionStamp(
+            start_year=int(session.start_year), inputs_hash=inputs_hash
+        )
+        if complete:
+            gone = [
+                mid
+                for mid, entries in self.members.items()
+                if mid not in comp.index
+                and any(e.session_id == session.id for e in entries)
+            ]
+            self.remove(session.id, gone)
+        for i, member_id in enumerate(comp.member_ids):
+            member = loaded.members[member_id]
+            selection = comp.results[i].selection
+            paid = [rs.role_code for rs in selection.paid_roles] if selection else []
+            self._put(
+                member_id,
+                TimelineEntry(
+                    session_id=session.id,
+                    name=member.name,
+                    chamber=member.chamber.value,
+                    party=member.party.value,
+                    base_salary=int(comp.base_salary[i]),
+                    stipends_9b=int(comp.stipends_9b[i]),
+                    travel_9c=int(comp.travel_9c[i]),
+                    total=int(comp.total[i]),
+                    paid_roles=paid,
+                ),
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the index to a dict"""
+        return {
+            "timeline_version": TIMELINE_VERSION,
+            "sessions": {sid: asdict(s) for sid, s in sorted(self.sessions.items())},
+            "members": {
+                mid: [asdict(e) for e in entries]
+                for mid, entries in sorted(self.members.items())
+            },
+        }
+
+    def save(self, path: Path, announce: bool = True) -> None:
+        """Writes the index"""
+        write_json(self.to_dict(), path, announce=announce)
+
+
+def build_timeline(
+    data_root: Path,
+    path: Path,
+    session_ids: Optional[Iterable[str]] = None,
+    force: bool = False,
+) -> MemberTimeline:
+    """Adds sessions (every discovered one by default) to the index at `path`,
+    computing only sessions whose inputs changed since they were indexed
+    """
+    timeline = MemberTimeline() if force else MemberTimeline.load(path)
+    registry = load_sessions(data_root, session_ids)
+    for session_id in registry:
+        loaded = registry[session_id]
+        config = get_session_config(session_id, data_root)
+        manifest = BuildManifest(session_id, session_inputs_hash(config))
+        for member in loaded.members.values():
+            inputs = member_inputs_hash(member, config, manifest.session_hash)
+            manifest.members[member.member_id] = MemberEntry(inputs=inputs, output="")
+        inputs_hash = manifest.inputs_digest()
+        if timeline.inputs_hash(session_id) == inputs_hash:
+            continue
+        comp = compute_session(loaded, config)
+        timeline.update_session(loaded, comp, inputs_hash, complete=True)
+    timeline.save(path)
+    return timeline
+
+
+def _print_timeline(member_id: str, entries: list[TimelineEntry]) -> None:
+    """Prints a member's timeline as a table"""
+    if not entries:
+        print(f"No sessions indexed for {member_id}")
+        return
+    print(f"{entries[-1].name} ({member_id})")
+    print(f"{'Session':<12}{'Chamber':<9}{'Base':>10}{'9B':>10}{'9C':>9}{'Total':>11}")
+    for e in entries:
+        print(
+            f"{e.session_id:<12}{e.chamber:<9}{e.base_salary:>10,}"
+            f"{e.stipends_9b:>10,}{e.travel_9c:>9,}{e.total:>11,}"
+        )
+
+
+def main() -> None:
+    """Builds or queries the member timeline index"""
+    parser = argparse.ArgumentParser(
+        description="Cross-session compensation timeline per member"
+    )
+    parser.add_argument(
+        "--index",
+        default=f"docs/{TIMELINE_NAME}",
+        help=f"Timeline index path (default: docs/{TIMELINE_NAME})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Index sessions from session data")
+    build.add_argument(
+        "session_ids", nargs="*", help="Sessions to index (default: all found)"
+    )
+    build.add_argument(
+        "--data-root",
+        default="data/sessions",
+        help="Root directory containing session data (default: data/sessions)",
+    )
+    build.add_argument(
+        "--force", action="store_true", help="Rebuild the index from scratch"
+    )
+    show = commands.add_parser("show", help="Print a member's timeline")
+    show.add_argument("member_id", help="Member ID, e.g. KES0")
+    show.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+    index = Path(args.index)
+    if args.command == "build":
+        timeline = build_timeline(
+            Path(args.data_root), index, args.session_ids or None, args.force
+        )
+        print(
+            f"Indexed {len(timeline.members)} members across "
+            f"{len(timeline.sessions)} session(s)"
+        )
+        return
+    entries = MemberTimeline.load(index).timeline(args.member_id)
+    if args.json:
+        print(json.dumps([asdict(e) for e in entries], indent=2))
+    else:
+        _print_timeline(args.member_id, entries)
+
+
+if __name__ == "__main__":
+    main()
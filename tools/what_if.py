@@ -0,0 +1,156 @@
+"""What-if sweeps: tidy tables of session totals under parameter overrides"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+import numpy as np
+
+from config.session_config import get_session_config
+from data.session_loader import load_session
+from instrumentation import add_profile_report_argument, profile_report
+from models.scenarios import (
+    SCENARIO_FIELDS,
+    ScenarioSweep,
+    run_scenarios,
+    scenario_grid,
+)
+from tools.stats import row_gini, row_medians
+
+
+def _metrics(sweep: ScenarioSweep, cols: np.ndarray) -> dict[str, list[Any]]:
+    """Metric columns, one entry per scenario, over the member columns `cols`"""
+    stipends = sweep.stipends_9b[:, cols]
+    total = sweep.total[:, cols]
+    n = len(cols)
+    total_comp = total.sum(axis=1).tolist()
+    return {
+        "members": [n] * len(sweep),
+        "total_base_salary": sweep.base_salary[:, cols].sum(axis=1).tolist(),
+        "total_stipends_9b": stipends.sum(axis=1).tolist(),
+        "total_travel_9c": sweep.travel_9c[:, cols].sum(axis=1).tolist(),
+        "total_compensation": total_comp,
+        "mean_compensation": [t / n if n else 0 for t in total_comp],
+        "median_compensation": row_medians(total),
+        "members_with_stipend": np.count_nonzero(stipends, axis=1).tolist(),
+        "stipend_gini": np.round(row_gini(stipends), 6).tolist(),
+    }
+
+
+def scenario_table(
+    sweep: ScenarioSweep, by_chamber: bool = False
+) -> list[dict[str, Any]]:
+    """One row per scenario (and per chamber, if `by_chamber`): the resolved
+    parameters followed by the metric columns
+    """
+    groups: list[tuple[str, np.ndarray]] = [("all", np.arange(len(sweep.member_ids)))]
+    if by_chamber:
+        for chamber in sorted(set(sweep.chambers.tolist())):
+            groups.append((chamber, np.flatnonzero(sweep.chambers == chamber)))
+    metrics = [(chamber, _metrics(sweep, cols)) for chamber, cols in groups]
+    rows: list[dict[str, Any]] = []
+    for s, resolved in enumerate(sweep.resolved):
+        params = resolved.to_dict()
+        for chamber, columns in metrics:
+            row: dict[str, Any] = {"scenario": s, **params}
+            if by_chamber:
+                row["chamber"] = chamber
+            row.update({name: values[s] for name, values in columns.items()})
+            rows.append(row)
+    return rows
+
+
+def write_table(rows: list[dict[str, Any]], out: TextIO, fmt: str) -> None:
+    """Writes rows as CSV or JSON"""
+    if fmt == "json":
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+        return
+    if not rows:
+        return
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+# Scenario parameters that take fractional values; the rest are integers
+FLOAT_PARAMETERS = frozenset(
+    {"travel_threshold_miles", "travel_factor", "stipend_factor"}
+)
+
+
+def parameter_type(name: str) -> type:
+    """Type of a scenario parameter's values"""
+    return float if name in FLOAT_PARAMETERS else int
+
+
+def _axis_arguments(parser: argparse.ArgumentParser) -> None:
+    """One multi-valued option per scenario parameter"""
+    for name in SCENARIO_FIELDS:
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            nargs="+",
+            type=parameter_type(name),
+            metavar="VALUE",
+            help=f"Values to sweep for {name} (default: the session's own)",
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Sweeps a grid of parameter overrides over one session"""
+    parser = argparse.ArgumentParser(
+        description="Evaluate compensation totals under what-if parameter grids"
+    )
+    parser.add_argument("session_id", help="Session ID, e.g. 2025-2026")
+    parser.add_argument(
+        "--data-root",
+        default="data/sessions",
+        help="Root directory containing session data (default: data/sessions)",
+    )
+    _axis_arguments(parser)
+    parser.add_argument(
+        "--by-chamber",
+        action="store_true",
+        help="Add a row per chamber for every scenario",
+    )
+    parser.add_argument(
+        "--format", choices=["csv", "json"], default="csv", help="Output format"
+    )
+    parser.add_argument("--out", help="Write the table here instead of stdout")
+    add_profile_report_argument(parser)
+    args = parser.parse_args(argv)
+    with profile_report(args.profile_report):
+        data_root = Path(args.data_root)
+        loaded = load_session(data_root, args.session_id)
+        config = get_session_config(args.session_id, data_root)
+        axes = {
+            name: getattr(args, name)
+            for name in SCENARIO_FIELDS
+            if getattr(args, name) is not None
+        }
+        scenarios = scenario_grid(**axes)
+        start = time.perf_counter()
+        sweep = run_scenarios(loaded, scenarios, config)
+        rows = scenario_table(sweep, args.by_chamber)
+        elapsed = time.perf_counter() - start
+        if args.out:
+            with open(args.out, "w", encoding="utf-8", newline="") as f:
+                write_table(rows, f, args.format)
+        else:
+            write_table(rows, sys.stdout, args.format)
+        print(
+            f"{len(scenarios)} scenario(s) x {len(sweep.member_ids)} members "
+            f"in {elapsed:.3f}s",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
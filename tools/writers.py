@@ -2,22 +2,78 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
+from instrumentation import count, enabled, timed
 
-def write_json(data: Any, path: Path, indent: int = 2) -> None:
-    """Write data to JSON file with pretty formatting"""
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+
+@timed("json.serialize")
+def dump_json(data: Any, indent: Optional[int] = 2) -> str:
+    """Serialize data exactly as `write_json` would write it"""
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+@timed("write_output")
+def write_text(text: str, path: Path, announce: bool = True) -> None:
+    """Write already-serialized output to a file"""
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+        f.write(text)
+    if enabled():
+        count("files_written")
+        count("bytes_written", path.stat().st_size)
+    if not announce:
+        return
     try:
         print(f"[OK] Wrote {path}")
     except UnicodeEncodeError:
         print(f"[OK] Wrote {path}")
 
 
+def write_json(
+    data: Any, path: Path, indent: Optional[int] = 2, announce: bool = True
+) -> None:
+    """Write data to JSON file with pretty formatting"""
+    write_text(dump_json(data, indent), path, announce)
+
+
 def write_json_compact(data: Any, path: Path) -> None:
     """Write data to JSON file in compact format"""
     write_json(data, path, indent=None)
+
+
+@timed("json.serialize")
+def dump_json_min(data: Any) -> str:
+    """Serialize data as minified JSON"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def write_precompressed(text: str, path: Path, announce: bool = True) -> list[Path]:
+    """Write `text` plus `.gz` (and `.br`, if brotli is installed) copies for
+    static hosts that serve precompressed files; returns the paths written
+    """
+    data = text.encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    written = [path]
+    gz_path = path.with_name(path.name + ".gz")
+    gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(gz_path)
+    if brotli is not None:
+        br_path = path.with_name(path.name + ".br")
+        br_path.write_bytes(brotli.compress(data, quality=11))
+        written.append(br_path)
+    if enabled():
+        count("files_written", len(written))
+        count("bytes_written", sum(p.stat().st_size for p in written))
+    if announce:
+        print(f"[OK] Wrote {path} (+ {', '.join(p.suffix for p in written[1:])})")
+    return written
@@ -0,0 +1,194 @@
+"""Tests for the concurrent committee scraper against a local stand-in server"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+from threading import Thread
+from time import monotonic
+
+import pytest
+import requests
+
+from ingest.committees import CHECKPOINT_NAME, dump_committees_raw
+from ingest.common import AsyncFetcher, TokenBucket, fetch_html
+from ingest.http_cache import OfflineCacheMiss, ResponseCache
+
+COMMITTEE_PAGES = {
+    "/Legislators/Profile/AAA1/Committees": """
+    <ul>
+        <li><span>Chairperson, </span>
+            <a href="/Committees/Detail/J33/Committees">Joint Committee on IT</a></li>
+        <li><a href="/Committees/Detail/H34/Committees">House Ways and Means</a></li>
+    </ul>
+    """,
+    "/Legislators/Profile/BBB1/Committees": """
+    <ul>
+        <li><span>Vice Chair, </span>
+            <a href="/Committees/Detail/H34/Committees">House Ways and Means</a></li>
+        <li><a href="/Legislators/Profile/BBB1">Not a committee</a></li>
+    </ul>
+    """,
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Serves COMMITTEE_PAGES over keep-alive HTTP/1.1"""
+
+    protocol_version = "HTTP/1.1"
+    statuses: list[int] = []
+
+    def do_GET(self):  # pylint: disable = invalid-name
+        body = COMMITTEE_PAGES.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = f'"{len(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.statuses.append(200)
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    """A local stand-in for malegislature.gov"""
+    _FixtureHandler.statuses.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_dump_committees_raw_from_local_server(fixture_server, tmp_path: Path):
+    """Concurrent scrape keeps member order and parses every role"""
+    fetcher = AsyncFetcher(
+        base_url=fixture_server,
+        concurrency=2,
+        limiter=TokenBucket(1000, burst=10),
+        cache=ResponseCache(tmp_path / "cache"),
+    )
+    try:
+        out = dump_committees_raw("1-2", ["AAA1", "BBB1"], tmp_path, fetcher=fetcher)
+    finally:
+        fetcher.close()
+    roles = json.loads(out.read_text(encoding="utf-8"))
+    assert [(r["member_id"], r["committee_external_id"]) for r in roles] == [
+        ("AAA1", "J33"),
+        ("AAA1", "H34"),
+        ("BBB1", "H34"),
+    ]
+    assert roles[0]["raw_role_label"] == "Chairperson"
+    assert roles[1]["raw_role_label"] is None
+    assert roles[2]["raw_role_label"] == "Vice Chair"
+
+
+def test_dump_committees_raw_resumes_from_checkpoint(
+    fixture_server, tmp_path: Path, monkeypatch
+):
+    """A failed scrape keeps finished members and a rerun only fetches the rest"""
+
+    def make_fetcher():
+        return AsyncFetcher(
+            base_url=fixture_server,
+            concurrency=1,
+            limiter=TokenBucket(1000, burst=10),
+            cache=ResponseCache(tmp_path / "cache"),
+        )
+
+    member_ids = ["AAA1", "BBB1", "CCC1"]
+    with pytest.raises(requests.HTTPError):
+        dump_committees_raw("1-2", member_ids, tmp_path, fetcher=make_fetcher())
+    checkpoint = tmp_path / "1-2" / CHECKPOINT_NAME
+    assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == 2
+    assert _FixtureHandler.statuses == [200, 200]
+
+    monkeypatch.setitem(
+        COMMITTEE_PAGES,
+        "/Legislators/Profile/CCC1/Committees",
+        '<li><a href="/Committees/Detail/S50/Committees">Senate Ethics</a></li>',
+    )
+    out = dump_committees_raw("1-2", member_ids, tmp_path, fetcher=make_fetcher())
+    assert _FixtureHandler.statuses == [200, 200, 200]
+    assert not checkpoint.exists()
+    text = out.read_text(encoding="utf-8")
+    roles = json.loads(text)
+    assert text == json.dumps(roles, indent=2)
+    assert [r["member_id"] for r in roles] == ["AAA1", "AAA1", "BBB1", "CCC1"]
+
+
+def test_cached_page_is_revalidated(fixture_server, tmp_path: Path):
+    """A rerun sends If-None-Match and replays the cached body on 304"""
+    cache = ResponseCache(tmp_path)
+    path = "/Legislators/Profile/AAA1/Committees"
+    kwargs = {
+        "base_url": fixture_server,
+        "limiter": TokenBucket(1000, burst=10),
+        "cache": cache,
+    }
+    first = fetch_html(path, **kwargs)
+    second = fetch_html(path, **kwargs)
+    assert first == second == COMMITTEE_PAGES[path]
+    assert _FixtureHandler.statuses == [200, 304]
+    assert cache.get(fixture_server + path).etag == f'"{len(first)}"'
+
+
+def test_cache_can_be_bypassed_for_one_call(
+    fixture_server, tmp_path: Path, monkeypatch
+):
+    """`cache=None` skips the default cache; a 304 for an uncached page fails"""
+    monkeypatch.setattr("ingest.common.HTTP_CACHE", ResponseCache(tmp_path))
+    path = "/Legislators/Profile/AAA1/Committees"
+    limiter = TokenBucket(1000, burst=10)
+    assert fetch_html(path, base_url=fixture_server, limiter=limiter, cache=None)
+    assert not list(tmp_path.iterdir())
+    fetch_html(path, base_url=fixture_server, limiter=limiter)
+    assert len(list(tmp_path.iterdir())) == 1
+    with requests.Session() as http, pytest.raises(requests.HTTPError, match="cached"):
+        http.headers["If-None-Match"] = f'"{len(COMMITTEE_PAGES[path])}"'
+        fetch_html(
+            path, base_url=fixture_server, http=http, limiter=limiter, cache=None
+        )
+    assert _FixtureHandler.statuses == [200, 200, 304]
+
+
+def test_offline_replays_only_from_cache(fixture_server, tmp_path: Path):
+    """Offline fetches never hit the server and fail on uncached pages"""
+    cache = ResponseCache(tmp_path)
+    path = "/Legislators/Profile/BBB1/Committees"
+    limiter = TokenBucket(1000, burst=10)
+    fetch_html(path, base_url=fixture_server, limiter=limiter, cache=cache)
+    replayed = fetch_html(path, base_url=fixture_server, cache=cache, offline=True)
+    assert replayed == COMMITTEE_PAGES[path]
+    with pytest.raises(OfflineCacheMiss):
+        fetch_html(
+            "/Legislators/Profile/AAA1/Committees",
+            base_url=fixture_server,
+            cache=cache,
+            offline=True,
+        )
+    assert _FixtureHandler.statuses == [200]
+
+
+def test_token_bucket_limits_rate():
+    """After the burst is spent, tokens arrive at the configured rate"""
+    bucket = TokenBucket(rate=50.0, burst=1)
+    start = monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert monotonic() - start >= 5 / 50.0 * 0.9
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from data.session_loader import load_session
+from models.batch import compute_session
+from models.total_comp import total_comp_for_member
+
+
+def test_compute_session_matches_per_member():
+    loaded = load_session(Path("data/sessions"), "0-1")
+    comp = compute_session(loaded)
+    assert len(comp) == len(loaded.members)
+    for i, member in enumerate(loaded.members.values()):
+        res = total_comp_for_member(member, loaded.session)
+        assert comp.member_ids[i] == member.member_id
+        assert comp.total[i] == res.total.value
+        assert comp.base_salary[i] == res.components[0].amount.value
+        assert comp.stipends_9b[i] == res.components[1].amount.value
+        assert comp.travel_9c[i] == res.components[2].amount.value
+        assert comp.result_for(member.member_id) == res
+    assert comp.total.sum() == 170_000 + 130_000 + 90_000 + 160_000
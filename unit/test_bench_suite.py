@@ -0,0 +1,53 @@
+"""Tests for the benchmark suite's scaled sessions and regression check"""
+
+from pathlib import Path
+
+from bench.bench_member_profile import bench_profiles
+from bench.scaled import scale_session
+from bench.suite import compare_results, run_suite
+from data.session_loader import load_session
+from data.synthetic import generate_session
+from models.batch import compute_session
+
+
+def test_scaled_session_repeats_every_member(tmp_path: Path):
+    """Each copy of a member is computed exactly like the original"""
+    root = Path("data/sessions")
+    scale_session(root, "0-1", 3, tmp_path)
+    original = compute_session(load_session(root, "0-1", snapshot=False))
+    scaled = compute_session(load_session(tmp_path, "0-1", snapshot=False))
+    assert len(scaled) == 3 * len(original)
+    for i, member_id in enumerate(original.member_ids):
+        for copy_id in (member_id, f"{member_id}_1", f"{member_id}_2"):
+            j = scaled.index[copy_id]
+            assert scaled.total[j] == original.total[i]
+
+
+def test_comparison_flags_slowdowns_beyond_threshold():
+    """Only benchmarks slower than baseline by more than the threshold fail"""
+    baseline = {"results": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}}}
+    current = {
+        "results": {"a": {"seconds": 1.1}, "b": {"seconds": 1.3}, "c": {"seconds": 9}}
+    }
+    comparisons = compare_results(baseline, current, threshold=0.2)
+    assert [(c.name, c.regressed) for c in comparisons] == [("a", False), ("b", True)]
+
+
+def test_suite_records_each_benchmark_at_each_scale():
+    results = run_suite(
+        Path("data/sessions"), "0-1", [1, 2], repeat=1, only=["total_comp"]
+    )["results"]
+    assert list(results) == ["total_comp[1x]", "total_comp[2x]"]
+    assert results["total_comp[2x]"]["members"] == 8
+
+
+def test_profile_bench_reads_config_from_its_data_root(tmp_path: Path):
+    """A session that exists only under another root is benchmarked"""
+    generate_session(tmp_path, "2041-2042", 5, seed=3)
+    loaded = load_session(tmp_path, "2041-2042", snapshot=False)
+    timings = bench_profiles(loaded, repeat=1, data_root=tmp_path)
+    assert set(timings) == {
+        "engines_recomputed_per_profile",
+        "engines_computed_once",
+        "profiles_from_batch",
+    }
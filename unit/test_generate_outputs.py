@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from tools.generate_outputs import generate_all_outputs
+
+
+def test_parallel_profiles_match_serial(tmp_path: Path):
+    serial = tmp_path / "serial"
+    parallel = tmp_path / "parallel"
+    generate_all_outputs("0-1", serial, jobs=1)
+    generate_all_outputs("0-1", parallel, jobs=2)
+    serial_files = sorted(p.name for p in (serial / "0-1" / "profiles").iterdir())
+    parallel_files = sorted(p.name for p in (parallel / "0-1" / "profiles").iterdir())
+    assert (
+        serial_files
+        == parallel_files
+        == [
+            "H001.json",
+            "H002.json",
+            "H003.json",
+            "H004.json",
+        ]
+    )
+    for name in serial_files:
+        assert (serial / "0-1" / "profiles" / name).read_bytes() == (
+            parallel / "0-1" / "profiles" / name
+        ).read_bytes()
@@ -0,0 +1,80 @@
+"""Tests for the HTML viewer's summary index and lazy profile loading"""
+
+from functools import partial
+import gzip
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+from threading import Thread
+from urllib.parse import quote
+from urllib.request import urlopen
+
+import pytest
+
+from tools.generate_outputs import generate_all_outputs
+from tools.html_viewer.generator import SUMMARY_NAME, generate_html_viewer
+
+
+def test_viewer_inlines_summary_and_links_profiles(tmp_path: Path):
+    """The page carries only the summary; profiles stay in their own files"""
+    generate_all_outputs("0-1", tmp_path / "docs")
+    page = tmp_path / "docs" / "index.html"
+    generate_html_viewer("0-1", tmp_path / "docs", page)
+    summary_path = tmp_path / "docs" / "0-1" / SUMMARY_NAME
+    text = summary_path.read_text(encoding="utf-8")
+    summary = json.loads(text)
+    assert ", " not in text and "\n" not in text
+    assert gzip.decompress(summary_path.with_name(SUMMARY_NAME + ".gz").read_bytes())
+    assert [m["id"] for m in summary["members"]] == ["H001", "H002", "H003", "H004"]
+    speaker = summary["members"][0]
+    profile = json.loads(
+        (tmp_path / "docs" / "0-1" / "profiles" / "H001.json").read_text("utf-8")
+    )
+    assert (
+        speaker["total"] == profile["compensation"]["total"] == sum(speaker["amounts"])
+    )
+    html = page.read_text(encoding="utf-8")
+    assert text in html
+    assert "const PROFILES_URL = '0-1/profiles';" in html
+    assert '"raw_data_sources"' not in html
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def test_profile_urls_encode_member_ids(tmp_path: Path):
+    """An ID with a reserved character is fetched as its own file"""
+    docs = tmp_path / "docs"
+    generate_all_outputs("0-1", docs)
+    profiles_dir = docs / "0-1" / "profiles"
+    member_id = "H%20001"
+    profile = json.loads((profiles_dir / "H001.json").read_text("utf-8"))
+    profile["member_id"] = member_id
+    (profiles_dir / "H001.json").unlink()
+    (profiles_dir / f"{member_id}.json").write_text(json.dumps(profile), "utf-8")
+    html = generate_html_viewer("0-1", docs, docs / "index.html").read_text("utf-8")
+    assert "${PROFILES_URL}/${encodeURIComponent(memberId)}.json" in html
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(_QuietHandler, directory=str(docs))
+    )
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        # As encodeURIComponent would encode it
+        encoded = quote(member_id, safe="!'()*-._~")
+        url = f"http://127.0.0.1:{server.server_address[1]}/0-1/profiles/{encoded}.json"
+        with urlopen(url) as response:
+            assert json.loads(response.read())["member_id"] == member_id
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_viewer_rejects_outputs_outside_the_page_directory(tmp_path: Path):
+    """Profiles the published page could not reach are an error, not a blank page"""
+    generate_all_outputs("0-1", tmp_path / "output")
+    with pytest.raises(ValueError, match="not under"):
+        generate_html_viewer(
+            "0-1", tmp_path / "output", tmp_path / "docs" / "index.html"
+        )
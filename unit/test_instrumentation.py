@@ -0,0 +1,107 @@
+"""Tests for the hot-path timers and counters"""
+
+import argparse
+import json
+from pathlib import Path
+import pstats
+import threading
+import time
+import tracemalloc
+
+import instrumentation
+from data.session_loader import load_session
+from instrumentation import (
+    StackSampler,
+    add_profiling_arguments,
+    collapsed_stacks,
+    count,
+    profile_report,
+    profiling,
+    stage,
+    timed,
+)
+from models.batch import compute_session
+from tools.generate_outputs import generate_all_outputs
+
+
+def test_nothing_is_recorded_while_disabled():
+    instrumentation.reset()
+
+    @timed("double")
+    def double(x: int) -> int:
+        return 2 * x
+
+    assert double(4) == 8 and double.__name__ == "double"
+    with stage("block"):
+        count("things", 3)
+    assert instrumentation.report() == {"stages": {}, "counters": {}}
+
+
+def test_report_covers_stages_and_io(tmp_path: Path):
+    """A recorded run times each rule per member and counts reads and writes"""
+    path = tmp_path / "report.json"
+    with profile_report(str(path)):
+        loaded = load_session(Path("data/sessions"), "0-1", snapshot=False)
+        compute_session(loaded)
+        generate_all_outputs("0-1", tmp_path / "docs")
+    assert not instrumentation.enabled()
+    data = json.loads(path.read_text("utf-8"))
+    stages, counters = data["stages"], data["counters"]
+    n = len(loaded.members)
+    assert stages["rules_9b.select_paid_roles"]["calls"] == 2 * n
+    assert stages["rules_9c.travel"]["calls"] == 2 * n
+    assert stages["load_session"]["calls"] >= 1
+    assert stages["generate_outputs"]["seconds"] >= stages["member_profile"]["seconds"]
+    assert counters["files_read"] >= 3
+    profiles = list((tmp_path / "docs" / "0-1" / "profiles").glob("*.json"))
+    assert counters["files_written"] >= len(profiles) == n
+    assert counters["bytes_written"] >= sum(p.stat().st_size for p in profiles)
+
+
+def test_profiling_writes_pstats_stacks_and_memory(tmp_path: Path):
+    """`--profile --trace-memory` leave loadable pstats, collapsed stacks and
+    tracemalloc files
+    """
+    parser = argparse.ArgumentParser()
+    add_profiling_arguments(parser)
+    args = parser.parse_args(
+        ["--profile", "--trace-memory", "--profile-dir", str(tmp_path)]
+    )
+    with profiling(args, "run"):
+        loaded = load_session(Path("data/sessions"), "0-1", snapshot=False)
+        compute_session(loaded)
+    stats = pstats.Stats(str(tmp_path / "run.pstats"))
+    assert any(f[2] == "compute_session" for f in stats.stats)  # type: ignore
+    lines = (tmp_path / "run.collapsed").read_text("utf-8").splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    snapshot = tracemalloc.Snapshot.load(str(tmp_path / "run.tracemalloc"))
+    assert snapshot.statistics("lineno")
+    assert "peak" in (tmp_path / "run.memory.txt").read_text("utf-8")
+    assert not tracemalloc.is_tracing()
+
+
+def test_sampler_records_the_stack_of_the_sampled_thread():
+    """Samples a thread parked in a known function until one is recorded"""
+    release = threading.Event()
+
+    def parked_in_a_known_function() -> None:
+        release.wait()
+
+    worker = threading.Thread(target=parked_in_a_known_function, daemon=True)
+    worker.start()
+    assert worker.ident is not None
+    sampler = StackSampler(worker.ident, interval=0.001)
+    sampler.start()
+    try:
+        deadline = time.perf_counter() + 10
+        while not sampler.samples and time.perf_counter() < deadline:
+            time.sleep(0.01)
+    finally:
+        sampler.stop()
+        release.set()
+        worker.join()
+    lines = collapsed_stacks(sampler.samples).splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(
+        "parked_in_a_known_function (test_instrumentation.py:" in line for line in lines
+    )
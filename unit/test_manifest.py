@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from config.session_config import get_session_config
+from models.core import Chamber, Member, Party, RoleAssignment
+from tools.generate_outputs import generate_all_outputs
+from tools import manifest
+from tools.manifest import (
+    MANIFEST_NAME,
+    OUTPUT_FORMAT_VERSION,
+    member_inputs_hash,
+    session_inputs_hash,
+)
+
+
+def test_member_hash_tracks_roles():
+    config = get_session_config("0-1")
+    session_hash = session_inputs_hash(config)
+    member = Member(
+        member_id="H001",
+        name="Alice Speaker",
+        chamber=Chamber.HOUSE,
+        party=Party.DEMOCRAT,
+        distance_miles_from_state_house=10.0,
+    )
+    before = member_inputs_hash(member, config, session_hash)
+    assert before == member_inputs_hash(member, config, session_hash)
+    member.roles.append(
+        RoleAssignment(member_id="H001", role_code="SPEAKER", session_id="0-1")
+    )
+    assert member_inputs_hash(member, config, session_hash) != before
+
+
+def test_output_format_version_invalidates_every_member(monkeypatch):
+    config = get_session_config("0-1")
+    before = session_inputs_hash(config)
+    monkeypatch.setattr(manifest, "OUTPUT_FORMAT_VERSION", OUTPUT_FORMAT_VERSION + 1)
+    assert session_inputs_hash(config) != before
+
+
+def test_rerun_rewrites_nothing(tmp_path: Path):
+    generate_all_outputs("0-1", tmp_path)
+    profiles = tmp_path / "0-1" / "profiles"
+    report = tmp_path / "0-1" / "reports" / "full_session.json"
+    assert (tmp_path / "0-1" / MANIFEST_NAME).exists()
+    mtimes = {p.name: p.stat().st_mtime_ns for p in profiles.iterdir()}
+    report_mtime = report.stat().st_mtime_ns
+    (profiles / "H002.json").unlink()
+    generate_all_outputs("0-1", tmp_path)
+    assert (profiles / "H002.json").exists()
+    for p in profiles.iterdir():
+        if p.name != "H002.json":
+            assert p.stat().st_mtime_ns == mtimes[p.name]
+    assert report.stat().st_mtime_ns == report_mtime
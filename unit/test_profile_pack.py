@@ -0,0 +1,79 @@
+"""Tests for the packed per-session profile file"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.generate_outputs import generate_all_outputs
+from tools.html_viewer.generator import generate_html_viewer, load_all_profiles
+from tools.profile_pack import (
+    PACK_INDEX_NAME,
+    PACK_NAME,
+    ProfilePack,
+    write_profile_pack,
+)
+
+
+def test_pack_round_trip(tmp_path: Path):
+    """Members are read back by ID from their byte spans"""
+    path = tmp_path / PACK_NAME
+    index = write_profile_pack([("B", '{"n":"é"}'), ("A", b'{"n":1}')], path)
+    assert index == {"B": (0, 10), "A": (11, 7)}
+    with ProfilePack(path) as pack:
+        assert list(pack) == ["B", "A"] and "A" in pack and "C" not in pack
+        assert pack.get("B") == {"n": "é"}
+        assert pack.raw("A") == b'{"n":1}'
+        with pytest.raises(KeyError):
+            pack.get("C")
+    write_profile_pack([], path)
+    with ProfilePack(path) as pack:
+        assert len(pack) == 0
+
+
+def test_pack_must_match_its_index(tmp_path: Path):
+    """A pack swapped in without its index (an interrupted write) is rejected
+    instead of being read at the old offsets
+    """
+    path = tmp_path / PACK_NAME
+    write_profile_pack([("A", '{"n":1}'), ("B", '{"n":2}')], path)
+    path.write_bytes(b'{"n":3}\n')
+    with pytest.raises(ValueError):
+        ProfilePack(path)
+    path.write_bytes(b'{"n":1}\n{"n":9}\n')
+    ProfilePack(path).close()
+    with pytest.raises(ValueError):
+        ProfilePack(path, verify=True)
+
+
+def test_incremental_build_ignores_a_mismatched_pack(tmp_path: Path):
+    generate_all_outputs("0-1", tmp_path, packed=True)
+    pack_path = tmp_path / "0-1" / PACK_NAME
+    expected = pack_path.read_bytes()
+    pack_path.write_bytes(expected[::-1])
+    generate_all_outputs("0-1", tmp_path, packed=True)
+    assert pack_path.read_bytes() == expected
+
+
+def test_packed_outputs_match_profile_files(tmp_path: Path):
+    """The pack holds the same profiles, is kept on rerun and feeds the viewer"""
+    generate_all_outputs("0-1", tmp_path / "files")
+    out = tmp_path / "packed"
+    generate_all_outputs("0-1", out, packed=True)
+    session_dir = out / "0-1"
+    with ProfilePack(session_dir / PACK_NAME) as pack:
+        for member_id in pack:
+            profile = tmp_path / "files" / "0-1" / "profiles" / f"{member_id}.json"
+            assert pack.get(member_id) == json.loads(profile.read_text("utf-8"))
+    assert not list((session_dir / "profiles").glob("*.json"))
+    packed_bytes = (session_dir / PACK_NAME).read_bytes()
+    generate_all_outputs("0-1", out, packed=True)
+    assert (session_dir / PACK_NAME).read_bytes() == packed_bytes
+    profiles = load_all_profiles(session_dir)
+    assert profiles == load_all_profiles(tmp_path / "files" / "0-1")
+    page = generate_html_viewer("0-1", out, out / "index.html")
+    assert "const PACK_URL = '0-1/profiles.jsonl';" in page.read_text("utf-8")
+    generate_all_outputs("0-1", out)
+    assert not (session_dir / PACK_NAME).exists()
+    assert not (session_dir / PACK_INDEX_NAME).exists()
+    assert len(list((session_dir / "profiles").glob("*.json"))) == len(profiles)
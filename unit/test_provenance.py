@@ -0,0 +1,55 @@
+"""Tests for interned provenance source sets"""
+
+import pickle
+
+from audit.provenance import (
+    AmountWithProvenance,
+    SourceKind,
+    SourceRef,
+    ap_add,
+    ap_from,
+    ap_scale,
+    ap_source,
+    ap_sum,
+    mask_of,
+    sources_for_mask,
+)
+from audit.sources_registry import MGL_3_9B, MGL_3_9C, STIPEND_AMOUNT_ADJUSTMENT
+
+
+def test_equal_source_sets_share_storage():
+    """Amounts built separately from equal sets hold the same frozenset"""
+    a = AmountWithProvenance(1, frozenset([MGL_3_9B, MGL_3_9C]))
+    b = ap_add(ap_from(0, MGL_3_9C), ap_from(1, MGL_3_9B))
+    assert a == b
+    assert a.sources is b.sources
+    assert a.mask == b.mask == mask_of([MGL_3_9B, MGL_3_9C])
+
+
+def test_combinators_keep_their_semantics():
+    """Values and source unions are unchanged by the bitmask representation"""
+    a = ap_from(10, MGL_3_9B)
+    b = ap_from(5, MGL_3_9C)
+    assert ap_add(a, b) == AmountWithProvenance(15, frozenset([MGL_3_9B, MGL_3_9C]))
+    assert ap_sum([a, b, a]).value == 25
+    assert ap_sum([]) == AmountWithProvenance(0)
+    scaled = ap_scale(a, 1.5, source=STIPEND_AMOUNT_ADJUSTMENT)
+    assert scaled.value == 15
+    assert scaled.sources == {MGL_3_9B, STIPEND_AMOUNT_ADJUSTMENT}
+    assert ap_source(a, MGL_3_9C).sources == {MGL_3_9B, MGL_3_9C}
+
+
+def test_unregistered_sources_get_bits():
+    """Sources outside the registry are interned on first use"""
+    custom = SourceRef(id="CUSTOM", label="Custom", kind=SourceKind.MANUAL_OVERRIDE)
+    amount = ap_source(ap_from(3, MGL_3_9B), custom)
+    assert sources_for_mask(amount.mask) == {MGL_3_9B, custom}
+    assert hash(amount) == hash(AmountWithProvenance(3, frozenset([custom, MGL_3_9B])))
+
+
+def test_pickle_round_trip_rebuilds_masks():
+    """Pickled amounts come back equal and interned"""
+    amount = ap_from(7, MGL_3_9B, MGL_3_9C)
+    restored = pickle.loads(pickle.dumps(amount))
+    assert restored == amount
+    assert restored.sources is amount.sources
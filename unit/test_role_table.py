@@ -0,0 +1,41 @@
+"""Tests for the compiled role table"""
+
+import pytest
+
+from audit.provenance import ap_scale
+from audit.sources_registry import STIPEND_AMOUNT_ADJUSTMENT
+from config.role_catalog import ROLE_DEFINITIONS
+from config.role_table import BASE_ROLE_TABLE, role_table_for_factor
+from models.core import CommitteeRoleType, StipendTierCode
+
+
+def test_table_covers_catalog_with_chair_flags_and_tiers():
+    """Every catalog role is compiled with its chair flag and tier"""
+    assert set(BASE_ROLE_TABLE.roles) == set(ROLE_DEFINITIONS)
+    for code, rd in ROLE_DEFINITIONS.items():
+        role = BASE_ROLE_TABLE.get(code)
+        assert role.is_chair == (rd.committee_role_type == CommitteeRoleType.CHAIR)
+        assert role.tier_id == rd.stipend_tier_id
+        assert (role.adjusted_amount is None) == (rd.stipend_tier_id is None)
+
+
+def test_adjusted_amounts_match_scaling():
+    """Adjusted amounts equal the scaled tier amount, resolved once per factor"""
+    table = role_table_for_factor(1.1)
+    assert role_table_for_factor(1.1) is table
+    role = table.get("SPEAKER")
+    base = StipendTierCode.get_base_amount(role.tier_id)
+    assert role.base_amount == base
+    assert role.adjusted_amount == ap_scale(base, 1.1, source=STIPEND_AMOUNT_ADJUSTMENT)
+    assert (
+        role.reason
+        == f"Tier {role.tier_id} base ${base.value:,} adjusted by factor 1.1"
+    )
+    assert BASE_ROLE_TABLE.get("SPEAKER").adjusted_amount is base
+
+
+def test_unknown_role_code_raises():
+    """Unknown codes fail the same way catalog lookups do"""
+    assert "NOT_A_ROLE" not in BASE_ROLE_TABLE
+    with pytest.raises(KeyError):
+        BASE_ROLE_TABLE.get("NOT_A_ROLE")
@@ -1,10 +1,16 @@
+from itertools import combinations
+import random
+
 from models.core import (
     Member,
     Chamber,
     Party,
     RoleAssignment,
 )
+from audit.provenance import AmountWithProvenance
 from models.rules_9b import (
+    RoleStipend,
+    _best_subset,
     raw_role_stipends_for_member,
     stipend_9b_for_member,
     select_paid_roles_for_member,
@@ -125,3 +131,77 @@ def test_house_provenance_includes_house_rules():
     for prov in selection.provenance:
         all_sources.update(prov.sources)
     assert HOUSE_RULES_18 in all_sources
+
+
+def _best_subset_brute_force(candidates, max_positions, max_chairs):
+    """The original exhaustive 9B selection, kept as a reference"""
+
+    def key(subset):
+        return (
+            sum(r.amount.value for r in subset),
+            tuple(sorted(r.role_code for r in subset)),
+        )
+
+    best_subset, best_amount = (), 0
+    roles = [rs for rs, _ in candidates]
+    chair = {id(rs): is_chair for rs, is_chair in candidates}
+    for k in range(1, max_positions + 1):
+        for combo in combinations(roles, k):
+            if sum(chair[id(rs)] for rs in combo) > max_chairs:
+                continue
+            total = key(combo)[0]
+            if total > best_amount:
+                best_subset, best_amount = combo, total
+            elif total == best_amount and best_subset:
+                if key(combo) < key(best_subset):
+                    best_subset = combo
+    return best_subset
+
+
+def test_best_subset_matches_brute_force():
+    """Selection agrees with exhaustive search, ties and duplicates included"""
+    for seed in range(500):
+        rng = random.Random(seed)
+        codes = rng.sample("ABCDEFGH", rng.randint(1, 8))
+        amount = {c: rng.choice([0, 5_000, 10_000, 15_000, 30_000]) for c in codes}
+        is_chair = {c: rng.random() < 0.5 for c in codes}
+        candidates = []
+        for _ in range(rng.randint(1, 9)):
+            code = rng.choice(codes)
+            rs = RoleStipend(
+                role_code=code,
+                session_id="0-1",
+                amount=AmountWithProvenance(value=amount[code]),
+                reason=str(len(candidates)),
+            )
+            candidates.append((rs, is_chair[code]))
+        max_positions = rng.randint(1, 5)
+        max_chairs = rng.randint(0, 3)
+        expected = _best_subset_brute_force(candidates, max_positions, max_chairs)
+        actual = _best_subset(candidates, max_positions, max_chairs)
+        assert [id(rs) for rs in actual] == [id(rs) for rs in expected], seed
+
+
+def test_best_subset_scales_to_many_roles():
+    """Dozens of roles and generous caps select without enumerating subsets"""
+    candidates = [
+        (
+            RoleStipend(
+                role_code=f"ROLE_{i:02d}",
+                session_id="0-1",
+                amount=AmountWithProvenance(value=1_000 * (i % 7)),
+                reason="",
+            ),
+            i % 3 == 0,
+        )
+        for i in range(60)
+    ]
+    best = _best_subset(candidates, max_positions=20, max_chairs=5)
+    assert len(best) == 20
+    assert sum(1 for rs, chair in candidates if chair and rs in best) <= 5
+    greedy, chairs = [], 0
+    for rs, chair in sorted(candidates, key=lambda c: -c[0].amount.value):
+        if len(greedy) < 20 and (not chair or chairs < 5):
+            greedy.append(rs.amount.value)
+            chairs += chair
+    assert sum(rs.amount.value for rs in best) == sum(greedy)
@@ -0,0 +1,129 @@
+"""Tests for the what-if scenario engine"""
+
+from dataclasses import replace
+from pathlib import Path
+import random
+
+import pytest
+
+from audit.provenance import ap_from
+from audit.sources_registry import MGL_3_9C
+from config.session_config import get_session_config
+from config.travel_config import TravelRule
+from data.session_loader import load_session
+from models import rules_9c
+from models.batch import compute_session
+from models.core import Chamber
+from models.rules_9b import (
+    ChamberRules,
+    get_chamber_rules,
+    select_paid_roles_for_member,
+)
+from models.scenarios import Scenario, ScenarioModel, run_scenarios, scenario_grid
+from tools.stats import gini, median
+from tools.what_if import scenario_table
+
+
+@pytest.fixture(name="loaded", scope="module", params=["0-1", "2025-2026"])
+def _loaded(request):
+    return load_session(Path("data/sessions"), request.param)
+
+
+def _reference(loaded, resolved: Scenario, monkeypatch):
+    """Per-member (9B, 9C) from the scalar engines with the overrides applied"""
+    config = get_session_config(loaded.session.id)
+    config = replace(
+        config,
+        stipend_adjustment=replace(
+            config.stipend_adjustment, factor=resolved.stipend_factor
+        ),
+        travel_adjustment=replace(
+            config.travel_adjustment, factor=resolved.travel_factor
+        ),
+    )
+    monkeypatch.setattr(
+        rules_9c,
+        "TRAVEL_RULE_9C",
+        TravelRule(
+            distance_threshold_miles=resolved.travel_threshold_miles,
+            amount_leq_threshold=ap_from(resolved.travel_amount_leq, MGL_3_9C),
+            amount_gt_threshold=ap_from(resolved.travel_amount_gt, MGL_3_9C),
+        ),
+    )
+    caps = {
+        Chamber.HOUSE: (resolved.house_max_positions, resolved.house_max_chairs),
+        Chamber.SENATE: (resolved.senate_max_positions, resolved.senate_max_chairs),
+    }
+    out = []
+    for member in loaded.members.values():
+        chamber = get_chamber_rules(member.chamber)
+        positions, chairs = caps[chamber.chamber]
+        rules = ChamberRules(chamber.chamber, chairs, positions, chamber.source_ref)
+        selection = select_paid_roles_for_member(
+            member, loaded.session, config, chamber_rules=rules
+        )
+        travel = rules_9c.travel_9c_for_member(member, loaded.session, config)
+        out.append((selection.total_amount, travel.amount.value))
+    return out
+
+
+def test_baseline_matches_compute_session(loaded):
+    """An empty scenario reproduces the session's own results exactly"""
+    comp = compute_session(loaded)
+    sweep = run_scenarios(loaded, [Scenario()])
+    assert sweep.member_ids == comp.member_ids
+    assert sweep.stipends_9b[0].tolist() == comp.stipends_9b.tolist()
+    assert sweep.travel_9c[0].tolist() == comp.travel_9c.tolist()
+    assert sweep.total[0].tolist() == comp.total.tolist()
+
+
+def test_overrides_match_scalar_engine(loaded, monkeypatch):
+    """Random overrides agree with the per-member engines run under them"""
+    model = ScenarioModel(loaded)
+    rng = random.Random(15)
+    scenarios = [
+        Scenario(
+            travel_threshold_miles=rng.choice([None, 0.0, 25.0, 40.5, 50.0, 80.0]),
+            travel_amount_gt=rng.choice([None, 22_500]),
+            travel_factor=rng.choice([None, 0.9, 1.0, 1.137]),
+            stipend_factor=rng.choice([None, 0.8, 1.0, 1.0513, 1.25]),
+            house_max_positions=rng.choice([None, 0, 1, 2, 3]),
+            house_max_chairs=rng.choice([None, 0, 1, 2]),
+            senate_max_positions=rng.choice([None, 1, 2, 3]),
+            senate_max_chairs=rng.choice([None, 0, 1, 2]),
+        )
+        for _ in range(25)
+    ]
+    sweep = model.run(scenarios)
+    for s, resolved in enumerate(sweep.resolved):
+        paid = zip(sweep.stipends_9b[s].tolist(), sweep.travel_9c[s].tolist())
+        assert list(paid) == _reference(loaded, resolved, monkeypatch)
+
+
+def test_grid_is_the_cartesian_product():
+    grid = scenario_grid(travel_threshold_miles=[40, 50, 60], stipend_factor=[1.0, 1.1])
+    assert len(grid) == 6
+    assert grid[1] == Scenario(travel_threshold_miles=40, stipend_factor=1.1)
+    with pytest.raises(ValueError):
+        scenario_grid(speed_limit=[65])
+
+
+def test_table_rows_summarize_each_scenario(loaded):
+    """Table metrics equal the per-scenario statistics, per chamber too"""
+    sweep = run_scenarios(loaded, scenario_grid(house_max_positions=[0, 1, 2]))
+    rows = scenario_table(sweep, by_chamber=True)
+    chambers = sorted(set(sweep.chambers.tolist()))
+    assert len(rows) == len(sweep) * (len(chambers) + 1)
+    for row in rows:
+        s = row["scenario"]
+        cols = [
+            i
+            for i, chamber in enumerate(sweep.chambers)
+            if row["chamber"] in ("all", chamber)
+        ]
+        assert row["house_max_positions"] == sweep.scenarios[s].house_max_positions
+        assert row["total_compensation"] == sweep.total[s, cols].sum()
+        assert row["median_compensation"] == median(sweep.total[s, cols])
+        assert row["stipend_gini"] == pytest.approx(
+            gini(sweep.stipends_9b[s, cols]), abs=1e-6
+        )
@@ -0,0 +1,131 @@
+"""Tests for the HTTP query service"""
+
+import json
+from pathlib import Path
+import shutil
+import threading
+from urllib.request import urlopen
+
+import pytest
+
+from config.session_config import get_session_config
+from data.session_loader import load_session
+from data.synthetic import generate_session
+from models.batch import compute_session
+from tools.member_profile import generate_member_profile
+from tools.service import CompService, ServiceServer
+from tools.stats import gini
+
+
+@pytest.fixture(name="root")
+def _root(tmp_path: Path) -> Path:
+    shutil.copytree(
+        Path("data/sessions/0-1"),
+        tmp_path / "0-1",
+        ignore=shutil.ignore_patterns("session.snapshot"),
+    )
+    return tmp_path
+
+
+def _get(service: CompService, target: str) -> tuple[int, dict]:
+    status, body = service.handle(target)
+    return status, json.loads(body)
+
+
+def test_endpoints_match_the_engines(root: Path):
+    service = CompService(root)
+    loaded = load_session(root, "0-1", snapshot=False)
+    comp = compute_session(loaded)
+    member_id = comp.member_ids[0]
+    status, profile = _get(service, f"/sessions/0-1/members/{member_id}")
+    expected = generate_member_profile(
+        loaded.members[member_id], loaded.session, "0-1", comp.result_for(member_id)
+    )
+    assert status == 200 and profile == json.loads(json.dumps(expected.to_dict()))
+    _, summary = _get(service, "/sessions/0-1/summary")
+    assert summary["summary_statistics"]["total_members"] == len(comp)
+    _, inequality = _get(service, "/sessions/0-1/gini")
+    assert inequality["stipends_9b"]["gini"] == gini(comp.stipends_9b)
+    status, what_if = _get(
+        service, "/sessions/0-1/what-if?stipend_factor=1.0,1.5&by_chamber=1"
+    )
+    rows = [r for r in what_if["scenarios"] if r["chamber"] == "all"]
+    assert status == 200 and len(rows) == 2
+    assert rows[0]["total_stipends_9b"] == int(comp.stipends_9b.sum())
+    assert rows[1]["total_stipends_9b"] > rows[0]["total_stipends_9b"]
+    assert _get(service, "/sessions")[1]["sessions"] == [
+        {"session_id": "0-1", "members": len(comp)}
+    ]
+
+
+def test_errors(root: Path):
+    service = CompService(root)
+    assert service.handle("/sessions/9-10/gini")[0] == 404
+    assert service.handle("/sessions/0-1/members/NOBODY")[0] == 404
+    assert service.handle("/sessions/0-1/unknown")[0] == 404
+    assert service.handle("/sessions/0-1/what-if?speed=1")[0] == 400
+    assert service.handle("/sessions/0-1/what-if?stipend_factor=x")[0] == 400
+
+
+def test_profiles_use_the_served_roots_config(tmp_path: Path):
+    """A session that exists only under the service's data root"""
+    generate_session(tmp_path, "2041-2042", 5, seed=3)
+    service = CompService(tmp_path)
+    loaded = load_session(tmp_path, "2041-2042", snapshot=False)
+    config = get_session_config("2041-2042", tmp_path)
+    member_id = next(iter(loaded.members))
+    status, profile = _get(service, f"/sessions/2041-2042/members/{member_id}")
+    expected = generate_member_profile(
+        loaded.members[member_id], loaded.session, "2041-2042", config=config
+    )
+    assert status == 200 and profile == json.loads(json.dumps(expected.to_dict()))
+
+
+def test_unexpected_errors_are_500s(root: Path, monkeypatch):
+    service = CompService(root)
+
+    def fail(*_args, **_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("tools.service.generate_member_profile", fail)
+    status, body = _get(service, "/sessions/0-1/members/H001")
+    assert status == 500 and "boom" in body["error"]
+
+
+def test_changed_files_are_reloaded(root: Path):
+    service = CompService(root)
+    before = _get(service, "/sessions/0-1/summary")[1]["summary_statistics"]
+    assert service.refresh() == []
+    path = root / "0-1" / "base_salary.json"
+    data = json.loads(path.read_text("utf-8"))
+    data["base_amount"] += 1000
+    path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+    assert service.refresh() == ["0-1"]
+    after = _get(service, "/sessions/0-1/summary")[1]["summary_statistics"]
+    members = after["total_members"]
+    assert after["total_compensation"] == before["total_compensation"] + 1000 * members
+    # A malformed file keeps the last good state and is retried
+    members_path = root / "0-1" / "members.json"
+    good = members_path.read_text("utf-8")
+    members_path.write_text("[]", encoding="utf-8")
+    assert service.refresh() == []
+    assert _get(service, "/sessions/0-1/summary")[1]["summary_statistics"] == after
+    members_path.write_text(good, encoding="utf-8")
+    assert service.refresh() == ["0-1"]
+    shutil.rmtree(root / "0-1")
+    service.refresh()
+    assert service.handle("/sessions/0-1/summary")[0] == 404
+
+
+def test_http_round_trip(root: Path):
+    server = ServiceServer(("127.0.0.1", 0), CompService(root), reload_interval=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        with urlopen(f"http://127.0.0.1:{port}/sessions/0-1/gini") as response:
+            assert response.headers["Content-Type"].startswith("application/json")
+            assert json.loads(response.read())["session_id"] == "0-1"
+    finally:
+        server.shutdown()
+        server.server_close()
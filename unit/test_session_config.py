@@ -0,0 +1,65 @@
+from pathlib import Path
+import json
+import os
+
+from config.session_config import (
+    clear_session_config_cache,
+    get_session_config,
+)
+from data.session_loader import load_session
+from tools.member_profile import generate_member_profile
+
+
+def _write_session_config(root: Path, session_id: str, factor: float) -> Path:
+    session_dir = root / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
+    (session_dir / "adjustment.json").write_text(
+        json.dumps({"session_id": session_id, "aggregate_change_factor": factor})
+    )
+    (session_dir / "base_salary.json").write_text(
+        json.dumps(
+            {
+                "session_id": session_id,
+                "base_amount": 75_000,
+                "aggregate_change_factor": 1,
+            }
+        )
+    )
+    return session_dir
+
+
+def test_session_config_loaded_once(tmp_path: Path):
+    clear_session_config_cache()
+    _write_session_config(tmp_path, "1-2", 1.5)
+    first = get_session_config("1-2", tmp_path)
+    second = get_session_config("1-2", tmp_path)
+    assert first is second
+    assert first.stipend_adjustment.factor == 1.5
+    assert first.travel_adjustment.factor == 1.5
+    assert first.base_salary.base_amount == 75_000
+    assert first.distance_exceptions == {}
+
+
+def test_session_config_invalidated_by_mtime(tmp_path: Path):
+    clear_session_config_cache()
+    session_dir = _write_session_config(tmp_path, "1-2", 1.5)
+    first = get_session_config("1-2", tmp_path)
+    adjustment = session_dir / "adjustment.json"
+    adjustment.write_text(
+        json.dumps({"session_id": "1-2", "aggregate_change_factor": 2.0})
+    )
+    st = adjustment.stat()
+    os.utime(adjustment, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = get_session_config("1-2", tmp_path)
+    assert second is not first
+    assert second.stipend_adjustment.factor == 2.0
+
+
+def test_profiles_report_the_base_factor_as_written():
+    """An integer aggregate_change_factor stays an integer in profiles"""
+    loaded = load_session(Path("data/sessions"), "0-1", snapshot=False)
+    member = next(iter(loaded.members.values()))
+    profile = generate_member_profile(member, loaded.session, "0-1").to_dict()
+    details = profile["compensation"]["components"][0]["details"]
+    assert details["adjustment_factor"] == 1
+    assert isinstance(details["adjustment_factor"], int)
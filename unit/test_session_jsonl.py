@@ -0,0 +1,81 @@
+"""Round-trip tests for the JSON Lines session format"""
+
+import json
+from pathlib import Path
+import shutil
+
+import pytest
+
+from data.enrich_distance import enrich_members_with_distance
+from data.jsonl import convert_session, read_jsonl, write_jsonl
+from data.normalize import write_roles
+from data.session_loader import iter_members, load_session
+
+SESSIONS = Path("data/sessions")
+
+
+def _snapshot(root: Path, session_id: str):
+    loaded = load_session(root, session_id)
+    return (
+        loaded.session,
+        list(loaded.members.values()),
+        loaded.role_assignments,
+    )
+
+
+@pytest.mark.parametrize("session_id", ["0-1", "2025-2026"])
+def test_jsonl_round_trip_matches_json(tmp_path: Path, session_id: str):
+    """Converting a session to JSON Lines loads the same members and roles"""
+    shutil.copytree(SESSIONS / session_id, tmp_path / session_id)
+    expected = _snapshot(tmp_path, session_id)
+    convert_session(tmp_path, session_id)
+    (tmp_path / session_id / "members.json").unlink()
+    (tmp_path / session_id / "roles.json").unlink()
+    assert _snapshot(tmp_path, session_id) == expected
+
+
+def test_iter_members_is_lazy(tmp_path: Path):
+    """Members are parsed one line at a time"""
+    rows = [
+        {"member_id": "H001", "name": "A", "chamber": "house", "party": "D"},
+        {"member_id": "H002", "name": "B", "chamber": "moon", "party": "D"},
+    ]
+    write_jsonl(tmp_path / "1-2" / "members.jsonl", "1-2", rows)
+    members = iter_members(tmp_path, "1-2")
+    assert next(members).member_id == "H001"
+    with pytest.raises(ValueError, match="Unknown chamber"):
+        next(members)
+
+
+def test_read_jsonl_checks_session_header(tmp_path: Path):
+    """A file from another session is rejected"""
+    path = tmp_path / "roles.jsonl"
+    write_jsonl(path, "1-2", [{"member_id": "H001", "role_code": "SPEAKER"}])
+    with pytest.raises(ValueError, match="session_id mismatch"):
+        list(read_jsonl(path, "3-4"))
+
+
+def test_write_roles_replaces_other_format(tmp_path: Path):
+    """Switching formats never leaves a stale roles file for the loader"""
+    roles = [{"member_id": "H001", "role_code": "SPEAKER", "session_id": "1-2"}]
+    json_file = write_roles(tmp_path, "1-2", roles)
+    jsonl_file = write_roles(tmp_path, "1-2", iter(roles), fmt="jsonl")
+    assert not json_file.exists()
+    assert list(read_jsonl(jsonl_file, "1-2")) == roles
+    write_roles(tmp_path, "1-2", roles)
+    assert not jsonl_file.exists()
+    assert json.loads(json_file.read_text())["roles"] == roles
+
+
+def test_enrich_distance_streams_jsonl(tmp_path: Path):
+    """Enriching members.jsonl gives the same distances as members.json"""
+    src = SESSIONS / "2025-2026"
+    centroids = src / "district_centroids.json"
+    members_json = tmp_path / "members.json"
+    shutil.copy(src / "members.json", members_json)
+    members_jsonl = tmp_path / "members.jsonl"
+    enrich_members_with_distance(members_json, centroids, out_path=members_jsonl)
+    enrich_members_with_distance(members_jsonl, centroids)
+    enrich_members_with_distance(members_json, centroids)
+    from_json = json.loads(members_json.read_text())["members"]
+    assert list(read_jsonl(members_jsonl, "2025-2026")) == from_json
@@ -1,20 +1,21 @@
 from pathlib import Path
 import json
 
-from data.session_loader import load_session
-from models.core import Chamber
+import pytest
 
+from data.session_loader import discover_sessions, load_session, load_sessions
+from models.core import Chamber, Session
 
-def test_load_session_basic(tmp_path: Path):
-    session_id = "2025-2026"
-    session_dir = tmp_path / session_id
+
+def _write_session(root: Path, session_id: str, name: str = "Test Speaker") -> None:
+    session_dir = root / session_id
     session_dir.mkdir()
     members_payload = {
         "session_id": session_id,
         "members": [
             {
                 "member_id": "H001",
-                "name": "Test Speaker",
+                "name": name,
                 "chamber": "House",
                 "party": "D",
                 "distance_miles_from_state_house": 10.0,
@@ -32,7 +33,44 @@ def test_load_session_basic(tmp_path: Path):
     manual_roles_payload = roles_payload
     manual_roles_payload["roles"][0]["source_id"] = "MGL_ART_CXVIII"
     (session_dir / "manual_roles.json").write_text(json.dumps(manual_roles_payload))
+
+
+def test_load_session_basic(tmp_path: Path):
+    session_id = "2025-2026"
+    _write_session(tmp_path, session_id)
     loaded = load_session(tmp_path, session_id)
     assert loaded.session.id == session_id
     assert loaded.members["H001"].chamber == Chamber.HOUSE
     assert loaded.members["H001"].roles[0].role_code == "SPEAKER"
+
+
+@pytest.mark.parametrize("snapshot", [False, True])
+def test_load_sessions_discovers_and_shares_strings(tmp_path: Path, snapshot):
+    """Sessions are found by scanning, ordered by year, and share interned
+    names and role codes whether parsed or read from snapshots
+    """
+    name = "".join(["Shared ", "Member"])
+    for session_id in ("2025-2026", "1921-1922", "2023-2024"):
+        _write_session(tmp_path, session_id, name="".join(["Shared ", "Member"]))
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "2027-2028").mkdir()
+    assert discover_sessions(tmp_path) == ["1921-1922", "2023-2024", "2025-2026"]
+    if snapshot:
+        load_sessions(tmp_path, snapshot=True)
+    registry = load_sessions(tmp_path, snapshot=snapshot, jobs=3)
+    assert list(registry) == ["1921-1922", "2023-2024", "2025-2026"]
+    first, *rest = (registry[sid].members["H001"] for sid in registry)
+    assert first.name == name
+    for member in rest:
+        assert member.name is first.name
+        assert member.roles[0].role_code is first.roles[0].role_code
+    assert registry.sessions_for_member("H001") == list(registry)
+    assert list(load_sessions(tmp_path, ["2023-2024"])) == ["2023-2024"]
+
+
+def test_session_from_general_court_number():
+    assert Session.from_id_number(194).id == "2025-2026"
+    assert Session.from_id_number(142) == Session("1921-1922", 1921, 1922)
+    assert Session.from_id_number(0).id == "0-1"
+    with pytest.raises(IndexError):
+        Session.from_id_number(141)
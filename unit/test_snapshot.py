@@ -0,0 +1,66 @@
+"""Tests for compiled session snapshots"""
+
+import json
+from pathlib import Path
+import shutil
+
+import pytest
+
+from data.jsonl import write_jsonl
+from data.session_loader import load_session
+from data.snapshot import read_snapshot, snapshot_path
+
+
+@pytest.fixture
+def session_root(tmp_path: Path) -> Path:
+    """A writable copy of the demo session"""
+    shutil.copytree(Path("data/sessions/0-1"), tmp_path / "0-1")
+    return tmp_path
+
+
+def test_load_session_writes_and_reads_snapshot(session_root: Path):
+    """The first load compiles a snapshot that later loads return"""
+    parsed = load_session(session_root, "0-1")
+    assert snapshot_path(session_root, "0-1").exists()
+    from_snapshot = read_snapshot(session_root, "0-1")
+    assert from_snapshot == parsed
+    assert load_session(session_root, "0-1") == parsed
+
+
+def test_snapshot_is_invalidated_by_source_changes(session_root: Path):
+    """Editing members.json makes the snapshot stale"""
+    load_session(session_root, "0-1")
+    members_file = session_root / "0-1" / "members.json"
+    data = json.loads(members_file.read_text(encoding="utf-8"))
+    data["members"][0]["name"] = "Renamed Member"
+    members_file.write_text(json.dumps(data), encoding="utf-8")
+    assert read_snapshot(session_root, "0-1") is None
+    loaded = load_session(session_root, "0-1")
+    member_id = data["members"][0]["member_id"]
+    assert loaded.members[member_id].name == "Renamed Member"
+    assert read_snapshot(session_root, "0-1") == loaded
+
+
+def test_snapshot_is_invalidated_by_new_jsonl_files(session_root: Path):
+    """Adding manual_roles.jsonl, which the loader prefers over the JSON file,
+    makes the snapshot stale
+    """
+    before = load_session(session_root, "0-1")
+    session_dir = session_root / "0-1"
+    data = json.loads((session_dir / "manual_roles.json").read_text("utf-8"))
+    extra = dict(data["roles"][0], role_code="HOUSE_SPEAKER_PRO_TEMPORE")
+    write_jsonl(session_dir / "manual_roles.jsonl", "0-1", [*data["roles"], extra])
+    loaded = load_session(session_root, "0-1")
+    assert len(loaded.role_assignments) == len(before.role_assignments) + 1
+    assert loaded == load_session(session_root, "0-1", snapshot=False)
+
+
+def test_corrupt_snapshot_is_ignored(session_root: Path):
+    """A truncated snapshot falls back to parsing the JSON"""
+    expected = load_session(session_root, "0-1", snapshot=False)
+    snapshot_path(session_root, "0-1").write_bytes(b"\x80\x05garbage")
+    assert read_snapshot(session_root, "0-1") is None
+    assert load_session(session_root, "0-1") == expected
+    # A pickle naming a module that no longer exists
+    snapshot_path(session_root, "0-1").write_bytes(b"cno_such_module\nThing\n.")
+    assert read_snapshot(session_root, "0-1") is None
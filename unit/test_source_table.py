@@ -0,0 +1,45 @@
+"""Tests for shared-source profile output"""
+
+import json
+from pathlib import Path
+
+from audit.sources_registry import MGL_3_9B, create_distance_override_source
+from tools.generate_outputs import generate_all_outputs
+from tools.source_table import SOURCES_NAME, source_key
+
+
+def _resolve(value, table: dict):
+    """Replaces every provenance key with its source from the table"""
+    if isinstance(value, dict):
+        return {
+            k: [table[s] for s in v] if k == "provenance" else _resolve(v, table)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_resolve(v, table) for v in value]
+    return value
+
+
+def test_shared_profiles_resolve_to_inline_profiles(tmp_path: Path):
+    """Resolving a shared-sources profile's keys gives the inline profile"""
+    generate_all_outputs("0-1", tmp_path / "inline")
+    generate_all_outputs("0-1", tmp_path / "shared", shared_sources=True)
+    table = json.loads((tmp_path / "shared" / "0-1" / SOURCES_NAME).read_text("utf-8"))
+    inline = sorted((tmp_path / "inline" / "0-1" / "profiles").glob("*.json"))
+    assert inline
+    for path in inline:
+        shared = tmp_path / "shared" / "0-1" / "profiles" / path.name
+        assert len(shared.read_bytes()) < len(path.read_bytes())
+        resolved = _resolve(json.loads(shared.read_text("utf-8")), table)
+        assert resolved == json.loads(path.read_text("utf-8"))
+    generate_all_outputs("0-1", tmp_path / "shared")
+    assert not (tmp_path / "shared" / "0-1" / SOURCES_NAME).exists()
+
+
+def test_override_sources_are_keyed_by_content():
+    """Registry sources keep their IDs; per-use overrides get distinct keys"""
+    assert source_key(MGL_3_9B) == "MGL_3_9B"
+    a = source_key(create_distance_override_source("https://example.org/a"))
+    b = source_key(create_distance_override_source("https://example.org/b"))
+    assert a.startswith("DISTANCE_OVERRIDE:") and a != b
+    assert a == source_key(create_distance_override_source("https://example.org/a"))
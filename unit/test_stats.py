@@ -0,0 +1,97 @@
+"""Tests for vectorized session statistics"""
+
+import json
+from pathlib import Path
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from data.session_loader import load_session
+from tools.session_report import generate_session_report
+from tools.stats import (
+    gini,
+    grouped_stats,
+    histogram,
+    lorenz_points,
+    median,
+    row_gini,
+    row_medians,
+    summarize,
+    theil,
+    top_k,
+)
+
+
+def _random_columns(seed: int, n: int):
+    rng = random.Random(seed)
+    labels = [rng.choice(["house", "senate", "joint"]) for _ in range(n)]
+    values = [rng.choice([0, 15_000, 30_000, 62_548, 80_000]) for _ in range(n)]
+    return labels, values
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 10, 51])
+def test_grouped_stats_match_python_loops(n):
+    """Grouped sums, means and medians equal per-group Python passes, types too"""
+    labels, values = _random_columns(n, n)
+    stats = grouped_stats(labels, np.array(values, dtype=np.int64))
+    assert list(stats) == sorted(set(labels))
+    for label, group in stats.items():
+        members = [v for lbl, v in zip(labels, values) if lbl == label]
+        expected = {
+            "count": len(members),
+            "total": sum(members),
+            "mean": sum(members) / len(members),
+            "median": statistics.median(members),
+        }
+        assert json.dumps(group) == json.dumps(expected)
+    overall = summarize(np.array(values, dtype=np.int64), percentiles=[90])
+    assert json.dumps(overall["median"]) == json.dumps(statistics.median(values))
+    assert overall["p90"] == pytest.approx(np.percentile(values, 90))
+
+
+def test_median_of_nothing_is_zero():
+    assert median([]) == 0
+    assert summarize([])["mean"] == 0
+
+
+def test_top_k_matches_stable_sort():
+    """Partial-sort top-k keeps the full sort's order, ties by position"""
+    _, values = _random_columns(3, 40)
+    arr = np.array(values, dtype=np.int64)
+    for k in (0, 1, 10, 40, 60):
+        expected = sorted(range(len(values)), key=lambda i: values[i], reverse=True)
+        assert top_k(arr, k).tolist() == expected[:k]
+
+
+def test_histogram_counts_every_value():
+    values = [0, 0, 5_200, 15_000, 80_000]
+    assert histogram(values, [0, 1, 20_000, 80_000]) == [2, 2, 1]
+
+
+def test_inequality_measures():
+    """Gini, Theil and Lorenz agree on equal and concentrated distributions"""
+    assert gini([5, 5, 5, 5]) == pytest.approx(0.0)
+    assert theil([5, 5, 5, 5]) == pytest.approx(0.0)
+    assert gini([0, 0, 0, 10]) == pytest.approx(0.75)
+    assert theil([0, 0, 0, 10]) == pytest.approx(np.log(4))
+    assert gini([0, 0]) == 0.0
+    population, share = lorenz_points([1, 3])
+    assert population.tolist() == [0.0, 0.5, 1.0]
+    assert share.tolist() == [0.0, 0.25, 1.0]
+
+
+def test_row_statistics_match_scalar_versions():
+    """Row-wise medians and Ginis equal the 1-D functions applied per row"""
+    rows = [_random_columns(seed, 9)[1] for seed in range(6)] + [[0] * 9]
+    matrix = np.array(rows, dtype=np.int64)
+    assert json.dumps(row_medians(matrix)) == json.dumps([median(r) for r in rows])
+    assert row_gini(matrix).tolist() == pytest.approx([gini(r) for r in rows])
+
+
+def test_summary_lists_parties_in_sorted_order():
+    """by_party keys don't depend on set iteration order"""
+    loaded = load_session(Path("data/sessions"), "2025-2026", snapshot=False)
+    by_party = generate_session_report(loaded).summary_statistics["by_party"]
+    assert list(by_party) == sorted(by_party) == ["D", "Other", "R"]
@@ -0,0 +1,51 @@
+"""Tests for the synthetic session generator"""
+
+import json
+from pathlib import Path
+
+from config.role_catalog import ROLE_DEFINITIONS
+from config.session_config import get_session_config
+from data.enrich_distance import enrich_members_with_distance
+from data.session_loader import load_session
+from data.synthetic import generate_session
+from models.batch import compute_session
+from validators import validate_session_data
+
+
+def test_same_seed_writes_the_same_session(tmp_path: Path):
+    """Output depends only on the arguments"""
+    a = generate_session(tmp_path / "a", "2025-2026", 300, seed=7)
+    b = generate_session(tmp_path / "b", "2025-2026", 300, seed=7)
+    c = generate_session(tmp_path / "c", "2025-2026", 300, seed=8)
+    for path in sorted(a.iterdir()):
+        assert path.read_bytes() == (b / path.name).read_bytes()
+    assert (a / "roles.json").read_bytes() != (c / "roles.json").read_bytes()
+
+
+def test_synthetic_session_loads_and_computes(tmp_path: Path):
+    """Every role is in the catalog and the session runs end to end"""
+    session_dir = generate_session(tmp_path, "2025-2026", 500, seed=3, jsonl=True)
+    loaded = load_session(tmp_path, "2025-2026", snapshot=False)
+    assert len(loaded.members) == 500
+    assert all(ra.role_code in ROLE_DEFINITIONS for ra in loaded.role_assignments)
+    assert not [i for i in validate_session_data(loaded) if str(i.level) == "ERROR"]
+    assert {m.chamber.value for m in loaded.members.values()} == {"house", "senate"}
+    config = get_session_config("2025-2026", tmp_path)
+    comp = compute_session(loaded, config)
+    assert (comp.total >= comp.base_salary).all()
+    assert len(config.distance_exceptions) > 0
+    assert (session_dir / "members.jsonl").exists()
+
+
+def test_centroids_reproduce_member_distances(tmp_path: Path):
+    """`data.enrich_distance` maps every district and agrees on distances"""
+    session_dir = generate_session(tmp_path, "2025-2026", 200, seed=5)
+    out = tmp_path / "enriched.json"
+    enrich_members_with_distance(
+        session_dir / "members.json",
+        session_dir / "district_centroids.json",
+        out_path=out,
+    )
+    original = json.loads((session_dir / "members.json").read_text("utf-8"))
+    enriched = json.loads(out.read_text("utf-8"))
+    assert enriched["members"] == original["members"]
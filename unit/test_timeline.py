@@ -0,0 +1,47 @@
+"""Tests for the cross-session member timeline index"""
+
+from pathlib import Path
+
+from data.session_loader import load_session
+from models.batch import compute_session
+from tools import timeline as timeline_module
+from tools.generate_outputs import generate_all_outputs
+from tools.timeline import TIMELINE_NAME, MemberTimeline, build_timeline
+
+DATA_ROOT = Path("data/sessions")
+
+
+def test_timeline_holds_computed_totals_oldest_first(tmp_path: Path):
+    """Each member's entries match the session computation, in session order"""
+    index = tmp_path / TIMELINE_NAME
+    build_timeline(DATA_ROOT, index, ["2025-2026", "0-1"])
+    timeline = MemberTimeline.load(index)
+    assert list(timeline.sessions) == ["0-1", "2025-2026"]
+    for session_id in timeline.sessions:
+        comp = compute_session(load_session(DATA_ROOT, session_id))
+        for i, member_id in enumerate(comp.member_ids):
+            (entry,) = [
+                e for e in timeline.timeline(member_id) if e.session_id == session_id
+            ]
+            assert entry.total == comp.total[i]
+            assert entry.stipends_9b == comp.stipends_9b[i]
+    assert timeline.timeline("H001")[0].paid_roles == ["SPEAKER"]
+    assert timeline.timeline("NOBODY") == []
+
+
+def test_unchanged_sessions_are_not_recomputed(tmp_path: Path, monkeypatch):
+    """Rebuilding skips indexed sessions, and output builds keep the same index"""
+    index = tmp_path / TIMELINE_NAME
+    build_timeline(DATA_ROOT, index, ["0-1"])
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("session recomputed")
+
+    with monkeypatch.context() as m:
+        m.setattr(timeline_module, "compute_session", fail)
+        build_timeline(DATA_ROOT, index, ["0-1"])
+    generate_all_outputs("0-1", tmp_path / "docs")
+    built = (tmp_path / "docs" / TIMELINE_NAME).read_bytes()
+    assert built == index.read_bytes()
+    generate_all_outputs("0-1", tmp_path / "docs")
+    assert (tmp_path / "docs" / TIMELINE_NAME).read_bytes() == built
@@ -5,27 +5,26 @@ from __future__ import annotations
 from pathlib import Path
 
 from audit.issues import AuditIssue
-from config.role_catalog import ROLE_DEFINITIONS, RoleDefinition, get_role_definition
+from config.role_catalog import ROLE_DEFINITIONS
+from config.role_table import BASE_ROLE_TABLE, CompiledRole, RoleTable
 from config.stipend_tiers import STIPEND_TIERS
 from data.session_loader import LoadedSession, load_session
-from models.core import CommitteeRoleType, Member
+from instrumentation import timed
+from models.core import Member
 
 
-def _validate_member_raw_roles(member: Member, session_id: str) -> list[AuditIssue]:
+def _validate_member_raw_roles(
+    member: Member, session_id: str, table: RoleTable = BASE_ROLE_TABLE
+) -> list[AuditIssue]:
     """Check per-member invariants on the raw role data"""
     issues: list[AuditIssue] = []
-    role_defs: list[RoleDefinition] = []
-    for ra in member.roles:
-        if ra.session_id != session_id:
-            continue
-        try:
-            role_defs.append(get_role_definition(ra.role_code))
-        except KeyError:
-            continue
-    chair_roles = [
-        rd for rd in role_defs if rd.committee_role_type == CommitteeRoleType.CHAIR
+    roles: list[CompiledRole] = [
+        table.get(ra.role_code)
+        for ra in member.roles
+        if ra.session_id == session_id and ra.role_code in table
     ]
-    stipend_roles = [rd for rd in role_defs if rd.stipend_tier_id is not None]
+    chair_roles = [role for role in roles if role.is_chair]
+    stipend_roles = [role for role in roles if role.tier_id is not None]
     if len(chair_roles) > 1:
         issues.append(
             AuditIssue.warning(
@@ -37,7 +36,7 @@ def _validate_member_raw_roles(member: Member, session_id: str) -> list[AuditIss
                 ),
                 member_id=member.member_id,
                 session_id=session_id,
-                chair_role_codes=[rd.code for rd in chair_roles],
+                chair_role_codes=[role.role_code for role in chair_roles],
             )
         )
     if len(stipend_roles) > 2:
@@ -51,7 +50,7 @@ def _validate_member_raw_roles(member: Member, session_id: str) -> list[AuditIss
                 ),
                 member_id=member.member_id,
                 session_id=session_id,
-                stipend_role_codes=[rd.code for rd in stipend_roles],
+                stipend_role_codes=[role.role_code for role in stipend_roles],
             )
         )
     if member.distance_miles_from_state_house is None:
@@ -85,6 +84,7 @@ def _validate_member_raw_roles(member: Member, session_id: str) -> list[AuditIss
     return issues
 
 
+@timed("validate.role_catalog")
 def validate_role_catalog() -> list[AuditIssue]:
     """Validates the role catalog"""
     issues: list[AuditIssue] = []
@@ -117,6 +117,7 @@ def validate_role_catalog() -> list[AuditIssue]:
     return issues
 
 
+@timed("validate.session_data")
 def validate_session_data(loaded: LoadedSession) -> list[AuditIssue]:
     """Validates a session at the data level"""
     issues: list[AuditIssue] = []
@@ -137,6 +138,7 @@ def validate_session_data(loaded: LoadedSession) -> list[AuditIssue]:
     return issues
 
 
+@timed("validate.distance_margins")
 def validate_distance_margins(loaded: LoadedSession) -> list[AuditIssue]:
     """Checks distance from capitol"""
     issues: list[AuditIssue] = []